@@ -0,0 +1,104 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+import asyncio
+import contextvars
+import functools
+
+from com.maxmin.aws.ec2.dao.image import Image
+from com.maxmin.aws.ec2.dao.instance import Instance
+from com.maxmin.aws.ec2.dao.internet_gateway import InternetGateway
+from com.maxmin.aws.ec2.dao.route_table import RouteTable
+from com.maxmin.aws.ec2.dao.security_group import SecurityGroup
+from com.maxmin.aws.ec2.dao.ssh import Keypair
+from com.maxmin.aws.ec2.dao.subnet import Subnet
+from com.maxmin.aws.ec2.dao.vpc import Vpc
+from com.maxmin.aws.route53.dao.change_batch import ChangeBatch
+from com.maxmin.aws.route53.dao.hosted_zone import HostedZone
+from com.maxmin.aws.route53.dao.record import Record
+
+
+class AsyncDao(object):
+    """
+    Async view of a DAO object: its methods are coroutines that run the DAO
+    method on the default executor of the event loop, the other attributes
+    are the ones of the DAO.
+    The AWS clients are thread safe and shared, so many calls can be in
+    flight from a single event loop.
+    """
+
+    def __init__(self, dao):
+        self.dao = dao
+
+    def __getattr__(self, name):
+        attribute = getattr(self.dao, name)
+
+        if not callable(attribute):
+            return attribute
+
+        @functools.wraps(attribute)
+        async def method(*args, **kwargs):
+            return await asyncio.get_running_loop().run_in_executor(
+                None,
+                contextvars.copy_context().run,
+                functools.partial(attribute, *args, **kwargs),
+            )
+
+        return method
+
+
+class AsyncVpc(AsyncDao):
+    def __init__(self, name: str):
+        super().__init__(Vpc(name))
+
+
+class AsyncSubnet(AsyncDao):
+    def __init__(self, name: str):
+        super().__init__(Subnet(name))
+
+
+class AsyncInternetGateway(AsyncDao):
+    def __init__(self, name: str):
+        super().__init__(InternetGateway(name))
+
+
+class AsyncRouteTable(AsyncDao):
+    def __init__(self, name: str):
+        super().__init__(RouteTable(name))
+
+
+class AsyncSecurityGroup(AsyncDao):
+    def __init__(self, name: str):
+        super().__init__(SecurityGroup(name))
+
+
+class AsyncKeypair(AsyncDao):
+    def __init__(self, name: str):
+        super().__init__(Keypair(name))
+
+
+class AsyncImage(AsyncDao):
+    def __init__(self, name: str):
+        super().__init__(Image(name))
+
+
+class AsyncInstance(AsyncDao):
+    def __init__(self, tags: list):
+        super().__init__(Instance(tags))
+
+
+class AsyncHostedZone(AsyncDao):
+    def __init__(self, name: str):
+        super().__init__(HostedZone(name))
+
+
+class AsyncRecord(AsyncDao):
+    def __init__(self, dns_name: str, hosted_zone_id: str):
+        super().__init__(Record(dns_name, hosted_zone_id))
+
+
+class AsyncChangeBatch(AsyncDao):
+    def __init__(self, hosted_zone_id: str):
+        super().__init__(ChangeBatch(hosted_zone_id))
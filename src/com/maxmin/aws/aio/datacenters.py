@@ -0,0 +1,140 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+
+Creates or deletes several datacenters concurrently from one event loop.
+"""
+import argparse
+import atexit
+import asyncio
+import contextvars
+
+from com.maxmin.aws.client import ClientRegistry
+from com.maxmin.aws.configuration import ApplicationConfig
+from com.maxmin.aws.constants import ClientConstants
+from com.maxmin.aws.logs import Logger
+from com.maxmin.aws.metrics import log_run_report
+from com.maxmin.aws.shutdown import build_shutdown_graph
+from com.maxmin.aws.startup import (
+    DEFAULT_MAX_PARALLEL,
+    build_startup_graph,
+    load_inventory,
+)
+from com.maxmin.aws.tracing import Tracer
+
+STARTUP = "startup"
+SHUTDOWN = "shutdown"
+
+
+async def run_datacenter(
+    action: str,
+    application_config: ApplicationConfig,
+    semaphore: asyncio.Semaphore,
+) -> dict:
+    """
+    Creates or deletes a datacenter with clients of its region, its tasks
+    share the semaphore with the ones of the other datacenters of the
+    region.
+    """
+    loop = asyncio.get_running_loop()
+
+    with ClientRegistry.region_scope(
+        application_config.vpc.region
+    ), Logger.context(datacenter=application_config.vpc.name):
+        async with semaphore:
+            await loop.run_in_executor(
+                None,
+                contextvars.copy_context().run,
+                load_inventory,
+                application_config,
+            )
+
+        if action == STARTUP:
+            graph = build_startup_graph(application_config)
+        else:
+            graph = build_shutdown_graph(application_config)
+
+        return await graph.run_async(semaphore=semaphore)
+
+
+async def run_datacenters(
+    action: str,
+    application_configs: list,
+    max_parallel: int = DEFAULT_MAX_PARALLEL,
+    region_limits: dict = None,
+) -> list:
+    """
+    Creates or deletes the datacenters concurrently, each one in its region.
+    At most max_parallel tasks run at the same time in a region, unless a
+    different limit is given for it in region_limits.
+    Returns the results of each datacenter, or the error it raised.
+    """
+    if region_limits is None:
+        region_limits = {}
+
+    semaphores = {}
+
+    for application_config in application_configs:
+        region = application_config.vpc.region
+
+        if region not in semaphores:
+            semaphores[region] = asyncio.Semaphore(
+                region_limits.get(region, max_parallel)
+            )
+
+    return await asyncio.gather(
+        *(
+            run_datacenter(
+                action,
+                application_config,
+                semaphores.get(application_config.vpc.region),
+            )
+            for application_config in application_configs
+        ),
+        return_exceptions=True,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Creates or deletes several datacenters."
+    )
+    parser.add_argument("action", choices=[STARTUP, SHUTDOWN])
+    parser.add_argument("config_files", nargs="+")
+    parser.add_argument(
+        "--max-parallel",
+        type=int,
+        default=DEFAULT_MAX_PARALLEL,
+        help="maximum number of resources processed at the same time in a "
+        "region",
+    )
+    parser.add_argument(
+        "--trace", help="file where the spans of the run are written"
+    )
+    arguments = parser.parse_args()
+
+    if arguments.trace is not None:
+        Tracer.start()
+        # the trace is written also if the run fails.
+        atexit.register(Tracer.export, arguments.trace)
+
+    results = asyncio.run(
+        run_datacenters(
+            arguments.action,
+            [
+                ApplicationConfig(config_file)
+                for config_file in arguments.config_files
+            ],
+            arguments.max_parallel,
+            ClientConstants().region_limits,
+        )
+    )
+
+    for config_file, result in zip(arguments.config_files, results):
+        if isinstance(result, BaseException):
+            Logger.error(f"Datacenter {config_file} failed: {result}")
+        else:
+            Logger.info(f"Datacenter {config_file} done!")
+
+    log_run_report()
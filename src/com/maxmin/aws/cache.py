@@ -0,0 +1,205 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+import functools
+import threading
+import time
+from collections import OrderedDict
+
+from com.maxmin.aws.constants import CacheConstants
+
+
+class LoadCache(object):
+    """
+    Cache of the responses of the DAO describe calls, keyed by resource
+    type, region and name.
+    """
+
+    def get(self, key: tuple) -> tuple:
+        """
+        Returns a (found, response) tuple.
+        """
+        return False, None
+
+    def version(self, key: tuple) -> int:
+        """
+        Returns the version of the key, it changes each time the key is
+        invalidated.
+        """
+        return 0
+
+    def put(self, key: tuple, response: list, version: int) -> None:
+        """
+        Stores the response, unless the key has been invalidated since the
+        version was read.
+        """
+        ...
+
+    def invalidate(self, key: tuple) -> None:
+        ...
+
+    def clear(self) -> None:
+        ...
+
+
+class NullCache(LoadCache):
+    """
+    Cache that never stores anything, every load calls AWS.
+    """
+
+    ...
+
+
+class TtlLruCache(LoadCache):
+    """
+    Cache with a time to live per resource type, the least recently used
+    entries are evicted when the cache is full.
+    """
+
+    def __init__(self, ttls: dict, max_size: int, default_ttl: int = 60):
+        self.ttls = ttls
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._versions = {}
+
+    def get(self, key: tuple) -> tuple:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or entry[0] < time.monotonic():
+                self._entries.pop(key, None)
+                self.misses += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+            return True, entry[1]
+
+    def version(self, key: tuple) -> int:
+        with self._lock:
+            return self._versions.get(key, 0)
+
+    def put(self, key: tuple, response: list, version: int) -> None:
+        with self._lock:
+            if self._versions.get(key, 0) != version:
+                return
+
+            ttl = self.ttls.get(key[0], self.default_ttl)
+            self._entries[key] = (time.monotonic() + ttl, list(response))
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: tuple) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            self._versions[key] = self._versions.get(key, 0) + 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+class DaoCache(object):
+    """
+    Holds the cache used by the DAO objects, by default it's built from the
+    cache.ini file on first use.
+    """
+
+    _lock = threading.Lock()
+    _cache = None
+
+    @classmethod
+    def get(cls) -> LoadCache:
+        with cls._lock:
+            if cls._cache is None:
+                cache_constants = CacheConstants()
+
+                if cache_constants.enabled is True:
+                    cls._cache = TtlLruCache(
+                        cache_constants.ttls, cache_constants.max_size
+                    )
+                else:
+                    cls._cache = NullCache()
+
+            return cls._cache
+
+    @classmethod
+    def install(cls, cache: LoadCache) -> None:
+        with cls._lock:
+            cls._cache = cache
+
+    @classmethod
+    def uninstall(cls) -> None:
+        with cls._lock:
+            cls._cache = None
+
+    @staticmethod
+    def key(dao, resource_type: str) -> tuple:
+        client = dao.ec2 if hasattr(dao, "ec2") else dao.route53
+
+        return resource_type, client.meta.region_name, dao.name
+
+
+def cached_load(resource_type: str):
+    """
+    Decorates the describe method of a DAO, its response is served from the
+    cache if present. A describe method that fails isn't cached, it must
+    raise rather than return an empty response.
+    """
+
+    def decorator(describe):
+        @functools.wraps(describe)
+        def wrapper(self):
+            cache = DaoCache.get()
+            key = DaoCache.key(self, resource_type)
+            found, response = cache.get(key)
+
+            if found is True:
+                return list(response)
+
+            version = cache.version(key)
+            response = describe(self)
+            cache.put(key, response, version)
+
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def invalidates(resource_type: str):
+    """
+    Decorates a method that changes the resource, the cached response is
+    dropped when the method returns or fails.
+    """
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                DaoCache.get().invalidate(DaoCache.key(self, resource_type))
+
+        return wrapper
+
+    return decorator
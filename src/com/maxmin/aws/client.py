@@ -3,15 +3,164 @@ Created on Mar 20, 2023
 
 @author: vagrant
 """
+import contextlib
+import contextvars
+import threading
 
 import boto3
+from botocore.config import Config
+
+from com.maxmin.aws.constants import ClientConstants
+from com.maxmin.aws.metrics import ApiMetrics
+from com.maxmin.aws.throttle import RateLimiter
+
+
+class ClientRegistry(object):
+    """
+    Process-wide registry of boto3 sessions and clients.
+    Clients are created once per service, region and profile and shared by
+    all the DAO objects, so the botocore service model, the credentials chain
+    and the HTTP connection pool are loaded only once.
+    """
+
+    # region of the clients created without an explicit region.
+    _region = contextvars.ContextVar("region", default=None)
+
+    _lock = threading.Lock()
+    _config = None
+    _rate_limits = {}
+    _sessions = {}
+    _clients = {}
+    _clients_created = 0
+    _clients_reused = 0
+
+    @classmethod
+    def get_client(cls, service: str, region: str = None, profile: str = None):
+        """
+        Returns the shared client for the service, region and profile,
+        creating it on first use.
+        If the region is not given, the one of the current region scope is
+        used, boto3 picks the default one outside a scope.
+        """
+        if region is None:
+            region = cls._region.get()
+
+        key = (service, region, profile)
+
+        with cls._lock:
+            client = cls._clients.get(key)
+
+            if client is not None:
+                cls._clients_reused += 1
+                return client
+
+            session = cls._sessions.get((region, profile))
+
+            if session is None:
+                session = boto3.session.Session(
+                    region_name=region, profile_name=profile
+                )
+                cls._sessions[(region, profile)] = session
+
+            client = session.client(service, config=cls._client_config())
+            RateLimiter.attach(client, cls._rate_limits.get(service))
+            ApiMetrics.attach(client)
+
+            cls._clients[key] = client
+            cls._clients_created += 1
+
+            return client
+
+    @classmethod
+    @contextlib.contextmanager
+    def region_scope(cls, region: str):
+        """
+        Makes the DAO objects created in the current context use clients of
+        the region.
+        The scope is seen by the task graphs, which run their tasks in a copy
+        of the context that starts them.
+        """
+        token = cls._region.set(region)
+
+        try:
+            yield
+        finally:
+            cls._region.reset(token)
+
+    @classmethod
+    def current_region(cls) -> str:
+        return cls._region.get()
+
+    @classmethod
+    def stats(cls) -> dict:
+        """
+        Returns how many clients have been created and reused and how many
+        HTTP connections they have opened so far.
+        """
+        with cls._lock:
+            connections = 0
+
+            for client in cls._clients.values():
+                connections += cls._count_connections(client)
+
+            return {
+                "clients_created": cls._clients_created,
+                "clients_reused": cls._clients_reused,
+                "connections_opened": connections,
+            }
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Drops all the sessions and clients, the next get_client call creates
+        them again.
+        """
+        with cls._lock:
+            cls._config = None
+            cls._rate_limits = {}
+            cls._sessions = {}
+            cls._clients = {}
+            cls._clients_created = 0
+            cls._clients_reused = 0
+
+        RateLimiter.clear()
+
+    @classmethod
+    def _client_config(cls) -> Config:
+        if cls._config is None:
+            client_constants = ClientConstants()
+
+            cls._config = Config(
+                max_pool_connections=client_constants.max_pool_connections,
+                tcp_keepalive=client_constants.tcp_keepalive,
+                connect_timeout=client_constants.connect_timeout,
+                read_timeout=client_constants.read_timeout,
+                retries={
+                    "mode": client_constants.retry_mode,
+                    "max_attempts": client_constants.max_attempts,
+                },
+            )
+            cls._rate_limits = client_constants.rate_limits
+
+        return cls._config
+
+    @staticmethod
+    def _count_connections(client) -> int:
+        # urllib3 keeps a count of the connections opened by each pool.
+        try:
+            pools = client._endpoint.http_session._manager.pools
+            return sum(
+                pools[pool_key].num_connections for pool_key in pools.keys()
+            )
+        except AttributeError:
+            return 0
 
 
 class Ec2(object):
     def __init__(self):
-        self.ec2 = boto3.client("ec2")
+        self.ec2 = ClientRegistry.get_client("ec2")
 
 
 class Route53(object):
     def __init__(self):
-        self.route53 = boto3.client("route53")
+        self.route53 = ClientRegistry.get_client("route53")
@@ -3,193 +3,296 @@ Created on Mar 13, 2023
 
 @author: vagrant
 """
-import json
+import dataclasses
+import sys
 from json.decoder import JSONDecodeError
-from pathlib import Path
 
 from com.maxmin.aws.exception import AwsException
+from com.maxmin.aws.schema import ConfigValidator
+from com.maxmin.aws.stream import JsonStream
 
 
 class ApplicationConfig(object):
     """
-    Loads a Json file into a configuration object.
+    Loads a Json file into a configuration object, the file is validated
+    before it is loaded.
+    The file is streamed, the entries of the subnets, the security groups
+    and the instances are validated and converted one at a time, as they are
+    read, so the memory needed doesn't grow with the parsed document.
     """
 
-    def __init__(self, config_file):
+    # errors reported when the file is not valid.
+    MAX_ERRORS = 10
+
+    def __init__(self, config_file, chunk_size: int = 65536):
         self.vpc = None
-        self.subnets = []
+        self.subnets = ()
         self.internet_gateway = None
-        self.security_groups = []
-        self.instances = []
+        self.route_table = None
+        self.security_groups = ()
+        self.instances = ()
+
+        validator = ConfigValidator()
+        entries = {section: [] for section in ConfigValidator.SECTIONS}
 
         try:
-            config_file_path = Path(config_file)
-            content = config_file_path.read_text("UTF8")
+            with open(config_file, "r", encoding="UTF8") as file:
+                stream = JsonStream(file, chunk_size)
+                document = self._read(stream, validator, entries)
+                stream.end()
         except FileNotFoundError:
             raise AwsException("Error reading configuration file!")
-
-        try:
-            self._datacenter = json.loads(content).get("Datacenter")
         except JSONDecodeError:
             raise AwsException("Invalid Json file!")
 
+        validator.check_document(document)
+        errors = validator.finish()
+
+        if len(errors) > 0:
+            message = "; ".join(errors[: self.MAX_ERRORS])
+
+            if len(errors) > self.MAX_ERRORS:
+                message += f" and {len(errors) - self.MAX_ERRORS} more"
+
+            raise AwsException(f"Invalid configuration file: {message}")
+
+        datacenter = document.get("Datacenter")
+
         self.vpc = VpcConfig(
-            self._datacenter.get("Name"),
-            self._datacenter.get("Description"),
-            self._datacenter.get("Cidr"),
-            self._datacenter.get("DnsName"),
-            self._datacenter.get("Gateway"),
-            self._datacenter.get("Region"),
-            self._datacenter.get("RouteTable"),
+            datacenter.get("Name"),
+            datacenter.get("Description"),
+            datacenter.get("Cidr"),
+            datacenter.get("DnsName"),
+            datacenter.get("Gateway"),
+            datacenter.get("Region"),
+            datacenter.get("RouteTable"),
+        )
+        self.subnets = tuple(entries.get("Subnets"))
+        self.internet_gateway = _intern(datacenter.get("InternetGateway"))
+        self.route_table = _intern(datacenter.get("RouteTable"))
+        self.security_groups = tuple(entries.get("SecurityGroups"))
+        self.instances = tuple(entries.get("Instances"))
+
+    def _read(self, stream, validator, entries: dict):
+        """
+        Reads the document, the entries of the sections are validated,
+        converted and added to entries, they are replaced in the document
+        by empty lists.
+        """
+        if stream.peek() != "{":
+            return stream.value()
+
+        document = {}
+
+        for key in stream.members():
+            if key != "Datacenter" or stream.peek() != "{":
+                document[key] = stream.value()
+                continue
+
+            datacenter = {}
+
+            for name in stream.members():
+                if name not in entries or stream.peek() != "[":
+                    datacenter[name] = stream.value()
+                    continue
+
+                datacenter[name] = []
+                converter = self.CONVERTERS.get(name)
+
+                for index, entry in enumerate(stream.items()):
+                    if validator.check_entry(name, index, entry) is True:
+                        entries.get(name).append(converter(entry))
+
+            document[key] = datacenter
+
+        return document
+
+    @staticmethod
+    def _subnet_config(subnet: dict):
+        return SubnetConfig(
+            subnet.get("Name"),
+            subnet.get("Description"),
+            subnet.get("Az"),
+            subnet.get("Cidr"),
         )
 
-        for subnet in self._datacenter.get("Subnets"):
-            self.subnets.append(
-                SubnetConfig(
-                    subnet.get("Name"),
-                    subnet.get("Description"),
-                    subnet.get("Az"),
-                    subnet.get("Cidr"),
-                )
-            )
+    @staticmethod
+    def _security_group_config(security_group: dict):
+        return SecurityGroupConfig(
+            security_group.get("Name"),
+            security_group.get("Description"),
+            tuple(
+                ApplicationConfig._rule_config(rule)
+                for rule in security_group.get("Rules")
+            ),
+        )
 
-        self.internet_gateway = self._datacenter.get("InternetGateway")
-        self.route_table = self._datacenter.get("RouteTable")
+    @staticmethod
+    def _instance_config(instance: dict):
+        return InstanceConfig(
+            instance.get("UserName"),
+            instance.get("UserPassword"),
+            instance.get("PrivateIp"),
+            instance.get("DnsName"),
+            instance.get("Hostname"),
+            instance.get("SecurityGroup"),
+            instance.get("Subnet"),
+            instance.get("Keypair"),
+            instance.get("ParentImage"),
+            instance.get("TargetImage"),
+            instance.get("Tags"),
+        )
 
-        for security_group in self._datacenter.get("SecurityGroups"):
-            group_config = SecurityGroupConfig(
-                security_group.get("Name"),
-                security_group.get("Description"),
+    @staticmethod
+    def _rule_config(rule: dict):
+        if "SgpId" in rule:
+            return SgpRuleConfig(
+                rule.get("FromPort"),
+                rule.get("ToPort"),
+                rule.get("Protocol"),
+                rule.get("SgpId"),
+                rule.get("Description"),
             )
 
-            self.security_groups.append(group_config)
-
-            rules = security_group.get("Rules")
-
-            for rule in rules:
-                if "SgpId" in rule:
-                    rule_config = SgpRuleConfig(
-                        rule.get("FromPort"),
-                        rule.get("ToPort"),
-                        rule.get("Protocol"),
-                        rule.get("SgpId"),
-                        rule.get("Description"),
-                    )
-                else:
-                    rule_config = CidrRuleConfig(
-                        rule.get("FromPort"),
-                        rule.get("ToPort"),
-                        rule.get("Protocol"),
-                        rule.get("Cidr"),
-                        rule.get("Description"),
-                    )
-
-                group_config.rules.append(rule_config)
-
-        for instance in self._datacenter.get("Instances"):
-            self.instances.append(
-                InstanceConfig(
-                    instance.get("UserName"),
-                    instance.get("UserPassword"),
-                    instance.get("PrivateIp"),
-                    instance.get("DnsName"),
-                    instance.get("Hostname"),
-                    instance.get("SecurityGroup"),
-                    instance.get("Subnet"),
-                    instance.get("Keypair"),
-                    instance.get("ParentImage"),
-                    instance.get("TargetImage"),
-                    instance.get("Tags"),
-                )
-            )
+        return CidrRuleConfig(
+            rule.get("FromPort"),
+            rule.get("ToPort"),
+            rule.get("Protocol"),
+            rule.get("Cidr"),
+            rule.get("Description"),
+        )
+
+    # converters of the entries of the sections into config objects.
+    CONVERTERS = {
+        "Subnets": _subnet_config,
+        "SecurityGroups": _security_group_config,
+        "Instances": _instance_config,
+    }
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
 
 
-class VpcConfig(object):
-    def __init__(
-        self,
-        name,
-        description,
-        cidr,
-        dns_name,
-        gateway,
-        region,
-        route_table,
-    ):
-        self.name = name
-        self.description = description
-        self.cidr = cidr
-        self.dns_name = dns_name
-        self.gateway = gateway
-        self.region = region
-        self.route_table = route_table
-
-
-class SubnetConfig(object):
-    def __init__(self, name, description, az, cidr):
-        self.name = name
-        self.description = description
-        self.az = az
-        self.cidr = cidr
-
-
-class InternetGatewayConfig(object):
-    def __init__(self, name):
-        self.name = name
-
-
-class RouteTableConfig(object):
-    def __init__(self, name):
-        self.name = name
-
-
-class SecurityGroupConfig(object):
-    def __init__(self, name, description):
-        self.name = name
-        self.description = description
-        self.rules = []
-
-
-class CidrRuleConfig(object):
-    def __init__(self, from_port, to_port, protocol, cidr, description):
-        self.from_port = from_port
-        self.to_port = to_port
-        self.protocol = protocol
-        self.cidr = cidr
-        self.description = description
-
-
-class SgpRuleConfig(object):
-    def __init__(self, from_port, to_port, protocol, sgp_id, description):
-        self.from_port = from_port
-        self.to_port = to_port
-        self.protocol = protocol
-        self.sgp_id = sgp_id
-        self.description = description
-
-
-class InstanceConfig(object):
-    def __init__(
-        self,
-        username,
-        password,
-        private_ip,
-        dns_name,
-        hostname,
-        security_group,
-        subnet,
-        keypair,
-        parent_img,
-        target_img,
-        tags,
-    ):
-        self.username = username
-        self.password = password
-        self.private_ip = private_ip
-        self.dns_name = dns_name
-        self.hostname = hostname
-        self.security_group = security_group
-        self.subnet = subnet
-        self.keypair = keypair
-        self.parent_img = parent_img
-        self.target_img = target_img
-        self.tags = tags
+class Config(object):
+    """
+    Base of the configuration objects: immutable, slotted and hashable, so
+    they can be used as keys, with the strings interned, so the names shared
+    by many objects, subnets, security groups, tag keys, are stored once.
+    """
+
+    __slots__ = ()
+
+    def __post_init__(self):
+        for field in dataclasses.fields(self):
+            value = getattr(self, field.name)
+
+            if isinstance(value, str):
+                object.__setattr__(self, field.name, sys.intern(value))
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class VpcConfig(Config):
+    name: str
+    description: str
+    cidr: str
+    dns_name: str
+    gateway: str
+    region: str
+    route_table: str
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class SubnetConfig(Config):
+    name: str
+    description: str
+    az: str
+    cidr: str
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class InternetGatewayConfig(Config):
+    name: str
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class RouteTableConfig(Config):
+    name: str
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class SecurityGroupConfig(Config):
+    name: str
+    description: str
+    # the rule configs, a tuple.
+    rules: tuple = ()
+
+    def __post_init__(self):
+        Config.__post_init__(self)
+        object.__setattr__(self, "rules", tuple(self.rules))
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class CidrRuleConfig(Config):
+    from_port: int
+    to_port: int
+    protocol: str
+    cidr: str
+    description: str
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class SgpRuleConfig(Config):
+    from_port: int
+    to_port: int
+    protocol: str
+    sgp_id: str
+    description: str
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class InstanceConfig(Config):
+    username: str
+    # kept out of the repr, so of the logs and the tracebacks.
+    password: str = dataclasses.field(repr=False)
+    private_ip: str
+    dns_name: str
+    hostname: str
+    security_group: str
+    subnet: str
+    keypair: str
+    parent_img: str
+    target_img: str
+    # (key, value) tuples, {"Key": key, "Value": value} objects are
+    # converted.
+    tags: tuple
+
+    def __post_init__(self):
+        Config.__post_init__(self)
+        object.__setattr__(
+            self,
+            "tags",
+            tuple(
+                (_intern(tag.get("Key")), _intern(tag.get("Value")))
+                if isinstance(tag, dict)
+                else (_intern(tag[0]), _intern(tag[1]))
+                for tag in self.tags
+            ),
+        )
+
+    @property
+    def name(self) -> str:
+        """
+        Returns the value of the Name tag.
+        """
+        for key, value in self.tags:
+            if key == "Name":
+                return value
+
+        raise AwsException("Wrong tag Name!")
+
+    def aws_tags(self) -> list:
+        """
+        Returns the tags as a list of {"Key": xxxx, "Value": yyyy} objects.
+        """
+        return [{"Key": key, "Value": value} for key, value in self.tags]
@@ -32,6 +32,99 @@ class Ec2Constants(ApplicationConstants):
         self.tenancy = instance["tenancy"]
 
 
+class ClientConstants(ApplicationConstants):
+    """
+    Loads the client.ini file
+    """
+
+    def __init__(self):
+        super().__init__(ProjectFiles.CLIENT_CONSTANTS_FILE)
+
+        client = self.config["CLIENT"]
+
+        self.max_pool_connections = int(client["max_pool_connections"])
+        self.tcp_keepalive = client.getboolean("tcp_keepalive")
+        self.connect_timeout = int(client["connect_timeout"])
+        self.read_timeout = int(client["read_timeout"])
+        self.retry_mode = client["retry_mode"]
+        self.max_attempts = int(client["max_attempts"])
+        self.rate_limits = {}
+        self.region_limits = {}
+
+        if self.config.has_section("RATE_LIMITS"):
+            self.rate_limits = {
+                service: float(rate)
+                for service, rate in self.config["RATE_LIMITS"].items()
+            }
+
+        if self.config.has_section("REGION_LIMITS"):
+            self.region_limits = {
+                region: int(limit)
+                for region, limit in self.config["REGION_LIMITS"].items()
+            }
+
+
+class CacheConstants(ApplicationConstants):
+    """
+    Loads the cache.ini file
+    """
+
+    def __init__(self):
+        super().__init__(ProjectFiles.CACHE_CONSTANTS_FILE)
+
+        cache = self.config["CACHE"]
+
+        self.enabled = cache.getboolean("enabled")
+        self.max_size = int(cache["max_size"])
+        self.ttls = {
+            resource_type: int(ttl)
+            for resource_type, ttl in self.config["TTL"].items()
+        }
+
+
+class WaiterConstants(ApplicationConstants):
+    """
+    Loads the waiter settings of an ini file, the WAITER section has the
+    defaults, a WAITER.<waiter name> section overrides them for a waiter.
+    """
+
+    def __init__(self, ini_file):
+        super().__init__(ini_file)
+
+        self.defaults = self._settings("WAITER", {})
+        self.waiters = {
+            section.split(".", 1)[1]: self._settings(section, self.defaults)
+            for section in self.config.sections()
+            if section.startswith("WAITER.")
+        }
+
+    def settings(self, waiter_name: str) -> dict:
+        return self.waiters.get(waiter_name, self.defaults)
+
+    def _settings(self, section: str, defaults: dict) -> dict:
+        settings = dict(defaults)
+
+        if self.config.has_section(section):
+            for key, value in self.config[section].items():
+                settings[key] = float(value)
+
+        return settings
+
+
+class LoggingConstants(ApplicationConstants):
+    """
+    Loads the logging.ini file
+    """
+
+    def __init__(self):
+        super().__init__(ProjectFiles.LOGGING_CONSTANTS_FILE)
+
+        logging = self.config["LOGGING"]
+
+        self.level = logging["level"]
+        self.output_format = logging["format"]
+
+
 class Route53Constants(ApplicationConstants):
     """
     Loads the route53.ini file
@@ -50,11 +143,16 @@ class ProjectDirectories:
     ACCESS_DIR = f"{PROJECT_DIR}/access"
     CONFIG_DIR = f"{PROJECT_DIR}/config"
     TEMPLATES_DIR = f"{PROJECT_DIR}/templates"
+    STATE_DIR = f"{PROJECT_DIR}/state"
 
 
 class ProjectFiles:
     EC2_CONSTANTS_FILE = f"{ProjectDirectories.CONFIG_DIR}/ec2.ini"
     ROUTE53_CONSTANTS_FILE = f"{ProjectDirectories.CONFIG_DIR}/route53.ini"
+    CLIENT_CONSTANTS_FILE = f"{ProjectDirectories.CONFIG_DIR}/client.ini"
+    CACHE_CONSTANTS_FILE = f"{ProjectDirectories.CONFIG_DIR}/cache.ini"
+    LOGGING_CONSTANTS_FILE = f"{ProjectDirectories.CONFIG_DIR}/logging.ini"
+    PASSWORD_CACHE_FILE = f"{ProjectDirectories.ACCESS_DIR}/passwords.json"
     DEFAULT_CONFIG_FILE = (
         f"{ProjectDirectories.CONFIG_DIR}/cms_datacenter.json"
     )
@@ -3,9 +3,13 @@ Created on Mar 27, 2023
 
 @author: vagrant
 """
+from com.maxmin.aws.cache import cached_load, invalidates
 from com.maxmin.aws.client import Ec2
+from com.maxmin.aws.ec2.dao.inventory import Inventory
 from com.maxmin.aws.exception import AwsException
 from com.maxmin.aws.logs import Logger
+from com.maxmin.aws.tracing import traced
+from com.maxmin.aws.waiter import AdaptiveWaiter
 
 
 class Image(Ec2):
@@ -21,22 +25,14 @@ class Image(Ec2):
         self.description = None
         self.snapshot_ids = []
 
+    @traced()
     def load(self) -> bool:
         """
         Loads the image data, returns True if an image is found, False
         otherwise.
         """
 
-        response = self.ec2.describe_images(
-            Filters=[
-                {
-                    "Name": "name",
-                    "Values": [
-                        self.name,
-                    ],
-                },
-            ],
-        ).get("Images")
+        response = self._describe()
 
         if len(response) > 1:
             raise AwsException("Found more than 1 image!")
@@ -54,6 +50,26 @@ class Image(Ec2):
 
             return True
 
+    @cached_load("image")
+    def _describe(self) -> list:
+        response = Inventory.lookup(self.ec2, Inventory.IMAGES, self.name)
+
+        if response is None:
+            response = self.ec2.describe_images(
+                Filters=[
+                    {
+                        "Name": "name",
+                        "Values": [
+                            self.name,
+                        ],
+                    },
+                ],
+            ).get("Images")
+
+        return response
+
+    @traced()
+    @invalidates("image")
     def create(self, instance_id: str, description: str) -> None:
         """
         Creates an Amazon EBS-backed AMI from an Amazon EBS-backed instance that
@@ -82,10 +98,13 @@ class Image(Ec2):
         except Exception as e:
             Logger.error(str(e))
             raise AwsException("Error creating the image!")
+        finally:
+            Inventory.forget(self.ec2, Inventory.IMAGES, self.name)
 
-        waiter = self.ec2.get_waiter("image_available")
-        waiter.wait(ImageIds=[self.id])
+        AdaptiveWaiter(self.ec2, "image_available").wait(ImageIds=[self.id])
 
+    @traced()
+    @invalidates("image")
     def delete(self) -> None:
         """
         Deregisters the specified AMI.
@@ -104,6 +123,8 @@ class Image(Ec2):
         except Exception as e:
             Logger.error(str(e))
             raise AwsException("Error deleting the image!")
+        finally:
+            Inventory.forget(self.ec2, Inventory.IMAGES, self.name)
 
         try:
             for snapshot_id in self.snapshot_ids:
@@ -3,10 +3,21 @@ Created on Mar 26, 2023
 
 @author: vagrant
 """
+import time
+
+from botocore.exceptions import ClientError
+
 from com.maxmin.aws.client import Ec2
 from com.maxmin.aws.constants import Ec2Constants
+from com.maxmin.aws.ec2.dao.inventory import Inventory
 from com.maxmin.aws.exception import AwsException
 from com.maxmin.aws.logs import Logger
+from com.maxmin.aws.metrics import ApiMetrics
+from com.maxmin.aws.tracing import Tracer, traced
+from com.maxmin.aws.waiter import AdaptiveWaiter, WaiterConfig, WaiterStats
+
+# maximum number of instance ids in a describe_instance_status call.
+STATUS_PAGE_SIZE = 100
 
 
 class Instance(Ec2):
@@ -29,6 +40,7 @@ class Instance(Ec2):
         self.vpc_id = None
         self.tags = tags
 
+    @traced()
     def load(self) -> bool:
         """
         Loads the instance data, throws an error if more than 1 is found with the same Tag Name,
@@ -40,21 +52,26 @@ class Instance(Ec2):
         if len(tags) != 1:
             raise AwsException("Wrong tag Name!")
 
-        response = self.ec2.describe_instances(
-            Filters=[
-                {
-                    "Name": "tag-value",
-                    "Values": [tags[0].get("Value")],
-                },
-            ],
-        ).get("Reservations")
-
-        if len(response) > 1:
-            raise AwsException("Found more than 1 reservation!")
-        elif len(response) == 0:
-            return False
+        instances = Inventory.lookup(
+            self.ec2, Inventory.INSTANCES, tags[0].get("Value")
+        )
+
+        if instances is None:
+            response = self.ec2.describe_instances(
+                Filters=[
+                    {
+                        "Name": "tag-value",
+                        "Values": [tags[0].get("Value")],
+                    },
+                ],
+            ).get("Reservations")
+
+            if len(response) > 1:
+                raise AwsException("Found more than 1 reservation!")
+            elif len(response) == 0:
+                return False
 
-        instances = response[0].get("Instances")
+            instances = response[0].get("Instances")
 
         if len(instances) > 1:
             # do not allow more instance with the same tag Name.
@@ -79,18 +96,22 @@ class Instance(Ec2):
 
             return True
 
+    @traced()
     def create(
         self,
         image_id: str,
         security_group_id: str,
         subnet_id: str,
         private_ip: str,
-        user_data_b64: str,
+        user_data: bytes,
         tags: list,
+        wait: bool = True,
     ) -> None:
         """
-        Creates/runs an instance and waits until it's available.
+        Creates/runs an instance and waits until it's available, unless wait
+        is False.
         The instance is assigned a public IP address, not a static/elastic one.
+        The user data is base64 encoded by the client.
 
         tags: a list of {"Key": xxxx, "Value": yyyy} objects
         """
@@ -121,7 +142,7 @@ class Instance(Ec2):
                     Placement={
                         "Tenancy": ec2_constants.tenancy,
                     },
-                    UserData=user_data_b64,
+                    UserData=user_data,
                     NetworkInterfaces=[
                         {
                             "DeviceIndex": 0,
@@ -139,10 +160,15 @@ class Instance(Ec2):
         except Exception as e:
             Logger.error(str(e))
             raise AwsException("Error creating the instance!")
+        finally:
+            self._forget()
 
-        waiter = self.ec2.get_waiter("instance_status_ok")
-        waiter.wait(InstanceIds=[self.id])
+        if wait is True:
+            AdaptiveWaiter(self.ec2, "instance_status_ok").wait(
+                InstanceIds=[self.id]
+            )
 
+    @traced()
     def delete(self) -> None:
         """
         Terminates the instance and waits until successful.
@@ -162,9 +188,109 @@ class Instance(Ec2):
         except Exception as e:
             Logger.error(str(e))
             raise AwsException("Error deleting the instance!")
+        finally:
+            self._forget()
+
+        AdaptiveWaiter(self.ec2, "instance_terminated").wait(
+            InstanceIds=[self.id]
+        )
+
+    @staticmethod
+    def delete_all(instances: list) -> None:
+        """
+        Terminates the instances with a single call and waits until all of
+        them are terminated.
+        """
+
+        if len(instances) == 0:
+            return
+
+        instance_ids = [instance.id for instance in instances]
+        ec2 = instances[0].ec2
+
+        try:
+            ec2.terminate_instances(InstanceIds=instance_ids)
+        except Exception as e:
+            Logger.error(str(e))
+            raise AwsException("Error deleting the instances!")
+        finally:
+            for instance in instances:
+                instance._forget()
 
-        waiter = self.ec2.get_waiter("instance_terminated")
-        waiter.wait(InstanceIds=[self.id])
+        AdaptiveWaiter(ec2, "instance_terminated").wait(
+            InstanceIds=instance_ids
+        )
+
+    @staticmethod
+    def wait_status_ok(instances: list, config: WaiterConfig = None) -> None:
+        """
+        Waits until the status checks of all the instances are ok, polling
+        their status together in a single loop with growing delays.
+        The instances already ok are not polled again.
+        """
+
+        if len(instances) == 0:
+            return
+
+        pending_ids = [instance.id for instance in instances]
+        ec2 = instances[0].ec2
+
+        if config is None:
+            config = WaiterConfig.of("ec2", "instance_status_ok")
+
+        with ApiMetrics.waiting(), Tracer.span(
+            "wait instance_status_ok", "waiter", instances=len(pending_ids)
+        ):
+            start = time.monotonic()
+            attempt = 0
+
+            while True:
+                # the ready instances are removed while the pages are polled.
+                polled_ids = list(pending_ids)
+
+                for i in range(0, len(polled_ids), STATUS_PAGE_SIZE):
+                    page = polled_ids[i : i + STATUS_PAGE_SIZE]
+
+                    try:
+                        statuses = ec2.describe_instance_status(
+                            InstanceIds=page
+                        ).get("InstanceStatuses")
+                    except ClientError as e:
+                        if (
+                            e.response["Error"]["Code"]
+                            == "InvalidInstanceID.NotFound"
+                        ):
+                            # new instances may not be visible yet.
+                            Logger.warn(str(e))
+                            continue
+                        else:
+                            raise
+
+                    for status in statuses:
+                        if (
+                            status.get("InstanceStatus").get("Status") == "ok"
+                            and status.get("SystemStatus").get("Status")
+                            == "ok"
+                        ):
+                            pending_ids.remove(status.get("InstanceId"))
+                            WaiterStats.record(
+                                "instance_status_ok", time.monotonic() - start
+                            )
+
+                if len(pending_ids) == 0:
+                    return
+
+                delay = config.delay(attempt)
+
+                if time.monotonic() - start + delay > config.timeout:
+                    break
+
+                time.sleep(delay)
+                attempt += 1
+
+            raise AwsException(
+                f"Instances not ready: {', '.join(pending_ids)}!"
+            )
 
     def stop(self) -> None:
         """
@@ -179,6 +305,16 @@ class Instance(Ec2):
         except Exception as e:
             Logger.error(str(e))
             raise AwsException("Error stopping the instance!")
+        finally:
+            self._forget()
 
-        waiter = self.ec2.get_waiter("instance_stopped")
-        waiter.wait(InstanceIds=[self.id])
+        AdaptiveWaiter(self.ec2, "instance_stopped").wait(
+            InstanceIds=[self.id]
+        )
+
+    def _forget(self) -> None:
+        for tag in self.tags:
+            if tag.get("Key") == "Name":
+                Inventory.forget(
+                    self.ec2, Inventory.INSTANCES, tag.get("Value")
+                )
@@ -5,8 +5,11 @@ Created on Mar 20, 2023
 """
 
 from com.maxmin.aws.client import Ec2
+from com.maxmin.aws.ec2.dao.inventory import Inventory
 from com.maxmin.aws.exception import AwsException
 from com.maxmin.aws.logs import Logger
+from com.maxmin.aws.tracing import traced
+from com.maxmin.aws.waiter import AdaptiveWaiter
 
 
 class InternetGateway(Ec2):
@@ -21,6 +24,7 @@ class InternetGateway(Ec2):
         self.id = None
         self.vpc_id = None
 
+    @traced()
     def load(self) -> bool:
         """
         Loads the Internet gateway data, throws an error if more than 1 are
@@ -28,16 +32,21 @@ class InternetGateway(Ec2):
         found, False otherwise.
         """
 
-        response = self.ec2.describe_internet_gateways(
-            Filters=[
-                {
-                    "Name": "tag-value",
-                    "Values": [
-                        self.name,
-                    ],
-                },
-            ]
-        ).get("InternetGateways")
+        response = Inventory.lookup(
+            self.ec2, Inventory.INTERNET_GATEWAYS, self.name
+        )
+
+        if response is None:
+            response = self.ec2.describe_internet_gateways(
+                Filters=[
+                    {
+                        "Name": "tag-value",
+                        "Values": [
+                            self.name,
+                        ],
+                    },
+                ]
+            ).get("InternetGateways")
 
         if len(response) > 1:
             raise AwsException("Found more than 1 Internet gateway!")
@@ -64,6 +73,7 @@ class InternetGateway(Ec2):
 
         return True
 
+    @traced()
     def create(self) -> None:
         """
         Creates an Internet gateway and waits until it exists.
@@ -90,10 +100,14 @@ class InternetGateway(Ec2):
         except Exception as e:
             Logger.error(str(e))
             raise AwsException("Error creating the internet gateway!")
+        finally:
+            Inventory.forget(self.ec2, Inventory.INTERNET_GATEWAYS, self.name)
 
-        waiter = self.ec2.get_waiter("internet_gateway_exists")
-        waiter.wait(InternetGatewayIds=[self.id])
+        AdaptiveWaiter(self.ec2, "internet_gateway_exists").wait(
+            InternetGatewayIds=[self.id]
+        )
 
+    @traced()
     def delete(self) -> None:
         """
         Deletes the Internet gateway.
@@ -103,6 +117,8 @@ class InternetGateway(Ec2):
         except Exception as e:
             Logger.error(str(e))
             raise AwsException("Error deleting the Internet gateway!")
+        finally:
+            Inventory.forget(self.ec2, Inventory.INTERNET_GATEWAYS, self.name)
 
     def attach_to(self, vpc_id: str):
         """
@@ -118,6 +134,8 @@ class InternetGateway(Ec2):
             raise AwsException(
                 "Error attaching the Internet gateway to the vpc!"
             )
+        finally:
+            Inventory.forget(self.ec2, Inventory.INTERNET_GATEWAYS, self.name)
 
     def detach_from(self, vpc_id: str):
         """
@@ -134,21 +152,26 @@ class InternetGateway(Ec2):
             raise AwsException(
                 "Error detaching the Internet gateway to the vpc!"
             )
+        finally:
+            Inventory.forget(self.ec2, Inventory.INTERNET_GATEWAYS, self.name)
 
     def is_attached_to(self, vpc_id: str):
         """
         Checks if the gateway is attached to a vpc.
         """
 
-        attachments = (
-            self.ec2.describe_internet_gateways(
+        internet_gateway = Inventory.lookup_id(
+            self.ec2, Inventory.INTERNET_GATEWAYS, self.id
+        )
+
+        if internet_gateway is None:
+            internet_gateway = self.ec2.describe_internet_gateways(
                 InternetGatewayIds=[
                     self.id,
                 ]
-            )
-            .get("InternetGateways")[0]
-            .get("Attachments")
-        )
+            ).get("InternetGateways")[0]
+
+        attachments = internet_gateway.get("Attachments")
 
         for attachment in attachments:
             if attachment.get("State") == "available":
@@ -0,0 +1,303 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+import threading
+
+from com.maxmin.aws.client import Ec2
+from com.maxmin.aws.logs import Logger
+from com.maxmin.aws.tracing import traced
+
+
+class Inventory(Ec2):
+    """
+    Snapshot of the EC2 resources of a datacenter, fetched with one bulk
+    describe call per resource type and indexed by tag value and by id.
+    The DAO objects resolve their load from the active inventory of their
+    region, a name is resolved only if it was requested when the inventory
+    was refreshed and it has not been invalidated since.
+    """
+
+    VPCS = "Vpcs"
+    SUBNETS = "Subnets"
+    ROUTE_TABLES = "RouteTables"
+    INTERNET_GATEWAYS = "InternetGateways"
+    SECURITY_GROUPS = "SecurityGroups"
+    KEY_PAIRS = "KeyPairs"
+    IMAGES = "Images"
+    INSTANCES = "Instances"
+
+    # describe operation, name filter, id field and id filter of each
+    # resource type, key pair names are unique so they are not looked up by
+    # id.
+    RESOURCE_TYPES = {
+        VPCS: ("describe_vpcs", "tag-value", "VpcId", "vpc-id"),
+        SUBNETS: ("describe_subnets", "tag-value", "SubnetId", "subnet-id"),
+        ROUTE_TABLES: (
+            "describe_route_tables",
+            "tag-value",
+            "RouteTableId",
+            "route-table-id",
+        ),
+        INTERNET_GATEWAYS: (
+            "describe_internet_gateways",
+            "tag-value",
+            "InternetGatewayId",
+            "internet-gateway-id",
+        ),
+        SECURITY_GROUPS: (
+            "describe_security_groups",
+            "tag-value",
+            "GroupId",
+            "group-id",
+        ),
+        KEY_PAIRS: ("describe_key_pairs", "key-name", "KeyPairId", None),
+        IMAGES: ("describe_images", "name", "ImageId", "image-id"),
+        INSTANCES: (
+            "describe_instances",
+            "tag-value",
+            "InstanceId",
+            "instance-id",
+        ),
+    }
+
+    _active = {}
+    _active_lock = threading.Lock()
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+        self._names = {}
+        self._by_name = {}
+        self._by_id = {}
+
+    @traced()
+    def refresh(self, application_config) -> None:
+        """
+        Fetches all the resources named in the configuration.
+        """
+        for resource_type, names in self._config_names(
+            application_config
+        ).items():
+            if len(names) > 0:
+                self._fetch(
+                    resource_type,
+                    names,
+                    self.RESOURCE_TYPES.get(resource_type)[1],
+                    names,
+                )
+
+        Logger.debug("Inventory refreshed!")
+
+    @traced()
+    def refresh_by_ids(self, application_config, ids: dict) -> bool:
+        """
+        Fetches the resources named in the configuration by their ids, ids
+        is a dictionary of {name: id} dictionaries keyed by resource type.
+        The resource types without ids, with a name without id or with an id
+        not found are fetched by name.
+        Returns True if all the resources with ids are found by id.
+        """
+        verified = True
+
+        for resource_type, names in self._config_names(
+            application_config
+        ).items():
+            if len(names) == 0:
+                continue
+
+            _, name_filter, _, id_filter = self.RESOURCE_TYPES.get(
+                resource_type
+            )
+            resource_ids = ids.get(resource_type, {})
+
+            if id_filter is not None and len(resource_ids) > 0:
+                if names.issubset(resource_ids.keys()):
+                    self._fetch(
+                        resource_type,
+                        names,
+                        id_filter,
+                        set(resource_ids.get(name) for name in names),
+                    )
+
+                    if all(
+                        len(self.find(resource_type, name)) > 0
+                        for name in names
+                    ):
+                        continue
+
+                verified = False
+
+            self._fetch(resource_type, names, name_filter, names)
+
+        Logger.debug("Inventory refreshed by id, verified: %s!", verified)
+
+        return verified
+
+    def _config_names(self, application_config) -> dict:
+        names = {resource_type: set() for resource_type in self.RESOURCE_TYPES}
+
+        names.get(self.VPCS).add(application_config.vpc.name)
+        names.get(self.INTERNET_GATEWAYS).add(
+            application_config.internet_gateway
+        )
+        names.get(self.ROUTE_TABLES).add(application_config.route_table)
+
+        for subnet_config in application_config.subnets:
+            names.get(self.SUBNETS).add(subnet_config.name)
+
+        for security_group_config in application_config.security_groups:
+            names.get(self.SECURITY_GROUPS).add(security_group_config.name)
+
+        for instance_config in application_config.instances:
+            names.get(self.INSTANCES).add(instance_config.name)
+            names.get(self.KEY_PAIRS).add(instance_config.keypair)
+            names.get(self.IMAGES).add(instance_config.parent_img)
+
+            if instance_config.target_img is not None:
+                names.get(self.IMAGES).add(instance_config.target_img)
+
+        for resource_names in names.values():
+            resource_names.discard(None)
+
+        return names
+
+    def find(self, resource_type: str, name: str):
+        """
+        Returns the resources matching the name, None if the name is not in
+        the inventory.
+        """
+        with self._lock:
+            if name not in self._names.get(resource_type, set()):
+                return None
+
+            return list(self._by_name.get(resource_type).get(name, []))
+
+    def find_by_id(self, resource_type: str, resource_id: str):
+        """
+        Returns the resource with the id, None if it is not in the inventory.
+        """
+        with self._lock:
+            return self._by_id.get(resource_type, {}).get(resource_id)
+
+    def invalidate(self, resource_type: str, name: str) -> None:
+        """
+        Removes a name from the inventory, the next lookup is resolved by
+        the DAO with a describe call.
+        """
+        with self._lock:
+            self._names.get(resource_type, set()).discard(name)
+
+            for resource in self._by_name.get(resource_type, {}).pop(name, []):
+                resource_id = resource.get(
+                    self.RESOURCE_TYPES.get(resource_type)[2]
+                )
+                self._by_id.get(resource_type).pop(resource_id, None)
+
+    @classmethod
+    def activate(cls, inventory) -> None:
+        """
+        Makes the inventory the one used by the DAO objects of its region.
+        """
+        with cls._active_lock:
+            cls._active[inventory.ec2.meta.region_name] = inventory
+
+    @classmethod
+    def deactivate(cls) -> None:
+        with cls._active_lock:
+            cls._active = {}
+
+    @classmethod
+    def lookup(cls, ec2, resource_type: str, name: str):
+        """
+        Looks up a name in the active inventory of the client region.
+        """
+        inventory = cls._active.get(ec2.meta.region_name)
+
+        if inventory is None:
+            return None
+
+        return inventory.find(resource_type, name)
+
+    @classmethod
+    def lookup_id(cls, ec2, resource_type: str, resource_id: str):
+        """
+        Looks up an id in the active inventory of the client region.
+        """
+        inventory = cls._active.get(ec2.meta.region_name)
+
+        if inventory is None:
+            return None
+
+        return inventory.find_by_id(resource_type, resource_id)
+
+    @classmethod
+    def forget(cls, ec2, resource_type: str, name: str) -> None:
+        """
+        Invalidates a name in the active inventory of the client region,
+        the DAO objects call it after they change a resource.
+        """
+        inventory = cls._active.get(ec2.meta.region_name)
+
+        if inventory is not None:
+            inventory.invalidate(resource_type, name)
+
+    def _fetch(
+        self, resource_type: str, names: set, filter_name: str, values: set
+    ) -> None:
+        operation, _, id_field, _ = self.RESOURCE_TYPES.get(resource_type)
+        arguments = {
+            "Filters": [{"Name": filter_name, "Values": sorted(values)}]
+        }
+
+        if resource_type == self.KEY_PAIRS:
+            arguments["IncludePublicKey"] = True
+
+        if self.ec2.can_paginate(operation):
+            result_key = (
+                "Reservations"
+                if resource_type == self.INSTANCES
+                else resource_type
+            )
+            resources = []
+
+            for page in self.ec2.get_paginator(operation).paginate(
+                **arguments
+            ):
+                resources.extend(page.get(result_key))
+        else:
+            resources = getattr(self.ec2, operation)(**arguments).get(
+                resource_type
+            )
+
+        if resource_type == self.INSTANCES:
+            resources = [
+                instance
+                for reservation in resources
+                for instance in reservation.get("Instances")
+            ]
+
+        by_name = {}
+        by_id = {}
+
+        for resource in resources:
+            for name in set(self._resource_names(resource_type, resource)):
+                if name in names:
+                    by_name.setdefault(name, []).append(resource)
+
+            by_id[resource.get(id_field)] = resource
+
+        with self._lock:
+            self._names[resource_type] = set(names)
+            self._by_name[resource_type] = by_name
+            self._by_id[resource_type] = by_id
+
+    def _resource_names(self, resource_type: str, resource: dict) -> list:
+        if resource_type == self.KEY_PAIRS:
+            return [resource.get("KeyName")]
+
+        if resource_type == self.IMAGES:
+            return [resource.get("Name")]
+
+        return [tag.get("Value") for tag in resource.get("Tags", [])]
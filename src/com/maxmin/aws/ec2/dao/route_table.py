@@ -5,8 +5,10 @@ Created on Mar 20, 2023
 """
 
 from com.maxmin.aws.client import Ec2
+from com.maxmin.aws.ec2.dao.inventory import Inventory
 from com.maxmin.aws.exception import AwsException
 from com.maxmin.aws.logs import Logger
+from com.maxmin.aws.tracing import traced
 
 
 class RouteTable(Ec2):
@@ -19,22 +21,29 @@ class RouteTable(Ec2):
         self.name = name
         self.id = None
         self.vpc_id = None
+        self.association_ids = []
 
+    @traced()
     def load(self) -> bool:
         """
         Loads the route table data, throws an error if more than 1 route table
         are found, returns True if one is found, False otherwise.
         """
-        response = self.ec2.describe_route_tables(
-            Filters=[
-                {
-                    "Name": "tag-value",
-                    "Values": [
-                        self.name,
-                    ],
-                },
-            ]
-        ).get("RouteTables")
+        response = Inventory.lookup(
+            self.ec2, Inventory.ROUTE_TABLES, self.name
+        )
+
+        if response is None:
+            response = self.ec2.describe_route_tables(
+                Filters=[
+                    {
+                        "Name": "tag-value",
+                        "Values": [
+                            self.name,
+                        ],
+                    },
+                ]
+            ).get("RouteTables")
 
         if len(response) > 1:
             # do not allow more route tables with the same name.
@@ -45,9 +54,15 @@ class RouteTable(Ec2):
         else:
             self.id = response[0].get("RouteTableId")
             self.vpc_id = response[0].get("VpcId")
+            self.association_ids = [
+                association.get("RouteTableAssociationId")
+                for association in response[0].get("Associations", [])
+                if association.get("Main") is not True
+            ]
 
             return True
 
+    @traced()
     def create(self, vpc_id) -> None:
         """
         Creates a route table attached to the vpc.
@@ -75,7 +90,10 @@ class RouteTable(Ec2):
         except Exception as e:
             Logger.error(str(e))
             raise AwsException("Error creating the route table!")
+        finally:
+            Inventory.forget(self.ec2, Inventory.ROUTE_TABLES, self.name)
 
+    @traced()
     def delete(self) -> None:
         """
         Deletes the route table.
@@ -85,17 +103,22 @@ class RouteTable(Ec2):
         except Exception as e:
             Logger.error(str(e))
             raise AwsException("Error deleting the route table!")
+        finally:
+            Inventory.forget(self.ec2, Inventory.ROUTE_TABLES, self.name)
 
     def has_route(self, gate_id: str, destination_cidr: str):
-        routes = (
-            self.ec2.describe_route_tables(
+        route_table = Inventory.lookup_id(
+            self.ec2, Inventory.ROUTE_TABLES, self.id
+        )
+
+        if route_table is None:
+            route_table = self.ec2.describe_route_tables(
                 RouteTableIds=[
                     self.id,
                 ],
-            )
-            .get("RouteTables")[0]
-            .get("Routes")
-        )
+            ).get("RouteTables")[0]
+
+        routes = route_table.get("Routes")
 
         for route in routes:
             if route.get("State") == "active":
@@ -117,6 +140,8 @@ class RouteTable(Ec2):
         except Exception as e:
             Logger.error(str(e))
             raise AwsException("Error creating route!")
+        finally:
+            Inventory.forget(self.ec2, Inventory.ROUTE_TABLES, self.name)
 
     def associate_subnet(self, subnet_id: str):
         try:
@@ -126,3 +151,21 @@ class RouteTable(Ec2):
         except Exception as e:
             Logger.error(str(e))
             raise AwsException("Error associating subnet to the route table!")
+        finally:
+            Inventory.forget(self.ec2, Inventory.ROUTE_TABLES, self.name)
+
+    def disassociate_subnets(self):
+        """
+        Removes the subnet associations found when the route table was
+        loaded.
+        """
+        try:
+            for association_id in self.association_ids:
+                self.ec2.disassociate_route_table(AssociationId=association_id)
+        except Exception as e:
+            Logger.error(str(e))
+            raise AwsException("Error disassociating the subnets!")
+        finally:
+            Inventory.forget(self.ec2, Inventory.ROUTE_TABLES, self.name)
+
+        self.association_ids = []
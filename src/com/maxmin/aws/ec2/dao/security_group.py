@@ -7,9 +7,13 @@ from abc import abstractmethod
 
 from botocore.exceptions import ClientError
 
+from com.maxmin.aws.cache import cached_load, invalidates
 from com.maxmin.aws.client import Ec2
+from com.maxmin.aws.ec2.dao.inventory import Inventory
 from com.maxmin.aws.exception import AwsException
 from com.maxmin.aws.logs import Logger
+from com.maxmin.aws.tracing import traced
+from com.maxmin.aws.waiter import AdaptiveWaiter
 
 
 class SecurityGroup(Ec2):
@@ -27,22 +31,14 @@ class SecurityGroup(Ec2):
         self.id = None
         self.vpc_id = None
 
+    @traced()
     def load(self) -> bool:
         """
         Loads the security group data, throws an error if more than 1 group
         are found, returns True if one is found, False otherwise.
         """
 
-        response = self.ec2.describe_security_groups(
-            Filters=[
-                {
-                    "Name": "tag-value",
-                    "Values": [
-                        self.name,
-                    ],
-                },
-            ],
-        ).get("SecurityGroups")
+        response = self._describe()
 
         if len(response) > 1:
             raise AwsException("Found more than 1 security group!")
@@ -56,6 +52,28 @@ class SecurityGroup(Ec2):
 
             return True
 
+    @cached_load("security_group")
+    def _describe(self) -> list:
+        response = Inventory.lookup(
+            self.ec2, Inventory.SECURITY_GROUPS, self.name
+        )
+
+        if response is None:
+            response = self.ec2.describe_security_groups(
+                Filters=[
+                    {
+                        "Name": "tag-value",
+                        "Values": [
+                            self.name,
+                        ],
+                    },
+                ],
+            ).get("SecurityGroups")
+
+        return response
+
+    @traced()
+    @invalidates("security_group")
     def create(self, description: str, vpc_id: str) -> None:
         """
         Creates a security group and waits until it exists.
@@ -81,10 +99,15 @@ class SecurityGroup(Ec2):
         except Exception as e:
             Logger.error(str(e))
             raise AwsException("Error creating the security group!")
+        finally:
+            Inventory.forget(self.ec2, Inventory.SECURITY_GROUPS, self.name)
 
-        waiter = self.ec2.get_waiter("security_group_exists")
-        waiter.wait(GroupIds=[self.id])
+        AdaptiveWaiter(self.ec2, "security_group_exists").wait(
+            GroupIds=[self.id]
+        )
 
+    @traced()
+    @invalidates("security_group")
     def delete(self) -> None:
         """
         Deletes the security group.
@@ -94,6 +117,8 @@ class SecurityGroup(Ec2):
         except Exception as e:
             Logger.error(str(e))
             raise AwsException("Error deleting the security group!")
+        finally:
+            Inventory.forget(self.ec2, Inventory.SECURITY_GROUPS, self.name)
 
 
 class AbstractRule(Ec2):
@@ -158,6 +183,7 @@ class CidrRule(AbstractRule):
         self.source_cidr = None
         self.description = None
 
+    @traced()
     def load(
         self,
         from_port: str,
@@ -205,6 +231,7 @@ class CidrRule(AbstractRule):
 
             return True
 
+    @traced()
     def create(
         self,
         from_port: int,
@@ -237,6 +264,7 @@ class CidrRule(AbstractRule):
             Logger.error(str(e))
             raise AwsException("Error allowing access from cidr!")
 
+    @traced()
     def delete(
         self,
         from_port: int,
@@ -286,6 +314,7 @@ class SgpRule(AbstractRule):
         self.protocol = None
         self.source_security_group_id = None
 
+    @traced()
     def load(
         self,
         from_port: str,
@@ -332,6 +361,7 @@ class SgpRule(AbstractRule):
 
             return True
 
+    @traced()
     def create(
         self,
         from_port: int,
@@ -369,6 +399,7 @@ class SgpRule(AbstractRule):
             Logger.error(str(e))
             raise AwsException("Error allowing access from security group!")
 
+    @traced()
     def delete(
         self,
         from_port: int,
@@ -400,3 +431,197 @@ class SgpRule(AbstractRule):
         except Exception as e:
             Logger.error(str(e))
             raise AwsException("Error revoking access from security group!")
+
+
+class RuleReconciler(Ec2):
+    """
+    Makes the inbound rules of a security group match the configured ones.
+    The group is described once, the rules are compared as sets and the
+    missing ones are authorized with one call, the stale ones revoked with
+    another, the ones that changed only description are updated in place
+    with a third.
+    """
+
+    CIDR = "IpRanges"
+    SGP = "UserIdGroupPairs"
+    CIDR_V6 = "Ipv6Ranges"
+    PREFIX_LIST = "PrefixListIds"
+
+    # source field of each kind of rule.
+    SOURCE_FIELDS = {
+        CIDR: "CidrIp",
+        SGP: "GroupId",
+        CIDR_V6: "CidrIpv6",
+        PREFIX_LIST: "PrefixListId",
+    }
+
+    def __init__(self, security_group_id: str):
+        """
+        Constructor
+        """
+        super().__init__()
+        self.security_group_id = security_group_id
+
+    def reconcile(self, rule_configs: list, revoke: bool = True) -> tuple:
+        """
+        Authorizes the missing rules, updates the descriptions of the rules
+        that changed only description and, if revoke is True, revokes the
+        ones not configured. Returns the rules authorized, revoked and
+        described.
+        """
+        configured_rules = set(
+            self.rule_of_config(rule_config) for rule_config in rule_configs
+        )
+        missing_rules, stale_rules, described_rules = self.diff(
+            self.load(), configured_rules, revoke
+        )
+
+        if len(described_rules) > 0:
+            try:
+                self.ec2.update_security_group_rule_descriptions_ingress(
+                    GroupId=self.security_group_id,
+                    IpPermissions=self.permissions_of(described_rules),
+                )
+            except Exception as e:
+                Logger.error(str(e))
+                raise AwsException("Error describing the security rules!")
+
+        if len(stale_rules) > 0:
+            try:
+                self.ec2.revoke_security_group_ingress(
+                    GroupId=self.security_group_id,
+                    IpPermissions=self.permissions_of(stale_rules),
+                )
+            except Exception as e:
+                Logger.error(str(e))
+                raise AwsException("Error revoking the security rules!")
+
+        if len(missing_rules) > 0:
+            try:
+                self.ec2.authorize_security_group_ingress(
+                    GroupId=self.security_group_id,
+                    IpPermissions=self.permissions_of(missing_rules),
+                )
+            except Exception as e:
+                Logger.error(str(e))
+                raise AwsException("Error authorizing the security rules!")
+
+        return missing_rules, stale_rules, described_rules
+
+    @staticmethod
+    def diff(live_rules: set, configured_rules: set, revoke: bool = True):
+        """
+        Returns the rules to authorize, to revoke and the ones whose
+        description only is changed, with the new description.
+        """
+        missing_rules = configured_rules - live_rules
+        stale_rules = live_rules - configured_rules
+
+        # the rules are the same without the description.
+        stale_keys = set(rule[:-1] for rule in stale_rules)
+        described_rules = set(
+            rule for rule in missing_rules if rule[:-1] in stale_keys
+        )
+        described_keys = set(rule[:-1] for rule in described_rules)
+
+        missing_rules -= described_rules
+        stale_rules = (
+            set(
+                rule for rule in stale_rules if rule[:-1] not in described_keys
+            )
+            if revoke
+            else set()
+        )
+
+        return missing_rules, stale_rules, described_rules
+
+    @traced()
+    def load(self) -> set:
+        """
+        Returns the inbound rules of the group as a set of (protocol,
+        from port, to port, kind, source, description) tuples.
+        """
+        try:
+            permissions = (
+                self.ec2.describe_security_groups(
+                    GroupIds=[self.security_group_id]
+                )
+                .get("SecurityGroups")[0]
+                .get("IpPermissions")
+            )
+        except Exception as e:
+            Logger.error(str(e))
+            raise AwsException("Error loading the security rules!")
+
+        return self.rules_of(permissions)
+
+    @classmethod
+    def rules_of(cls, permissions: list) -> set:
+        """
+        Flattens IpPermissions into a set of rules.
+        """
+        rules = set()
+
+        for permission in permissions:
+            for kind, source_field in cls.SOURCE_FIELDS.items():
+                for source in permission.get(kind, []):
+                    rules.add(
+                        (
+                            permission.get("IpProtocol"),
+                            permission.get("FromPort"),
+                            permission.get("ToPort"),
+                            kind,
+                            source.get(source_field),
+                            source.get("Description"),
+                        )
+                    )
+
+        return rules
+
+    @classmethod
+    def rule_of_config(cls, rule_config) -> tuple:
+        if hasattr(rule_config, "sgp_id"):
+            kind, source = cls.SGP, rule_config.sgp_id
+        else:
+            kind, source = cls.CIDR, rule_config.cidr
+
+        return (
+            rule_config.protocol,
+            rule_config.from_port,
+            rule_config.to_port,
+            kind,
+            source,
+            rule_config.description,
+        )
+
+    @classmethod
+    def permissions_of(cls, rules: set) -> list:
+        """
+        Groups the rules by protocol and ports into IpPermissions.
+        """
+        permissions = {}
+
+        for protocol, from_port, to_port, kind, source, description in sorted(
+            rules, key=lambda rule: tuple(str(field) for field in rule)
+        ):
+            permission = permissions.get((protocol, from_port, to_port))
+
+            if permission is None:
+                permission = {"IpProtocol": protocol}
+
+                if from_port is not None:
+                    permission["FromPort"] = from_port
+
+                if to_port is not None:
+                    permission["ToPort"] = to_port
+
+                permissions[(protocol, from_port, to_port)] = permission
+
+            entry = {cls.SOURCE_FIELDS.get(kind): source}
+
+            if description is not None:
+                entry["Description"] = description
+
+            permission.setdefault(kind, []).append(entry)
+
+        return list(permissions.values())
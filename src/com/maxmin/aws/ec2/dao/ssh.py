@@ -8,10 +8,13 @@ import stat
 
 from botocore.exceptions import ClientError
 
+from com.maxmin.aws.cache import cached_load, invalidates
 from com.maxmin.aws.client import Ec2
 from com.maxmin.aws.constants import ProjectDirectories
+from com.maxmin.aws.ec2.dao.inventory import Inventory
 from com.maxmin.aws.exception import AwsException
 from com.maxmin.aws.logs import Logger
+from com.maxmin.aws.tracing import traced
 
 
 class Keypair(Ec2):
@@ -25,29 +28,48 @@ class Keypair(Ec2):
         self.id = None
         self.public_key = None
 
+    @traced()
     def load(self) -> bool:
         """
         Loads the keypair data, returns True if a keypair is found, False
         otherwise.
         """
 
-        try:
-            response = self.ec2.describe_key_pairs(
-                KeyNames=[
-                    self.name,
-                ],
-                IncludePublicKey=True,
-            ).get("KeyPairs")
-
-            self.id = response[0].get("KeyPairId")
-            self.public_key = response[0].get("PublicKey")
-
-            return True
+        response = self._describe()
 
-        except ClientError as e:
-            Logger.warn(str(e))
+        if len(response) == 0:
             return False
 
+        self.id = response[0].get("KeyPairId")
+        self.public_key = response[0].get("PublicKey")
+
+        return True
+
+    @cached_load("keypair")
+    def _describe(self) -> list:
+        response = Inventory.lookup(self.ec2, Inventory.KEY_PAIRS, self.name)
+
+        if response is None:
+            try:
+                response = self.ec2.describe_key_pairs(
+                    KeyNames=[
+                        self.name,
+                    ],
+                    IncludePublicKey=True,
+                ).get("KeyPairs")
+            except ClientError as e:
+                if e.response["Error"]["Code"] == "InvalidKeyPair.NotFound":
+                    Logger.warn(str(e))
+                    return []
+                else:
+                    # an error isn't an absent keypair, it's not cached.
+                    Logger.error(str(e))
+                    raise AwsException("Error loading the keypair!")
+
+        return response
+
+    @traced()
+    @invalidates("keypair")
     def create(self) -> None:
         """
         Create a 2048-bit RSA key pair with the specified name.
@@ -90,7 +112,11 @@ class Keypair(Ec2):
         except Exception as e:
             Logger.error(str(e))
             raise AwsException("Error creating the keypair!")
+        finally:
+            Inventory.forget(self.ec2, Inventory.KEY_PAIRS, self.name)
 
+    @traced()
+    @invalidates("keypair")
     def delete(self) -> None:
         """
         Deletes the specified key pair, by removing the public key from Amazon
@@ -110,3 +136,5 @@ class Keypair(Ec2):
         except Exception as e:
             Logger.error(str(e))
             raise AwsException("Error deleting the keypair!")
+        finally:
+            Inventory.forget(self.ec2, Inventory.KEY_PAIRS, self.name)
@@ -4,9 +4,13 @@ Created on Mar 20, 2023
 @author: vagrant
 """
 
+from com.maxmin.aws.cache import cached_load, invalidates
 from com.maxmin.aws.client import Ec2
+from com.maxmin.aws.ec2.dao.inventory import Inventory
 from com.maxmin.aws.exception import AwsException
 from com.maxmin.aws.logs import Logger
+from com.maxmin.aws.tracing import traced
+from com.maxmin.aws.waiter import AdaptiveWaiter
 
 
 class Subnet(Ec2):
@@ -22,22 +26,14 @@ class Subnet(Ec2):
         self.az = None
         self.vpc_id = None
 
+    @traced()
     def load(self) -> bool:
         """
         Loads the subnet data, throws an error if more than 1 are found,
         returns True if a subnet is found, False otherwise.
         """
 
-        response = self.ec2.describe_subnets(
-            Filters=[
-                {
-                    "Name": "tag-value",
-                    "Values": [
-                        self.name,
-                    ],
-                },
-            ],
-        ).get("Subnets")
+        response = self._describe()
 
         if len(response) > 1:
             # do not allow more subnets with the same name.
@@ -53,6 +49,26 @@ class Subnet(Ec2):
 
             return True
 
+    @cached_load("subnet")
+    def _describe(self) -> list:
+        response = Inventory.lookup(self.ec2, Inventory.SUBNETS, self.name)
+
+        if response is None:
+            response = self.ec2.describe_subnets(
+                Filters=[
+                    {
+                        "Name": "tag-value",
+                        "Values": [
+                            self.name,
+                        ],
+                    },
+                ],
+            ).get("Subnets")
+
+        return response
+
+    @traced()
+    @invalidates("subnet")
     def create(self, az: str, cidr: str, vpc_id: str) -> None:
         """
         Creates a subnet and waits until it's available.
@@ -83,10 +99,13 @@ class Subnet(Ec2):
         except Exception as e:
             Logger.error(str(e))
             raise AwsException("Error creating the subnet!")
+        finally:
+            Inventory.forget(self.ec2, Inventory.SUBNETS, self.name)
 
-        waiter = self.ec2.get_waiter("subnet_available")
-        waiter.wait(SubnetIds=[self.id])
+        AdaptiveWaiter(self.ec2, "subnet_available").wait(SubnetIds=[self.id])
 
+    @traced()
+    @invalidates("subnet")
     def delete(self) -> None:
         """
         Deletes the subnet.
@@ -96,3 +115,5 @@ class Subnet(Ec2):
         except Exception as e:
             Logger.error(str(e))
             raise AwsException("Error deleting the subnet!")
+        finally:
+            Inventory.forget(self.ec2, Inventory.SUBNETS, self.name)
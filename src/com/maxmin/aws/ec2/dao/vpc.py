@@ -4,9 +4,13 @@ Created on Mar 20, 2023
 @author: vagrant
 """
 
+from com.maxmin.aws.cache import cached_load, invalidates
 from com.maxmin.aws.client import Ec2
+from com.maxmin.aws.ec2.dao.inventory import Inventory
 from com.maxmin.aws.exception import AwsException
 from com.maxmin.aws.logs import Logger
+from com.maxmin.aws.tracing import traced
+from com.maxmin.aws.waiter import AdaptiveWaiter
 
 
 class Vpc(Ec2):
@@ -21,22 +25,14 @@ class Vpc(Ec2):
         self.state = None
         self.cidr = None
 
+    @traced()
     def load(self) -> bool:
         """
         Loads the vpc data, throws an error if more than 1 are found,
         returns True if a vpc is found, False otherwise.
         """
 
-        response = self.ec2.describe_vpcs(
-            Filters=[
-                {
-                    "Name": "tag-value",
-                    "Values": [
-                        self.name,
-                    ],
-                },
-            ],
-        ).get("Vpcs")
+        response = self._describe()
 
         if len(response) > 1:
             # do not allow more vpc with the same name.
@@ -51,6 +47,26 @@ class Vpc(Ec2):
 
             return True
 
+    @cached_load("vpc")
+    def _describe(self) -> list:
+        response = Inventory.lookup(self.ec2, Inventory.VPCS, self.name)
+
+        if response is None:
+            response = self.ec2.describe_vpcs(
+                Filters=[
+                    {
+                        "Name": "tag-value",
+                        "Values": [
+                            self.name,
+                        ],
+                    },
+                ],
+            ).get("Vpcs")
+
+        return response
+
+    @traced()
+    @invalidates("vpc")
     def create(self, cidr: str) -> None:
         """
         Creates a VPC and waits until it's available.
@@ -79,10 +95,13 @@ class Vpc(Ec2):
         except Exception as e:
             Logger.error(str(e))
             raise AwsException("Error creating the vpc!")
+        finally:
+            Inventory.forget(self.ec2, Inventory.VPCS, self.name)
 
-        waiter = self.ec2.get_waiter("vpc_available")
-        waiter.wait(VpcIds=[self.id])
+        AdaptiveWaiter(self.ec2, "vpc_available").wait(VpcIds=[self.id])
 
+    @traced()
+    @invalidates("vpc")
     def delete(self) -> None:
         """
         Deletes the VPC.
@@ -92,3 +111,5 @@ class Vpc(Ec2):
         except Exception as e:
             Logger.error(str(e))
             raise AwsException("Error deleting the vpc!")
+        finally:
+            Inventory.forget(self.ec2, Inventory.VPCS, self.name)
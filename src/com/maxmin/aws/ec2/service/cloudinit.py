@@ -0,0 +1,98 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+import gzip
+import os
+import threading
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+
+import jinja2
+
+from com.maxmin.aws.constants import ProjectFiles
+from com.maxmin.aws.exception import AwsException
+from com.maxmin.aws.logs import Logger
+
+
+class CloudInit(object):
+    """
+    Renders the cloud-init user data of the instances.
+    The templates are compiled once by a jinja environment shared by all the
+    renderers and compiled again only when the template file changes.
+    """
+
+    # maximum size of the user data of an instance, before base64 encoding.
+    USER_DATA_LIMIT = 16384
+
+    _lock = threading.Lock()
+    _environment = jinja2.Environment()
+    # {template path: (mtime, compiled template)}
+    _templates = {}
+
+    def __init__(self, template_file: str = ProjectFiles.CLOUDINIT_TEMPLATE):
+        self.template_file = template_file
+
+    def render(self, cloudinit_data: dict) -> str:
+        return self.template().render(cloudinit_data)
+
+    def render_all(self, cloudinit_data: list) -> list:
+        """
+        Renders the template once for each dictionary in the list.
+        """
+        template = self.template()
+
+        return [template.render(data) for data in cloudinit_data]
+
+    def template(self) -> jinja2.Template:
+        """
+        Returns the compiled template, the file is read and compiled only the
+        first time or if it has been modified since.
+        """
+        mtime = os.stat(self.template_file).st_mtime_ns
+
+        with self._lock:
+            cached = self._templates.get(self.template_file)
+
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+
+            with open(self.template_file, "r") as file:
+                template = self._environment.from_string(file.read())
+
+            self._templates[self.template_file] = (mtime, template)
+
+            Logger.debug("Template %s compiled!", self.template_file)
+
+            return template
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._templates = {}
+
+    @classmethod
+    def user_data(cls, cloud_config: str) -> bytes:
+        """
+        Returns the user data of an instance, the cloud-config as it is if
+        it fits in the limit, otherwise a gzipped multipart MIME message with
+        the cloud-config as its part.
+        The user data is base64 encoded by the client.
+        """
+        user_data = cloud_config.encode("utf-8")
+
+        if len(user_data) <= cls.USER_DATA_LIMIT:
+            return user_data
+
+        message = MIMEMultipart()
+        message.attach(MIMEText(cloud_config, "cloud-config", "utf-8"))
+        user_data = gzip.compress(message.as_bytes(), mtime=0)
+
+        if len(user_data) > cls.USER_DATA_LIMIT:
+            raise AwsException(
+                f"User data of {len(user_data)} bytes compressed, the limit "
+                f"is {cls.USER_DATA_LIMIT} bytes!"
+            )
+
+        return user_data
@@ -3,22 +3,24 @@ Created on Apr 2, 2023
 
 @author: vagrant
 """
-import base64
-import crypt
-
-import jinja2
-
-from com.maxmin.aws.constants import ProjectFiles
 from com.maxmin.aws.ec2.dao.image import Image
 from com.maxmin.aws.ec2.dao.instance import Instance
 from com.maxmin.aws.ec2.dao.security_group import SecurityGroup
 from com.maxmin.aws.ec2.dao.ssh import Keypair
 from com.maxmin.aws.ec2.dao.subnet import Subnet
+from com.maxmin.aws.ec2.service.cloudinit import CloudInit
+from com.maxmin.aws.ec2.service.password import PasswordHasher
 from com.maxmin.aws.exception import AwsException
 from com.maxmin.aws.logs import Logger
+from com.maxmin.aws.tracing import traced
 
 
 class InstanceService(object):
+    def __init__(self):
+        self.cloud_init = CloudInit()
+        self.password_hasher = PasswordHasher()
+
+    @traced("service")
     def create_instance(
         self,
         parent_image_nm: str,
@@ -35,47 +37,23 @@ class InstanceService(object):
         Creates/runs an instance.
         """
         try:
-            environment = jinja2.Environment()
-            with open(ProjectFiles.CLOUDINIT_TEMPLATE, "r") as file:
-                cloudinit_template = file.read()
-
-            template = environment.from_string(cloudinit_template)
-
-            salt = crypt.mksalt(method=crypt.METHOD_SHA512, rounds=4096)
-            hashed_pwd = crypt.crypt(user_pwd, salt)
-            keypair = Keypair(keypair_nm)
-            keypair.load()
-
-            cloudinit_data = {
-                "username": user_nm,
-                "hostname": hostname,
-                "hashed_password": hashed_pwd,
-                "public_key": keypair.public_key,
-            }
-
-            cloudinit_config = template.render(cloudinit_data)
-            cloudinit_config_b64 = base64.b64encode(
-                bytes(str(cloudinit_config), "utf-8")
-            )
-
-            parent_image = Image(parent_image_nm)
-            parent_image.load()
-            security_group = SecurityGroup(security_group_nm)
-            security_group.load()
-            subnet = Subnet(subnet_nm)
-            subnet.load()
-
             instance = Instance(tags)
             if instance.load() is False:
                 Logger.info("Creating instance ...")
 
-                instance.create(
-                    parent_image.id,
-                    security_group.id,
-                    subnet.id,
+                hashed_pwd = self.password_hasher.hash(user_nm, user_pwd)
+                user_data = self._user_data(
+                    [(keypair_nm, hostname, user_nm, hashed_pwd)]
+                )[0]
+
+                self._launch(
+                    instance,
+                    parent_image_nm,
+                    security_group_nm,
+                    subnet_nm,
                     private_ip,
-                    cloudinit_config_b64,
-                    tags,
+                    user_data,
+                    True,
                 )
 
                 Logger.info("Instance successfully created!")
@@ -86,3 +64,146 @@ class InstanceService(object):
         except Exception as e:
             Logger.error(str(e))
             raise AwsException("Error creating the instance!")
+
+    @traced("service")
+    def create_instances(self, instance_configs: list) -> list:
+        """
+        Creates/runs the instances not created yet, launching them one after
+        the other and then waiting for all of them together.
+        The passwords are hashed while the instances are loaded and the user
+        data of the instances is rendered in one pass.
+        Returns the instances, loaded.
+        """
+        instances = []
+        launches = []
+        credentials = [
+            (instance_config.username, instance_config.password)
+            for instance_config in instance_configs
+        ]
+        hashing = self.password_hasher.submit(credentials)
+
+        try:
+            for instance_config in instance_configs:
+                instance = Instance(instance_config.aws_tags())
+                instances.append(instance)
+
+                if instance.load() is False:
+                    launches.append((instance, instance_config))
+                elif instance.state == "terminated":
+                    raise AwsException("The instance is terminated.")
+                else:
+                    Logger.warn(
+                        f"Instance {instance_config.name} already created!"
+                    )
+
+            hashed_pwds = dict(zip(credentials, hashing.result()))
+            user_datas = self._user_data(
+                [
+                    (
+                        instance_config.keypair,
+                        instance_config.hostname,
+                        instance_config.username,
+                        hashed_pwds.get(
+                            (
+                                instance_config.username,
+                                instance_config.password,
+                            )
+                        ),
+                    )
+                    for _, instance_config in launches
+                ]
+            )
+            launched_instances = []
+
+            for (instance, instance_config), user_data in zip(
+                launches, user_datas
+            ):
+                Logger.info(f"Creating instance {instance_config.name} ...")
+
+                self._launch(
+                    instance,
+                    instance_config.parent_img,
+                    instance_config.security_group,
+                    instance_config.subnet,
+                    instance_config.private_ip,
+                    user_data,
+                    False,
+                )
+
+                launched_instances.append(instance)
+
+                Logger.info(
+                    f"Instance {instance_config.name} launched!",
+                    resource="instance",
+                    id=instance.id,
+                )
+
+            Instance.wait_status_ok(launched_instances)
+
+            for instance in instances:
+                instance.load()
+
+        except Exception as e:
+            Logger.error(str(e))
+            raise AwsException("Error creating the instances!")
+
+        Logger.info(
+            f"{len(launched_instances)} instances successfully created!"
+        )
+
+        return instances
+
+    def _user_data(self, users: list) -> list:
+        """
+        Returns the user data of the instances, users is a list of
+        (keypair name, hostname, user name, hashed password) tuples.
+        """
+        public_keys = {}
+        cloudinit_data = []
+
+        for keypair_nm, hostname, user_nm, hashed_pwd in users:
+            if keypair_nm not in public_keys:
+                keypair = Keypair(keypair_nm)
+                keypair.load()
+                public_keys[keypair_nm] = keypair.public_key
+
+            cloudinit_data.append(
+                {
+                    "username": user_nm,
+                    "hostname": hostname,
+                    "hashed_password": hashed_pwd,
+                    "public_key": public_keys.get(keypair_nm),
+                }
+            )
+
+        return [
+            CloudInit.user_data(cloud_config)
+            for cloud_config in self.cloud_init.render_all(cloudinit_data)
+        ]
+
+    def _launch(
+        self,
+        instance: Instance,
+        parent_image_nm: str,
+        security_group_nm: str,
+        subnet_nm: str,
+        private_ip: str,
+        user_data: bytes,
+        wait: bool,
+    ) -> None:
+        parent_image = Image(parent_image_nm)
+        parent_image.load()
+        security_group = SecurityGroup(security_group_nm)
+        security_group.load()
+        subnet = Subnet(subnet_nm)
+        subnet.load()
+
+        instance.create(
+            parent_image.id,
+            security_group.id,
+            subnet.id,
+            private_ip,
+            user_data,
+            instance.tags,
+            wait,
+        )
@@ -0,0 +1,162 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+import concurrent.futures
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import threading
+
+from passlib.hash import sha512_crypt
+
+from com.maxmin.aws.constants import ProjectFiles
+from com.maxmin.aws.logs import Logger
+
+
+class PasswordHasher(object):
+    """
+    Hashes the passwords of the cloud-init users with SHA-512 crypt, the
+    format of /etc/shadow.
+    The hashes are kept in a cache file readable only by the owner, keyed by
+    an HMAC of the user, the password and the rounds, so a password is hashed
+    once and the user data of the instances doesn't change from one run to
+    the next. The HMAC secret is kept in a separate file, the cache file
+    alone holds nothing faster to brute-force than the hashes.
+    """
+
+    def __init__(self, cache_file: str = None, rounds: int = 4096):
+        self.cache_file = (
+            cache_file
+            if cache_file is not None
+            else ProjectFiles.PASSWORD_CACHE_FILE
+        )
+        self.secret_file = f"{self.cache_file}.key"
+        self.rounds = rounds
+        self._lock = threading.Lock()
+        self._hashes = None
+        self._secret = None
+
+    def hash(self, user_nm: str, user_pwd: str) -> str:
+        return self.hash_all([(user_nm, user_pwd)])[0]
+
+    def hash_all(self, users: list) -> list:
+        """
+        Returns the hashes of the passwords, users is a list of
+        (user name, user password) tuples.
+        """
+        with self._lock:
+            hashes = self._load()
+            keys = [
+                self._key(user_nm, user_pwd) for user_nm, user_pwd in users
+            ]
+            missing = {}
+
+            for key, (_, user_pwd) in zip(keys, users):
+                if key not in hashes:
+                    missing[key] = user_pwd
+
+            if len(missing) > 0:
+                Logger.debug("Hashing %s passwords ...", len(missing))
+
+                hasher = sha512_crypt.using(rounds=self.rounds)
+
+                for key, user_pwd in missing.items():
+                    hashes[key] = hasher.hash(user_pwd)
+
+                self._save(self.cache_file, json.dumps(hashes))
+
+            return [hashes.get(key) for key in keys]
+
+    def submit(self, users: list) -> concurrent.futures.Future:
+        """
+        Hashes the passwords in the background, the hashes are returned by
+        the result of the future.
+        """
+        future = concurrent.futures.Future()
+
+        def run():
+            try:
+                future.set_result(self.hash_all(users))
+            except BaseException as e:
+                future.set_exception(e)
+
+        threading.Thread(
+            target=run, name="password-hasher", daemon=True
+        ).start()
+
+        return future
+
+    def _key(self, user_nm: str, user_pwd: str) -> str:
+        digest = hmac.new(self._load_secret(), digestmod=hashlib.sha256)
+
+        for value in (str(self.rounds), user_nm, user_pwd):
+            digest.update(value.encode("utf-8"))
+            digest.update(b"\0")
+
+        return digest.hexdigest()
+
+    def _load(self) -> dict:
+        if self._hashes is None:
+            try:
+                with open(self.cache_file, "r") as file:
+                    hashes = json.load(file)
+
+                # the entries of other formats are dropped.
+                self._hashes = {
+                    key: value
+                    for key, value in hashes.items()
+                    if isinstance(value, str)
+                }
+            except FileNotFoundError:
+                self._hashes = {}
+            except (OSError, ValueError, AttributeError) as e:
+                Logger.warn(f"Password cache not loaded: {e}")
+                self._hashes = {}
+
+        return self._hashes
+
+    def _load_secret(self) -> bytes:
+        """
+        Returns the HMAC secret of the cache, a new one if the secret file
+        is missing, in that case the cache is emptied.
+        """
+        if self._secret is None:
+            try:
+                with open(self.secret_file, "r") as file:
+                    self._secret = bytes.fromhex(file.read().strip())
+            except (OSError, ValueError):
+                self._secret = secrets.token_bytes(32)
+                self._hashes = {}
+
+                if self._save(self.secret_file, self._secret.hex()) is False:
+                    Logger.warn("Password cache secret not saved!")
+
+        return self._secret
+
+    @staticmethod
+    def _save(path: str, content: str) -> bool:
+        """
+        Writes the file, readable and writable only by the owner, replacing
+        the old one only when the new one is complete.
+        """
+        temp_file = f"{path}.tmp"
+
+        try:
+            descriptor = os.open(
+                temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600
+            )
+            os.fchmod(descriptor, 0o600)
+
+            with os.fdopen(descriptor, "w") as file:
+                file.write(content)
+
+            os.replace(temp_file, path)
+        except OSError as e:
+            Logger.warn(f"Password cache not saved: {e}")
+            return False
+
+        return True
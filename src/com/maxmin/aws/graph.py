@@ -0,0 +1,257 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+import asyncio
+import contextlib
+import contextvars
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from com.maxmin.aws.exception import AwsException
+from com.maxmin.aws.logs import Logger
+from com.maxmin.aws.metrics import ApiMetrics
+from com.maxmin.aws.tracing import Tracer
+
+
+class Task(object):
+    """
+    A unit of work in a task graph.
+    The function receives a dictionary with the results of the tasks it
+    depends on, keyed by task name.
+    """
+
+    def __init__(self, name: str, function, dependencies: list):
+        self.name = name
+        self.function = function
+        self.dependencies = list(dependencies)
+
+
+class TaskGraph(object):
+    """
+    Directed acyclic graph of tasks, independent tasks are run concurrently
+    on a bounded pool of worker threads, in a copy of the context of the
+    caller.
+    """
+
+    def __init__(self):
+        self.tasks = {}
+
+    def add_task(self, name: str, function, dependencies: list = ()) -> None:
+        """
+        Adds a task to the graph, the dependencies are the names of the tasks
+        that must complete before this one starts.
+        """
+        if name in self.tasks:
+            raise AwsException(f"Task {name} already added!")
+
+        self.tasks[name] = Task(name, function, dependencies)
+
+    def has_task(self, name: str) -> bool:
+        return name in self.tasks
+
+    def validate(self) -> None:
+        """
+        Throws an error if a dependency is missing or if the graph has a
+        cycle.
+        """
+        for task in self.tasks.values():
+            for dependency in task.dependencies:
+                if dependency not in self.tasks:
+                    raise AwsException(
+                        f"Task {task.name} depends on unknown task "
+                        f"{dependency}!"
+                    )
+
+        if len(self.order()) != len(self.tasks):
+            raise AwsException("The task graph has a cycle!")
+
+    def order(self) -> list:
+        """
+        Returns the task names in a dependency-respecting order, tasks in a
+        cycle are left out.
+        """
+        pending = {
+            name: len(task.dependencies) for name, task in self.tasks.items()
+        }
+        dependents = self._dependents()
+        ready = [name for name, count in pending.items() if count == 0]
+        ordered = []
+
+        while len(ready) > 0:
+            name = ready.pop(0)
+            ordered.append(name)
+
+            for dependent in dependents.get(name):
+                pending[dependent] -= 1
+
+                if pending[dependent] == 0:
+                    ready.append(dependent)
+
+        return ordered
+
+    def run(self, max_parallel: int = 1) -> dict:
+        """
+        Runs the tasks, at most max_parallel at the same time, and returns
+        their results keyed by task name.
+        If a task fails no other task is started, the running ones are
+        awaited and an error is thrown.
+        """
+        if max_parallel < 1:
+            raise AwsException("The max parallel value must be at least 1!")
+
+        self.validate()
+
+        pending = {
+            name: len(task.dependencies) for name, task in self.tasks.items()
+        }
+        dependents = self._dependents()
+        ready = [name for name, count in pending.items() if count == 0]
+        results = {}
+        failed = []
+        running = {}
+
+        with ThreadPoolExecutor(max_workers=max_parallel) as executor:
+            while len(ready) > 0 or len(running) > 0:
+                while len(ready) > 0 and len(failed) == 0:
+                    task = self.tasks.get(ready.pop(0))
+                    arguments = {
+                        dependency: results.get(dependency)
+                        for dependency in task.dependencies
+                    }
+                    future = executor.submit(
+                        contextvars.copy_context().run,
+                        self._call,
+                        task,
+                        arguments,
+                    )
+                    running[future] = task.name
+
+                if len(running) == 0:
+                    break
+
+                done, not_done = wait(
+                    running.keys(), return_when=FIRST_COMPLETED
+                )
+
+                for future in done:
+                    name = running.pop(future)
+                    error = future.exception()
+
+                    if error is not None:
+                        Logger.error(f"Task {name} failed: {error}")
+                        failed.append(name)
+                        continue
+
+                    results[name] = future.result()
+
+                    for dependent in dependents.get(name):
+                        pending[dependent] -= 1
+
+                        if pending[dependent] == 0:
+                            ready.append(dependent)
+
+        if len(failed) > 0:
+            raise AwsException(f"Error running tasks: {', '.join(failed)}!")
+
+        return results
+
+    async def run_async(
+        self, max_parallel: int = 1, semaphore: asyncio.Semaphore = None
+    ) -> dict:
+        """
+        Runs the tasks on the running event loop and returns their results
+        keyed by task name.
+        Coroutine functions are awaited, the other functions are run on the
+        default executor of the loop. At most max_parallel tasks run at the
+        same time, or as many as the semaphore allows if it is given, so
+        graphs run concurrently can share the limit.
+        If a task fails no other task is started, the running ones are
+        awaited and an error is thrown.
+        """
+        if semaphore is None:
+            if max_parallel < 1:
+                raise AwsException(
+                    "The max parallel value must be at least 1!"
+                )
+
+            semaphore = asyncio.Semaphore(max_parallel)
+
+        self.validate()
+
+        loop = asyncio.get_running_loop()
+        completed = {name: asyncio.Event() for name in self.tasks}
+        results = {}
+        failed = []
+
+        async def run_task(task: Task) -> None:
+            try:
+                for dependency in task.dependencies:
+                    await completed.get(dependency).wait()
+
+                if len(failed) > 0:
+                    return
+
+                async with semaphore:
+                    if len(failed) > 0:
+                        return
+
+                    arguments = {
+                        dependency: results.get(dependency)
+                        for dependency in task.dependencies
+                    }
+
+                    with self._scope(task):
+                        if asyncio.iscoroutinefunction(task.function):
+                            result = await task.function(arguments)
+                        else:
+                            result = await loop.run_in_executor(
+                                None,
+                                contextvars.copy_context().run,
+                                task.function,
+                                arguments,
+                            )
+
+                    results[task.name] = result
+            except (Exception, AwsException) as error:
+                # AwsException is a BaseException, not an Exception, it is
+                # named to be caught as in run(), without catching the
+                # cancellation of the task.
+                Logger.error(f"Task {task.name} failed: {error}")
+                failed.append(task.name)
+            finally:
+                completed.get(task.name).set()
+
+        await asyncio.gather(*(run_task(task) for task in self.tasks.values()))
+
+        if len(failed) > 0:
+            raise AwsException(f"Error running tasks: {', '.join(failed)}!")
+
+        return results
+
+    @staticmethod
+    def _call(task: Task, arguments: dict):
+        with TaskGraph._scope(task):
+            return task.function(arguments)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _scope(task: Task):
+        """
+        Adds the task name to the log records, times the task and records
+        its span.
+        """
+        with Logger.context(task=task.name), ApiMetrics.task(
+            task.name
+        ), Tracer.span(task.name, "task"):
+            yield
+
+    def _dependents(self) -> dict:
+        dependents = {name: [] for name in self.tasks}
+
+        for task in self.tasks.values():
+            for dependency in task.dependencies:
+                if dependency in dependents:
+                    dependents.get(dependency).append(task.name)
+
+        return dependents
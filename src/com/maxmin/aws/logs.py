@@ -3,25 +3,227 @@ Created on Mar 18, 2023
 
 @author: vagrant
 """
+import atexit
+import contextlib
+import contextvars
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+
+from com.maxmin.aws.constants import LoggingConstants
+
+
+class ContextFilter(logging.Filter):
+    """
+    Adds to the records the fields of the logging context of the caller and
+    the ones passed to the log call.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.context = {
+            **Logger._context.get(),
+            **getattr(record, "fields", {}),
+        }
+        return True
+
+
+class TextFormatter(logging.Formatter):
+    """
+    Formats the records as 'time level message key=value ...'.
+    """
+
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)s %(message)s")
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = super().format(record)
+        context = getattr(record, "context", {})
+
+        if len(context) > 0:
+            message += " " + " ".join(
+                f"{key}={value}" for key, value in context.items()
+            )
+
+        return message
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formats the records as one JSON object per line.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "message": record.getMessage(),
+            **getattr(record, "context", {}),
+        }
+
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+
+        return json.dumps(entry, default=str)
+
+
+class StdoutHandler(logging.StreamHandler):
+    """
+    Writes to the current sys.stdout, which may be replaced after the
+    handler is created.
+    """
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, stream):
+        pass
+
+
+class StderrHandler(StdoutHandler):
+    """
+    Writes to the current sys.stderr, which may be replaced after the
+    handler is created.
+    """
+
+    @property
+    def stream(self):
+        return sys.stderr
+
+    @stream.setter
+    def stream(self, stream):
+        pass
 
 
 class Logger(object):
     """
-    classdocs
+    Logging of the project on top of the standard logging module.
+    The messages can be formatted lazily, Logger.debug("%s found", name),
+    so disabled levels cost only a level check. Keyword arguments are added
+    to the record as context fields, together with the ones of the enclosing
+    Logger.context blocks.
+    The records are queued and written by a background thread, so the
+    callers never block on the output.
     """
 
-    @staticmethod
-    def info(message):
-        print(message)
+    NAME = "com.maxmin.aws"
+
+    FORMATTERS = {"text": TextFormatter, "json": JsonFormatter}
+
+    OUTPUTS = {"stdout": StdoutHandler, "stderr": StderrHandler}
+
+    _context = contextvars.ContextVar("log_context", default={})
+
+    _lock = threading.Lock()
+    _logger = None
+    _listener = None
+
+    @classmethod
+    def debug(cls, message, *args, **fields):
+        cls._log(logging.DEBUG, message, args, fields)
+
+    @classmethod
+    def info(cls, message, *args, **fields):
+        cls._log(logging.INFO, message, args, fields)
+
+    @classmethod
+    def warn(cls, message, *args, **fields):
+        cls._log(logging.WARNING, message, args, fields)
+
+    @classmethod
+    def error(cls, message, *args, **fields):
+        cls._log(logging.ERROR, message, args, fields)
+
+    @classmethod
+    @contextlib.contextmanager
+    def context(cls, **fields):
+        """
+        Adds the fields to the records logged in the block, also by the
+        tasks the block starts.
+        """
+        token = cls._context.set({**cls._context.get(), **fields})
+
+        try:
+            yield
+        finally:
+            cls._context.reset(token)
+
+    @classmethod
+    def configure(
+        cls,
+        level: str = None,
+        output_format: str = None,
+        output: str = "stdout",
+    ):
+        """
+        Sets the level and the format, 'text' or 'json', the ones in
+        logging.ini are used if they are not given, and the output, 'stdout'
+        or 'stderr'.
+        """
+        logging_constants = LoggingConstants()
+        level = level if level is not None else logging_constants.level
+        output_format = (
+            output_format
+            if output_format is not None
+            else logging_constants.output_format
+        )
+
+        with cls._lock:
+            cls._stop()
+
+            output_handler = cls.OUTPUTS.get(output)()
+            output_handler.setFormatter(cls.FORMATTERS.get(output_format)())
+
+            records = queue.SimpleQueue()
+            queue_handler = logging.handlers.QueueHandler(records)
+            queue_handler.addFilter(ContextFilter())
+
+            logger = logging.getLogger(cls.NAME)
+            logger.setLevel(level.upper())
+            # the records are written only by the queue listener.
+            logger.propagate = False
+
+            for handler in list(logger.handlers):
+                logger.removeHandler(handler)
+
+            logger.addHandler(queue_handler)
+
+            cls._listener = logging.handlers.QueueListener(
+                records, output_handler
+            )
+            cls._listener.start()
+            cls._logger = logger
+
+            return logger
+
+    @classmethod
+    def flush(cls) -> None:
+        """
+        Waits until the queued records are written.
+        """
+        with cls._lock:
+            cls._stop()
+            cls._logger = None
+
+    @classmethod
+    def _stop(cls) -> None:
+        if cls._listener is not None:
+            cls._listener.stop()
+            cls._listener = None
+
+    @classmethod
+    def _log(cls, level: int, message, args: tuple, fields: dict) -> None:
+        logger = cls._logger
+
+        if logger is None:
+            logger = cls.configure()
 
-    @staticmethod
-    def debug(message):
-        print(f"DEBUG: {message}")
+        if logger.isEnabledFor(level):
+            logger.log(level, message, *args, extra={"fields": fields})
 
-    @staticmethod
-    def warn(message):
-        print(f"WARN: {message}")
 
-    @staticmethod
-    def error(message):
-        print(f"ERROR: {message}")
+atexit.register(Logger.flush)
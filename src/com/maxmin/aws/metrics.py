@@ -0,0 +1,285 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+import contextlib
+import contextvars
+import threading
+import time
+from urllib.parse import urlencode
+
+from com.maxmin.aws.logs import Logger
+from com.maxmin.aws.throttle import RateLimiter
+
+
+class ApiMetrics(object):
+    """
+    Latency, retries and payload size of the API calls, by operation, and
+    the time of the tasks of the graphs, split between API calls, waiters
+    and local work.
+    The calls are recorded through the botocore events of the clients.
+    """
+
+    # timing of the task running in the current context.
+    _task = contextvars.ContextVar("task", default=None)
+
+    # True while a waiter polls, the time of its calls is waiter time.
+    _waiting = contextvars.ContextVar("waiting", default=False)
+
+    _lock = threading.Lock()
+    _operations = {}
+    _tasks = []
+    _api_seconds = 0
+    _waiter_seconds = 0
+
+    @classmethod
+    def attach(cls, client) -> None:
+        service_model = client.meta.service_model
+        service_id = service_model.service_id.hyphenize()
+        service_name = service_model.service_name
+
+        def before_call(model=None, params=None, context=None, **kwargs):
+            body = params.get("body")
+
+            if isinstance(body, dict):
+                body = urlencode(body)
+
+            context["metrics_operation"] = f"{service_name}.{model.name}"
+            context["metrics_start"] = time.perf_counter()
+            context["metrics_sent"] = len(body) if body else 0
+
+        def after_call(
+            http_response=None, parsed=None, context=None, **kwargs
+        ):
+            metadata = parsed.get("ResponseMetadata", {})
+
+            cls._record(
+                context,
+                error=http_response.status_code >= 300,
+                retries=metadata.get("RetryAttempts", 0),
+                received=len(http_response.content or b""),
+            )
+
+        def after_call_error(context=None, **kwargs):
+            cls._record(context, error=True)
+
+        client.meta.events.register(f"before-call.{service_id}", before_call)
+        client.meta.events.register(f"after-call.{service_id}", after_call)
+        client.meta.events.register(
+            f"after-call-error.{service_id}", after_call_error
+        )
+
+    @classmethod
+    @contextlib.contextmanager
+    def task(cls, name: str):
+        """
+        Times a task, the API calls and the waiters in the scope are
+        accounted to it.
+        """
+        timing = {"name": name, "seconds": 0, "api": 0, "waiter": 0}
+        token = cls._task.set(timing)
+        start = time.perf_counter()
+
+        try:
+            yield timing
+        finally:
+            timing["seconds"] = time.perf_counter() - start
+            cls._task.reset(token)
+
+            with cls._lock:
+                cls._tasks.append(timing)
+
+    @classmethod
+    @contextlib.contextmanager
+    def waiting(cls):
+        """
+        Times a waiter, the API calls in the scope are part of its time.
+        """
+        if cls._waiting.get() is True:
+            yield
+            return
+
+        token = cls._waiting.set(True)
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            cls._waiting.reset(token)
+            timing = cls._task.get()
+
+            with cls._lock:
+                cls._waiter_seconds += seconds
+
+                if timing is not None:
+                    timing["waiter"] += seconds
+
+    @classmethod
+    def report(cls) -> dict:
+        """
+        Returns the calls by operation, the time in API calls, in waiters and
+        in local work and the tasks, slowest first.
+        The times are summed across the threads, so they can be greater than
+        the duration of the run.
+        """
+        with cls._lock:
+            operations = {
+                name: dict(operation)
+                for name, operation in cls._operations.items()
+            }
+            tasks = sorted(
+                (dict(timing) for timing in cls._tasks),
+                key=lambda timing: timing.get("seconds"),
+                reverse=True,
+            )
+
+            for timing in tasks:
+                timing["local"] = max(
+                    0,
+                    timing.get("seconds")
+                    - timing.get("api")
+                    - timing.get("waiter"),
+                )
+
+            return {
+                "operations": operations,
+                "api_seconds": cls._api_seconds,
+                "waiter_seconds": cls._waiter_seconds,
+                "local_seconds": sum(timing.get("local") for timing in tasks),
+                "tasks": tasks,
+            }
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._operations = {}
+            cls._tasks = []
+            cls._api_seconds = 0
+            cls._waiter_seconds = 0
+
+    @classmethod
+    def _record(
+        cls,
+        context: dict,
+        error: bool,
+        retries: int = 0,
+        received: int = 0,
+    ) -> None:
+        if "metrics_start" not in context:
+            # the call was answered by a before-call handler.
+            return
+
+        operation_name = context.get("metrics_operation")
+        seconds = time.perf_counter() - context.get("metrics_start")
+        waiting = cls._waiting.get()
+        timing = cls._task.get()
+
+        with cls._lock:
+            operation = cls._operations.setdefault(
+                operation_name,
+                {
+                    "calls": 0,
+                    "errors": 0,
+                    "retries": 0,
+                    "seconds": 0,
+                    "max_seconds": 0,
+                    "sent": 0,
+                    "received": 0,
+                },
+            )
+            operation["calls"] += 1
+            operation["errors"] += 1 if error else 0
+            operation["retries"] += retries
+            operation["seconds"] += seconds
+            operation["max_seconds"] = max(operation["max_seconds"], seconds)
+            operation["sent"] += context.get("metrics_sent", 0)
+            operation["received"] += received
+
+            if waiting is False:
+                cls._api_seconds += seconds
+
+                if timing is not None:
+                    timing["api"] += seconds
+
+
+def log_report(top: int = None) -> None:
+    """
+    Logs the API calls, where the time of the tasks went and the calls of
+    each operation, the slowest first, and the tasks. If top is given only
+    the top slowest operations and tasks are logged.
+    """
+    report = ApiMetrics.report()
+    operations = report.get("operations")
+
+    Logger.info(
+        f"API calls: {sum(op.get('calls') for op in operations.values())}, "
+        f"errors: {sum(op.get('errors') for op in operations.values())}, "
+        f"retries: {sum(op.get('retries') for op in operations.values())}"
+    )
+    Logger.info(
+        f"Time in API calls {report.get('api_seconds'):.1f}s, "
+        f"in waiters {report.get('waiter_seconds'):.1f}s, "
+        f"in local work {report.get('local_seconds'):.1f}s"
+    )
+
+    slowest_operations = sorted(
+        operations.items(),
+        key=lambda item: item[1].get("seconds"),
+        reverse=True,
+    )
+
+    for name, operation in slowest_operations[:top]:
+        Logger.info(
+            f"Operation {name}: {operation.get('calls')} calls, "
+            f"{operation.get('seconds'):.1f}s, "
+            f"max {operation.get('max_seconds'):.1f}s, "
+            f"{operation.get('sent')} bytes sent, "
+            f"{operation.get('received')} bytes received"
+        )
+
+    for timing in report.get("tasks")[:top]:
+        Logger.info(
+            f"Task {timing.get('name')}: {timing.get('seconds'):.1f}s, "
+            f"API calls {timing.get('api'):.1f}s, "
+            f"waiters {timing.get('waiter'):.1f}s, "
+            f"local work {timing.get('local'):.1f}s"
+        )
+
+
+def log_run_report() -> None:
+    """
+    Logs the end of run report: the AWS clients, the time to ready of the
+    waited resources, the throttling of each service and region and the API
+    calls.
+    """
+    # the client and waiter modules import this module.
+    from com.maxmin.aws.client import ClientRegistry
+    from com.maxmin.aws.waiter import WaiterStats
+
+    client_stats = ClientRegistry.stats()
+
+    Logger.info(
+        f"AWS clients created: {client_stats.get('clients_created')}, "
+        f"reused: {client_stats.get('clients_reused')}, "
+        f"connections opened: {client_stats.get('connections_opened')}"
+    )
+
+    for waiter_name, waiter_stats in WaiterStats.report().items():
+        Logger.info(
+            f"Waiter {waiter_name}: {waiter_stats.get('count')} resources, "
+            f"time to ready p50 {waiter_stats.get('p50'):.1f}s, "
+            f"p90 {waiter_stats.get('p90'):.1f}s, "
+            f"max {waiter_stats.get('max'):.1f}s"
+        )
+
+    for service_region, api_stats in RateLimiter.stats().items():
+        Logger.info(
+            f"API {service_region}: {api_stats.get('requests')} requests, "
+            f"throttled: {api_stats.get('throttles')}, "
+            f"retried: {api_stats.get('retries')}, "
+            f"waited for the rate limit {api_stats.get('waited'):.1f}s"
+        )
+
+    log_report()
@@ -0,0 +1,369 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+
+Computes the actions startup.py would perform, without changing anything.
+"""
+import argparse
+import json
+import sys
+
+from com.maxmin.aws.client import ClientRegistry
+from com.maxmin.aws.configuration import ApplicationConfig
+from com.maxmin.aws.constants import ProjectFiles, Route53Constants
+from com.maxmin.aws.ec2.dao.inventory import Inventory
+from com.maxmin.aws.ec2.dao.security_group import RuleReconciler
+from com.maxmin.aws.logs import Logger
+from com.maxmin.aws.route53.dao.hosted_zone import HostedZone
+from com.maxmin.aws.route53.dao.zone_index import ZoneIndex
+
+CREATE = "create"
+UPDATE = "update"
+DELETE = "delete"
+ERROR = "error"
+
+
+class Plan(object):
+    """
+    List of the actions needed to make the datacenter match the
+    configuration.
+    """
+
+    def __init__(self):
+        self.actions = []
+
+    def add(
+        self, action: str, resource: str, name: str, details: dict = None
+    ) -> None:
+        self.actions.append(
+            {
+                "action": action,
+                "resource": resource,
+                "name": name,
+                "details": details if details is not None else {},
+            }
+        )
+
+    @property
+    def changes(self) -> int:
+        return len(
+            [
+                action
+                for action in self.actions
+                if action.get("action") != ERROR
+            ]
+        )
+
+    @property
+    def errors(self) -> int:
+        return len(self.actions) - self.changes
+
+    def to_dict(self) -> dict:
+        return {
+            "changes": self.changes,
+            "errors": self.errors,
+            "actions": self.actions,
+        }
+
+
+class Planner(object):
+    """
+    Compares the configuration with a bulk snapshot of the datacenter: one
+    describe call per EC2 resource type and the listing of the hosted zone.
+    """
+
+    def __init__(self, application_config: ApplicationConfig, inventory=None):
+        """
+        If an inventory is given, it must have been refreshed already.
+        """
+        self.application_config = application_config
+        self.inventory = inventory
+        self.zone_index = None
+
+    def plan(self) -> Plan:
+        if self.inventory is None:
+            self.inventory = Inventory()
+            self.inventory.refresh(self.application_config)
+
+        hosted_zone = HostedZone(Route53Constants().registered_domain)
+
+        if hosted_zone.load() is True:
+            self.zone_index = ZoneIndex(hosted_zone.id)
+            self.zone_index.refresh()
+
+        plan = Plan()
+
+        vpc = self._plan_vpc(plan)
+        internet_gateway = self._plan_internet_gateway(plan, vpc)
+        route_table = self._plan_route_table(plan, internet_gateway)
+        self._plan_subnets(plan, route_table)
+        self._plan_security_groups(plan)
+        self._plan_keypairs(plan)
+        self._plan_instances(plan)
+        self._plan_records(plan, hosted_zone)
+
+        return plan
+
+    def _find(self, resource_type: str, name: str):
+        """
+        Returns the first resource with the name, None if not found.
+        """
+        resources = self.inventory.find(resource_type, name)
+
+        return resources[0] if resources else None
+
+    def _plan_vpc(self, plan: Plan):
+        vpc_config = self.application_config.vpc
+        vpc = self._find(Inventory.VPCS, vpc_config.name)
+
+        if vpc is None:
+            plan.add(CREATE, "vpc", vpc_config.name, {"cidr": vpc_config.cidr})
+
+        return vpc
+
+    def _plan_internet_gateway(self, plan: Plan, vpc):
+        name = self.application_config.internet_gateway
+        internet_gateway = self._find(Inventory.INTERNET_GATEWAYS, name)
+
+        if internet_gateway is None:
+            plan.add(CREATE, "internet_gateway", name)
+
+        attached = (
+            vpc is not None
+            and internet_gateway is not None
+            and any(
+                attachment.get("State") == "available"
+                and attachment.get("VpcId") == vpc.get("VpcId")
+                for attachment in internet_gateway.get("Attachments", [])
+            )
+        )
+
+        if attached is False:
+            plan.add(
+                UPDATE,
+                "internet_gateway",
+                name,
+                {"attach_to": self.application_config.vpc.name},
+            )
+
+        return internet_gateway
+
+    def _plan_route_table(self, plan: Plan, internet_gateway):
+        name = self.application_config.route_table
+        route_table = self._find(Inventory.ROUTE_TABLES, name)
+
+        if route_table is None:
+            plan.add(CREATE, "route_table", name)
+
+        routed = (
+            route_table is not None
+            and internet_gateway is not None
+            and any(
+                route.get("GatewayId")
+                == internet_gateway.get("InternetGatewayId")
+                and route.get("DestinationCidrBlock") == "0.0.0.0/0"
+                for route in route_table.get("Routes", [])
+            )
+        )
+
+        if routed is False:
+            plan.add(
+                UPDATE,
+                "route_table",
+                name,
+                {
+                    "route": "0.0.0.0/0",
+                    "gateway": self.application_config.internet_gateway,
+                },
+            )
+
+        return route_table
+
+    def _plan_subnets(self, plan: Plan, route_table) -> None:
+        associated_subnet_ids = set()
+
+        if route_table is not None:
+            associated_subnet_ids = set(
+                association.get("SubnetId")
+                for association in route_table.get("Associations", [])
+            )
+
+        for subnet_config in self.application_config.subnets:
+            subnet = self._find(Inventory.SUBNETS, subnet_config.name)
+
+            if subnet is None:
+                plan.add(
+                    CREATE,
+                    "subnet",
+                    subnet_config.name,
+                    {"az": subnet_config.az, "cidr": subnet_config.cidr},
+                )
+
+            if (
+                subnet is None
+                or subnet.get("SubnetId") not in associated_subnet_ids
+            ):
+                plan.add(
+                    UPDATE,
+                    "subnet",
+                    subnet_config.name,
+                    {"associate_to": self.application_config.route_table},
+                )
+
+    def _plan_security_groups(self, plan: Plan) -> None:
+        for security_group_config in self.application_config.security_groups:
+            security_group = self._find(
+                Inventory.SECURITY_GROUPS, security_group_config.name
+            )
+
+            if security_group is None:
+                plan.add(
+                    CREATE,
+                    "security_group",
+                    security_group_config.name,
+                    {"description": security_group_config.description},
+                )
+                live_rules = set()
+            else:
+                live_rules = RuleReconciler.rules_of(
+                    security_group.get("IpPermissions", [])
+                )
+
+            configured_rules = set(
+                RuleReconciler.rule_of_config(rule_config)
+                for rule_config in security_group_config.rules
+            )
+            missing_rules, stale_rules, described_rules = RuleReconciler.diff(
+                live_rules, configured_rules
+            )
+
+            if (
+                len(missing_rules) > 0
+                or len(stale_rules) > 0
+                or len(described_rules) > 0
+            ):
+                plan.add(
+                    UPDATE,
+                    "security_group",
+                    security_group_config.name,
+                    {
+                        "authorize": RuleReconciler.permissions_of(
+                            missing_rules
+                        ),
+                        "revoke": RuleReconciler.permissions_of(stale_rules),
+                        "describe": RuleReconciler.permissions_of(
+                            described_rules
+                        ),
+                    },
+                )
+
+    def _plan_keypairs(self, plan: Plan) -> None:
+        names = []
+
+        for instance_config in self.application_config.instances:
+            if instance_config.keypair not in names:
+                names.append(instance_config.keypair)
+
+        for name in names:
+            if self._find(Inventory.KEY_PAIRS, name) is None:
+                plan.add(CREATE, "keypair", name)
+
+    def _plan_instances(self, plan: Plan) -> None:
+        for instance_config in self.application_config.instances:
+            instance = self._find(Inventory.INSTANCES, instance_config.name)
+
+            if instance is None:
+                plan.add(
+                    CREATE,
+                    "instance",
+                    instance_config.name,
+                    {
+                        "parent_image": instance_config.parent_img,
+                        "subnet": instance_config.subnet,
+                        "private_ip": instance_config.private_ip,
+                    },
+                )
+            elif instance.get("State").get("Name") == "terminated":
+                plan.add(
+                    ERROR,
+                    "instance",
+                    instance_config.name,
+                    {"reason": "The instance is terminated."},
+                )
+
+    def _plan_records(self, plan: Plan, hosted_zone: HostedZone) -> None:
+        for instance_config in self.application_config.instances:
+            if self.zone_index is None:
+                plan.add(
+                    ERROR,
+                    "record",
+                    instance_config.dns_name,
+                    {"reason": f"Hosted zone {hosted_zone.name} not found."},
+                )
+            elif self.zone_index.find(instance_config.dns_name) is None:
+                plan.add(CREATE, "record", instance_config.dns_name)
+
+
+def print_plan(plan: Plan) -> None:
+    for action in plan.actions:
+        Logger.info(
+            f"{action.get('action')} {action.get('resource')} "
+            f"{action.get('name')}"
+        )
+
+    Logger.info(f"Plan: {plan.changes} changes, {plan.errors} errors.")
+
+
+def main(args: list = None) -> int:
+    """
+    Writes the plan as JSON to the output file or to stdout, the log is
+    written to stderr so stdout holds only the plan.
+    Returns 1 if there are errors, 2 if there are changes and --exit-code
+    is given, 0 otherwise.
+    """
+    parser = argparse.ArgumentParser(
+        description="Shows the changes startup.py would make."
+    )
+    parser.add_argument(
+        "config_file", nargs="?", default=ProjectFiles.DEFAULT_CONFIG_FILE
+    )
+    parser.add_argument(
+        "--output", help="file where the plan is written as JSON"
+    )
+    parser.add_argument(
+        "--exit-code",
+        action="store_true",
+        help="exit with status 2 if there are changes",
+    )
+    arguments = parser.parse_args(args)
+
+    Logger.configure(output="stderr")
+
+    application_config = ApplicationConfig(arguments.config_file)
+
+    with ClientRegistry.region_scope(application_config.vpc.region):
+        plan = Planner(application_config).plan()
+
+    print_plan(plan)
+
+    # the log lines are written before the plan.
+    Logger.flush()
+
+    if arguments.output is not None:
+        with open(arguments.output, "w") as file:
+            json.dump(plan.to_dict(), file, indent=2)
+    else:
+        print(json.dumps(plan.to_dict(), indent=2))
+
+    if plan.errors > 0:
+        return 1
+
+    if arguments.exit_code is True and plan.changes > 0:
+        return 2
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
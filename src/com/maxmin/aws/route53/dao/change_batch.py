@@ -0,0 +1,144 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+from com.maxmin.aws.client import Route53
+from com.maxmin.aws.exception import AwsException
+from com.maxmin.aws.logs import Logger
+from com.maxmin.aws.route53.dao.zone_index import ZoneIndex
+from com.maxmin.aws.tracing import traced
+from com.maxmin.aws.waiter import AdaptiveWaiter
+
+# maximum number of changes in a change_resource_record_sets call.
+MAX_CHANGES = 1000
+
+# an UPSERT counts as a DELETE and a CREATE in the change limit.
+CHANGE_WEIGHTS = {"CREATE": 1, "DELETE": 1, "UPSERT": 2}
+
+
+class ChangeBatch(Route53):
+    """
+    Accumulates the changes to the A records of a hosted zone and submits
+    them with as few calls as the API limits allow, waiting once for each
+    call.
+    """
+
+    def __init__(self, hosted_zone_id: str, max_changes: int = MAX_CHANGES):
+        super().__init__()
+        self.hosted_zone_id = hosted_zone_id
+        self.max_changes = max_changes
+        self.changes = []
+
+    def create(self, dns_name: str, ip_address: str) -> None:
+        self._add("CREATE", self._a_record(dns_name, ip_address))
+
+    def upsert(self, dns_name: str, ip_address: str) -> None:
+        self._add("UPSERT", self._a_record(dns_name, ip_address))
+
+    def delete(self, record_set: dict) -> None:
+        """
+        Deletes the record set as loaded, Route53 deletes a record set only
+        if the type, TTL and values match the existing ones and a mismatch
+        fails all the changes of the batch.
+        """
+        self._add("DELETE", dict(record_set))
+
+    @traced()
+    def submit(self) -> int:
+        """
+        Submits the changes accumulated and waits until they are propagated.
+        Returns the number of calls made.
+        """
+        batches = self._split()
+        change_ids = []
+
+        try:
+            for batch in batches:
+                change_ids.append(
+                    self.route53.change_resource_record_sets(
+                        HostedZoneId=self.hosted_zone_id,
+                        ChangeBatch={"Changes": batch},
+                    )
+                    .get("ChangeInfo")
+                    .get("Id")
+                )
+
+            waiter = AdaptiveWaiter(
+                self.route53, "resource_record_sets_changed"
+            )
+
+            for change_id in change_ids:
+                waiter.wait(Id=change_id)
+        except Exception as e:
+            Logger.error(str(e))
+            raise AwsException("Error submitting the DNS changes!")
+        finally:
+            self._update_index(
+                [
+                    change
+                    for batch in batches[: len(change_ids)]
+                    for change in batch
+                ]
+            )
+
+        self.changes = []
+
+        Logger.debug(
+            "%d DNS changes submitted in %d batches!",
+            sum(len(batch) for batch in batches),
+            len(batches),
+        )
+
+        return len(batches)
+
+    def _add(self, action: str, record_set: dict) -> None:
+        self.changes.append(
+            {"Action": action, "ResourceRecordSet": record_set}
+        )
+
+    @staticmethod
+    def _a_record(dns_name: str, ip_address: str) -> dict:
+        return {
+            "Name": dns_name,
+            "Type": "A",
+            "TTL": 300,
+            "ResourceRecords": [{"Value": ip_address}],
+        }
+
+    def _split(self) -> list:
+        batches = []
+        batch = []
+        weight = 0
+
+        for change in self.changes:
+            change_weight = CHANGE_WEIGHTS.get(change.get("Action"))
+
+            if weight + change_weight > self.max_changes:
+                batches.append(batch)
+                batch = []
+                weight = 0
+
+            batch.append(change)
+            weight += change_weight
+
+        if len(batch) > 0:
+            batches.append(batch)
+
+        return batches
+
+    def _update_index(self, changes: list) -> None:
+        zone_index = ZoneIndex.get(self.hosted_zone_id)
+
+        if zone_index is None:
+            return
+
+        for change in changes:
+            record_set = change.get("ResourceRecordSet")
+
+            if change.get("Action") == "DELETE":
+                zone_index.remove(
+                    record_set.get("Name"), record_set.get("Type")
+                )
+            else:
+                zone_index.put(record_set)
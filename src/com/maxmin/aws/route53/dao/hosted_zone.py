@@ -4,8 +4,10 @@ Created on Apr 10, 2023
 @author: vagrant
 """
 
+from com.maxmin.aws.cache import cached_load
 from com.maxmin.aws.client import Route53
 from com.maxmin.aws.exception import AwsException
+from com.maxmin.aws.tracing import traced
 
 
 class HostedZone(Route53):
@@ -18,15 +20,14 @@ class HostedZone(Route53):
         self.name = name
         self.id = None
 
+    @traced()
     def load(self) -> bool:
         """
         Loads the hosted zone data, returns True if a hosted zone is found,
         False otherwise.
         """
 
-        response = self.route53.list_hosted_zones_by_name(
-            DNSName=self.name,
-        ).get("HostedZones")
+        response = self._describe()
 
         if len(response) > 1:
             raise AwsException("Found more than 1 hosted zone!")
@@ -37,3 +38,9 @@ class HostedZone(Route53):
             self.id = response[0].get("Id")
 
             return True
+
+    @cached_load("hosted_zone")
+    def _describe(self) -> list:
+        return self.route53.list_hosted_zones_by_name(
+            DNSName=self.name,
+        ).get("HostedZones")
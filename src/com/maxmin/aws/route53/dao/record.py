@@ -3,11 +3,16 @@ Created on Apr 9, 2023
 
 @author: vagrant
 """
-import re
-
 from com.maxmin.aws.client import Route53
 from com.maxmin.aws.exception import AwsException
 from com.maxmin.aws.logs import Logger
+from com.maxmin.aws.route53.dao.zone_index import ZoneIndex, normalize_name
+from com.maxmin.aws.tracing import traced
+from com.maxmin.aws.waiter import AdaptiveWaiter
+
+# records returned by the seek call, they are enough to hold all the types
+# of a name.
+SEEK_PAGE_SIZE = "20"
 
 
 class Record(Route53):
@@ -21,31 +26,33 @@ class Record(Route53):
         self.dns_name = dns_name
         self.ip_address = None
         self.type = None
+        # the record set as returned by Route53.
+        self.record_set = None
 
+    @traced()
     def load(self) -> bool:
         """
         Loads the DNS record data, returns True if a record is found, False
         otherwise.
         """
 
-        records = self.route53.list_resource_record_sets(
-            HostedZoneId=self.hosted_zone_id
-        ).get("ResourceRecordSets")
+        zone_index = ZoneIndex.get(self.hosted_zone_id)
 
-        p = re.compile(self.dns_name + "[.]?")
+        if zone_index is not None:
+            record = zone_index.find(self.dns_name)
+        else:
+            record = self._seek()
 
-        if len(records) > 0:
-            for record in records:
-                if p.match(record.get("Name")):
-                    self.type = record.get("Type")
-                    self.ip_address = record.get("ResourceRecords")[0].get(
-                        "Value"
-                    )
+        if record is None:
+            return False
 
-                    return True
+        self.record_set = record
+        self.type = record.get("Type")
+        self.ip_address = record.get("ResourceRecords")[0].get("Value")
 
-        return False
+        return True
 
+    @traced()
     def create(self, ip_address: str) -> None:
         """
         Creates a route53 DNS record.
@@ -80,9 +87,23 @@ class Record(Route53):
             Logger.error(str(e))
             raise AwsException("Error creating the record!")
 
-        waiter = self.route53.get_waiter("resource_record_sets_changed")
-        waiter.wait(Id=response)
+        AdaptiveWaiter(self.route53, "resource_record_sets_changed").wait(
+            Id=response
+        )
 
+        zone_index = ZoneIndex.get(self.hosted_zone_id)
+
+        if zone_index is not None:
+            zone_index.put(
+                {
+                    "Name": self.dns_name,
+                    "Type": "A",
+                    "TTL": 300,
+                    "ResourceRecords": [{"Value": ip_address}],
+                }
+            )
+
+    @traced()
     def delete(self, ip_address: str) -> None:
         """
         Deletes a route53 DNS record.
@@ -108,3 +129,30 @@ class Record(Route53):
         except Exception as e:
             Logger.error(str(e))
             raise AwsException("Error deleting the record!")
+
+        zone_index = ZoneIndex.get(self.hosted_zone_id)
+
+        if zone_index is not None:
+            zone_index.remove(self.dns_name, "A")
+
+    def _seek(self):
+        """
+        Seeks the zone to the record name, returns the record with the exact
+        name, preferably an A record, None if not found.
+        """
+        name = normalize_name(self.dns_name)
+        records = [
+            record
+            for record in self.route53.list_resource_record_sets(
+                HostedZoneId=self.hosted_zone_id,
+                StartRecordName=self.dns_name,
+                MaxItems=SEEK_PAGE_SIZE,
+            ).get("ResourceRecordSets")
+            if normalize_name(record.get("Name")) == name
+        ]
+
+        for record in records:
+            if record.get("Type") == "A":
+                return record
+
+        return records[0] if len(records) > 0 else None
@@ -0,0 +1,154 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+import re
+import threading
+
+from com.maxmin.aws.client import Route53
+from com.maxmin.aws.logs import Logger
+from com.maxmin.aws.tracing import traced
+
+# Route53 returns the special characters of the names as octal escapes.
+OCTAL_ESCAPE = re.compile(r"\\([0-7]{3})")
+
+
+def normalize_name(dns_name: str) -> str:
+    """
+    Returns the name lowercase, without the trailing dot and with the octal
+    escapes decoded, e.g. '\\052.Maxmin.it.' becomes '*.maxmin.it'.
+    """
+    dns_name = OCTAL_ESCAPE.sub(
+        lambda match: chr(int(match.group(1), 8)), dns_name
+    )
+
+    return dns_name.rstrip(".").lower()
+
+
+class ZoneIndex(Route53):
+    """
+    Index of all the records of a hosted zone, keyed by normalized name and
+    type.
+    The zone is paged through once, the records created or deleted by the
+    Record objects afterwards are kept in the index.
+    """
+
+    _active = {}
+    _active_lock = threading.Lock()
+
+    def __init__(self, hosted_zone_id: str, page_size: int = 300):
+        super().__init__()
+        self.hosted_zone_id = hosted_zone_id
+        self.page_size = page_size
+        self._lock = threading.Lock()
+        self._records = {}
+        self._names = {}
+
+    @traced()
+    def refresh(self) -> None:
+        """
+        Pages through all the records of the zone.
+        """
+        records = {}
+        names = {}
+        arguments = {
+            "HostedZoneId": self.hosted_zone_id,
+            "MaxItems": str(self.page_size),
+        }
+
+        while True:
+            response = self.route53.list_resource_record_sets(**arguments)
+
+            for record_set in response.get("ResourceRecordSets"):
+                key = (
+                    normalize_name(record_set.get("Name")),
+                    record_set.get("Type"),
+                )
+                records[key] = record_set
+                names.setdefault(key[0], []).append(key[1])
+
+            if response.get("IsTruncated") is not True:
+                break
+
+            arguments["StartRecordName"] = response.get("NextRecordName")
+            arguments["StartRecordType"] = response.get("NextRecordType")
+
+            if response.get("NextRecordIdentifier") is not None:
+                arguments["StartRecordIdentifier"] = response.get(
+                    "NextRecordIdentifier"
+                )
+            else:
+                arguments.pop("StartRecordIdentifier", None)
+
+        with self._lock:
+            self._records = records
+            self._names = names
+
+        Logger.debug("Zone index refreshed, %d records found!", len(records))
+
+    def find(self, dns_name: str, record_type: str = None):
+        """
+        Returns the record with the name and type, if the type is not given
+        an A record is preferred. Returns None if not found.
+        """
+        name = normalize_name(dns_name)
+
+        with self._lock:
+            if record_type is not None:
+                return self._records.get((name, record_type))
+
+            types = self._names.get(name, [])
+
+            if len(types) == 0:
+                return None
+
+            if "A" in types:
+                return self._records.get((name, "A"))
+
+            return self._records.get((name, types[0]))
+
+    def put(self, record_set: dict) -> None:
+        """
+        Adds or replaces a record in the index.
+        """
+        key = (normalize_name(record_set.get("Name")), record_set.get("Type"))
+
+        with self._lock:
+            if key not in self._records:
+                self._names.setdefault(key[0], []).append(key[1])
+
+            self._records[key] = record_set
+
+    def remove(self, dns_name: str, record_type: str) -> None:
+        """
+        Removes a record from the index.
+        """
+        key = (normalize_name(dns_name), record_type)
+
+        with self._lock:
+            if self._records.pop(key, None) is not None:
+                self._names.get(key[0]).remove(record_type)
+
+    def __len__(self):
+        return len(self._records)
+
+    @classmethod
+    def activate(cls, zone_index) -> None:
+        """
+        Makes the Record objects of the zone look up their data in the index.
+        """
+        with cls._active_lock:
+            cls._active[zone_index.hosted_zone_id] = zone_index
+
+    @classmethod
+    def deactivate(cls) -> None:
+        with cls._active_lock:
+            cls._active = {}
+
+    @classmethod
+    def get(cls, hosted_zone_id: str):
+        """
+        Returns the active index of the zone, None if there isn't one.
+        """
+        return cls._active.get(hosted_zone_id)
@@ -0,0 +1,409 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+import ipaddress
+
+
+class Field(object):
+    """
+    A value of the configuration, of the given type, in the given format.
+    """
+
+    def __init__(
+        self, value_type: type, required: bool = True, value_format=None
+    ):
+        self.value_type = value_type
+        self.required = required
+        self.value_format = value_format
+
+
+class Object(object):
+    """
+    A JSON object with the given fields, the others are ignored.
+    """
+
+    def __init__(self, fields: dict, required: bool = True):
+        self.fields = fields
+        self.required = required
+
+
+class ListOf(object):
+    """
+    A JSON array of items of the given schema.
+    """
+
+    def __init__(self, item, required: bool = True):
+        self.item = item
+        self.required = required
+
+
+def _cidr(value: str) -> None:
+    ipaddress.ip_network(value)
+
+
+def _ip(value: str) -> None:
+    ipaddress.ip_address(value)
+
+
+def _port(value: int) -> None:
+    if value < -1 or value > 65535:
+        raise ValueError(f"port {value} out of range")
+
+
+TAG = Object({"Key": Field(str), "Value": Field(str)})
+
+RULE = Object(
+    {
+        "FromPort": Field(int, value_format=_port),
+        "ToPort": Field(int, value_format=_port),
+        "Protocol": Field(str),
+        "Cidr": Field(str, required=False, value_format=_cidr),
+        "SgpId": Field(str, required=False),
+        "Description": Field(str, required=False),
+    }
+)
+
+DATACENTER_SCHEMA = Object(
+    {
+        "Datacenter": Object(
+            {
+                "Name": Field(str),
+                "Description": Field(str, required=False),
+                "Cidr": Field(str, value_format=_cidr),
+                "DnsName": Field(str, required=False, value_format=_ip),
+                "Gateway": Field(str, required=False),
+                "Region": Field(str),
+                "InternetGateway": Field(str),
+                "RouteTable": Field(str),
+                "Subnets": ListOf(
+                    Object(
+                        {
+                            "Name": Field(str),
+                            "Description": Field(str, required=False),
+                            "Az": Field(str),
+                            "Cidr": Field(str, value_format=_cidr),
+                        }
+                    )
+                ),
+                "SecurityGroups": ListOf(
+                    Object(
+                        {
+                            "Name": Field(str),
+                            "Description": Field(str),
+                            "Rules": ListOf(RULE),
+                        }
+                    )
+                ),
+                "Instances": ListOf(
+                    Object(
+                        {
+                            "UserName": Field(str),
+                            "UserPassword": Field(str),
+                            "PrivateIp": Field(str, value_format=_ip),
+                            "DnsName": Field(str),
+                            "Hostname": Field(str),
+                            "SecurityGroup": Field(str),
+                            "Subnet": Field(str),
+                            "Keypair": Field(str),
+                            "ParentImage": Field(str),
+                            "TargetImage": Field(str, required=False),
+                            "Tags": ListOf(TAG),
+                        }
+                    )
+                ),
+            }
+        )
+    }
+)
+
+
+def compile_schema(schema):
+    """
+    Returns a function that checks a value against the schema, the function
+    is called with the value, its path and the list where the errors are
+    appended.
+    """
+    if isinstance(schema, Object):
+        fields = [
+            (name, field.required, compile_schema(field))
+            for name, field in schema.fields.items()
+        ]
+
+        def check_object(value, path: str, errors: list) -> None:
+            if not isinstance(value, dict):
+                errors.append(f"{path}: an object is expected")
+                return
+
+            for name, required, check in fields:
+                if name in value:
+                    check(value[name], f"{path}.{name}", errors)
+                elif required:
+                    errors.append(f"{path}.{name}: missing")
+
+        return check_object
+
+    if isinstance(schema, ListOf):
+        check_item = compile_schema(schema.item)
+
+        def check_list(value, path: str, errors: list) -> None:
+            if not isinstance(value, list):
+                errors.append(f"{path}: an array is expected")
+                return
+
+            for i, item in enumerate(value):
+                check_item(item, f"{path}[{i}]", errors)
+
+        return check_list
+
+    value_type = schema.value_type
+    value_format = schema.value_format
+
+    def check_field(value, path: str, errors: list) -> None:
+        # bool is a subclass of int, it is not a valid number.
+        if not isinstance(value, value_type) or isinstance(value, bool):
+            errors.append(f"{path}: {value_type.__name__} expected")
+            return
+
+        if value_format is not None:
+            try:
+                value_format(value)
+            except ValueError as e:
+                errors.append(f"{path}: {e}")
+
+    return check_field
+
+
+class ConfigValidator(object):
+    """
+    Validates a datacenter configuration before any API call: the types of
+    the values, the references of the instances to the subnets and the
+    security groups, the CIDR blocks of the subnets in the one of the vpc and
+    the private IPs of the instances in the ones of their subnets.
+    The entries of the sections can be checked one at a time, as they are
+    read, only what the references need is kept.
+    """
+
+    SECTIONS = ("Subnets", "SecurityGroups", "Instances")
+
+    # the schema is compiled once, when the module is loaded.
+    _check = staticmethod(compile_schema(DATACENTER_SCHEMA))
+    _check_entry = {
+        section: compile_schema(
+            DATACENTER_SCHEMA.fields.get("Datacenter").fields.get(section).item
+        )
+        for section in SECTIONS
+    }
+
+    def __init__(self):
+        self.errors = []
+        self._vpc_cidr = None
+        # (path, name, cidr) of the subnets.
+        self._subnets = []
+        # (path, name) of the security groups.
+        self._security_groups = []
+        # (path, name, security group, subnet, private ip) of the instances.
+        self._instances = []
+
+    @classmethod
+    def validate(cls, document) -> list:
+        """
+        Returns the errors found, an empty list if the configuration is
+        valid.
+        """
+        validator = cls()
+        datacenter = (
+            document.get("Datacenter") if isinstance(document, dict) else None
+        )
+
+        if not isinstance(datacenter, dict):
+            validator.check_document(document)
+            return validator.errors
+
+        sections = {
+            section: datacenter.get(section)
+            for section in cls.SECTIONS
+            if isinstance(datacenter.get(section), list)
+        }
+        validator.check_document(
+            {
+                **document,
+                "Datacenter": {
+                    **datacenter,
+                    **{section: [] for section in sections},
+                },
+            }
+        )
+
+        for section, entries in sections.items():
+            for index, entry in enumerate(entries):
+                validator.check_entry(section, index, entry)
+
+        return validator.finish()
+
+    def check_document(self, document) -> None:
+        """
+        Checks the document, with the entries of the sections already
+        checked replaced by empty lists.
+        """
+        errors = []
+        self._check(document, "$", errors)
+        self.errors.extend(errors)
+
+        if len(errors) == 0:
+            cidr = document.get("Datacenter").get("Cidr")
+            self._vpc_cidr = ipaddress.ip_network(cidr)
+
+    def check_entry(self, section: str, index: int, entry) -> bool:
+        """
+        Checks an entry of a section, returns True if it is valid.
+        """
+        path = f"$.Datacenter.{section}[{index}]"
+        errors = []
+        self._check_entry.get(section)(entry, path, errors)
+
+        if len(errors) == 0:
+            if section == "Subnets":
+                self._subnets.append(
+                    (
+                        path,
+                        entry.get("Name"),
+                        ipaddress.ip_network(entry.get("Cidr")),
+                    )
+                )
+            elif section == "SecurityGroups":
+                self._security_groups.append((path, entry.get("Name")))
+                self._check_rules(path, entry.get("Rules"), errors)
+            else:
+                tags = {
+                    tag.get("Key"): tag.get("Value")
+                    for tag in entry.get("Tags")
+                }
+                self._instances.append(
+                    (
+                        path,
+                        tags.get("Name"),
+                        entry.get("SecurityGroup"),
+                        entry.get("Subnet"),
+                        ipaddress.ip_address(entry.get("PrivateIp")),
+                    )
+                )
+
+        self.errors.extend(errors)
+
+        return len(errors) == 0
+
+    def finish(self) -> list:
+        """
+        Checks the references between the entries, once all of them are
+        checked, and returns the errors found.
+        """
+        if len(self.errors) == 0:
+            self._check_references(self.errors)
+
+        return self.errors
+
+    @staticmethod
+    def _check_rules(path: str, rules: list, errors: list) -> None:
+        for i, rule in enumerate(rules):
+            rule_path = f"{path}.Rules[{i}]"
+
+            if ("Cidr" in rule) == ("SgpId" in rule):
+                errors.append(f"{rule_path}: one of Cidr, SgpId expected")
+
+            # for icmp the ports are the type and the code.
+            tcp_or_udp = rule.get("Protocol") in ("tcp", "udp")
+
+            if tcp_or_udp and rule.get("FromPort") > rule.get("ToPort"):
+                errors.append(f"{rule_path}: FromPort greater than ToPort")
+
+    def _check_references(self, errors: list) -> None:
+        vpc_cidr = self._vpc_cidr
+        subnets = {}
+
+        for subnet_path, name, cidr in self._subnets:
+            if name in subnets:
+                errors.append(f"{subnet_path}.Name: duplicate subnet {name}")
+
+            if cidr.version != vpc_cidr.version or not cidr.subnet_of(
+                vpc_cidr
+            ):
+                errors.append(
+                    f"{subnet_path}.Cidr: {cidr} not in the vpc {vpc_cidr}"
+                )
+
+            for other_name, other_cidr in subnets.items():
+                if cidr.overlaps(other_cidr):
+                    errors.append(
+                        f"{subnet_path}.Cidr: {cidr} overlaps the subnet "
+                        f"{other_name}"
+                    )
+
+            subnets[name] = cidr
+
+        security_groups = set()
+
+        for group_path, name in self._security_groups:
+            if name in security_groups:
+                errors.append(
+                    f"{group_path}.Name: duplicate security group {name}"
+                )
+
+            security_groups.add(name)
+
+        names = set()
+        private_ips = set()
+
+        for (
+            instance_path,
+            name,
+            security_group,
+            subnet,
+            private_ip,
+        ) in self._instances:
+            if name is None:
+                errors.append(f"{instance_path}.Tags: Name tag missing")
+            elif name in names:
+                errors.append(
+                    f"{instance_path}.Tags: duplicate instance {name}"
+                )
+
+            names.add(name)
+
+            if security_group not in security_groups:
+                errors.append(
+                    f"{instance_path}.SecurityGroup: security group "
+                    f"{security_group} not found"
+                )
+
+            if private_ip in private_ips:
+                errors.append(
+                    f"{instance_path}.PrivateIp: duplicate IP {private_ip}"
+                )
+
+            private_ips.add(private_ip)
+
+            subnet_cidr = subnets.get(subnet)
+
+            if subnet_cidr is None:
+                errors.append(
+                    f"{instance_path}.Subnet: subnet {subnet} not found"
+                )
+            elif self._assignable(private_ip, subnet_cidr) is False:
+                errors.append(
+                    f"{instance_path}.PrivateIp: {private_ip} not assignable "
+                    f"in the subnet {subnet_cidr}"
+                )
+
+    @staticmethod
+    def _assignable(private_ip, subnet_cidr) -> bool:
+        """
+        AWS reserves the first four and the last IP of a subnet.
+        """
+        if private_ip.version != subnet_cidr.version:
+            return False
+
+        offset = int(private_ip) - int(subnet_cidr.network_address)
+
+        return 4 <= offset < subnet_cidr.num_addresses - 1
@@ -1,8 +1,9 @@
-import sys
+import argparse
+import atexit
 
+from com.maxmin.aws.client import ClientRegistry
 from com.maxmin.aws.configuration import ApplicationConfig
-from com.maxmin.aws.constants import ProjectFiles, Route53Constants
-from com.maxmin.aws.ec2.dao import internet_gateway
+from com.maxmin.aws.constants import ProjectFiles
 from com.maxmin.aws.ec2.dao.image import Image
 from com.maxmin.aws.ec2.dao.instance import Instance
 from com.maxmin.aws.ec2.dao.internet_gateway import InternetGateway
@@ -11,96 +12,117 @@ from com.maxmin.aws.ec2.dao.security_group import SecurityGroup
 from com.maxmin.aws.ec2.dao.ssh import Keypair
 from com.maxmin.aws.ec2.dao.subnet import Subnet
 from com.maxmin.aws.ec2.dao.vpc import Vpc
+from com.maxmin.aws.graph import TaskGraph
 from com.maxmin.aws.logs import Logger
+from com.maxmin.aws.metrics import log_run_report
+from com.maxmin.aws.route53.dao.change_batch import ChangeBatch
 from com.maxmin.aws.route53.dao.hosted_zone import HostedZone
 from com.maxmin.aws.route53.dao.record import Record
+from com.maxmin.aws.startup import (
+    DEFAULT_MAX_PARALLEL,
+    load_hosted_zone,
+    load_inventory,
+)
+from com.maxmin.aws.tracing import Tracer
 
-if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        application_config = ApplicationConfig(
-            ProjectFiles.DEFAULT_CONFIG_FILE
-        )
-    else:
-        application_config = ApplicationConfig(sys.argv[1])
-
-    Logger.info("Deleting datacenter ...")
 
-    vpc = Vpc(application_config.vpc.name)
-    vpc_found = vpc.load()
+def load_vpc(vpc_config) -> Vpc:
+    vpc = Vpc(vpc_config.name)
 
-    if vpc_found is False:
+    if vpc.load() is False:
         Logger.warn("Vpc not found!")
 
-    #
-    # Delete the instances
-    #
+    return vpc
 
-    route53Constants = Route53Constants()
-    hosted_zone = HostedZone(route53Constants.registered_domain)
-    hosted_zone.load()
 
-    for instance_config in application_config.instances:
-        instance = Instance(instance_config.tags)
+def load_instance(instance_config) -> Instance:
+    instance = Instance(instance_config.aws_tags())
+    instance.load()
+
+    return instance
+
 
-        found_instance = instance.load()
+def delete_records(instance_configs: list, hosted_zone: HostedZone) -> None:
+    """
+    Deletes the DNS records of the instances in as few change batches as
+    possible.
+    """
+    change_batch = ChangeBatch(hosted_zone.id)
+
+    Logger.info("Deleting DNS records ...")
+
+    for instance_config in instance_configs:
         record = Record(instance_config.dns_name, hosted_zone.id)
-        
-        Logger.info("Deleting DNS record ...")
 
         if record.load() is True:
-            record.delete(instance.public_ip)
-
-            Logger.info("DNS record successfully deleted!")
+            change_batch.delete(record.record_set)
         else:
-            Logger.warn("DNS record already deleted!")
+            Logger.warn(
+                f"DNS record {instance_config.dns_name} already deleted!"
+            )
 
-        if found_instance is True and instance.state != "terminated":
-            Logger.info("Deleting instance ...")
+    records_count = len(change_batch.changes)
 
-            instance.delete()
+    if records_count > 0:
+        change_batch.submit()
 
-            Logger.info("Instance deleted!")
+        Logger.info(f"{records_count} DNS records deleted!")
 
-        else:
-            Logger.warn("Instance already deleted!")
 
-        keypair = Keypair(instance_config.keypair)
+def delete_instances(instances: list) -> None:
+    """
+    Terminates all the running instances together.
+    """
+    running_instances = [
+        instance
+        for instance in instances
+        if instance.id is not None and instance.state != "terminated"
+    ]
 
-        if keypair.load() is True:
-            keypair.delete()
+    if len(running_instances) == 0:
+        Logger.warn("Instances already deleted!")
+        return
 
-        # delete the corresponding AMI
-        if instance_config.target_img is not None:
-            target_image = Image(instance_config.target_img)
+    Logger.info("Deleting instances ...")
 
-            if target_image.load() is True:
-                Logger.info("Deleting target image ...")
+    Instance.delete_all(running_instances)
 
-                target_image.delete()
+    Logger.info(f"{len(running_instances)} instances deleted!")
 
-                Logger.info("Target image deleted!")
-            else:
-                Logger.warn("Target image not found!")
 
-    #
-    # Delete the security groups
-    #
+def delete_keypair(name: str) -> None:
+    keypair = Keypair(name)
 
-    for security_group_config in application_config.security_groups:
-        security_group = SecurityGroup(security_group_config.name)
+    if keypair.load() is True:
+        keypair.delete()
 
-        if security_group.load() is True:
-            security_group.delete()
 
-            Logger.info("Security group deleted!")
-        else:
-            Logger.warn("Security group already deleted!")
+def delete_image(name: str) -> None:
+    target_image = Image(name)
 
-    #
-    # Delete the internet gateway
-    #
+    if target_image.load() is True:
+        Logger.info("Deleting target image ...")
 
-    internet_gateway = InternetGateway(application_config.internet_gateway)
+        target_image.delete()
+
+        Logger.info(f"Target image {name} deleted!")
+    else:
+        Logger.warn(f"Target image {name} not found!")
+
+
+def delete_security_group(name: str) -> None:
+    security_group = SecurityGroup(name)
+
+    if security_group.load() is True:
+        security_group.delete()
+
+        Logger.info(f"Security group {name} deleted!")
+    else:
+        Logger.warn(f"Security group {name} already deleted!")
+
+
+def delete_internet_gateway(name: str, vpc: Vpc) -> None:
+    internet_gateway = InternetGateway(name)
 
     if internet_gateway.load() is True:
         if internet_gateway.is_attached_to(vpc.id):
@@ -112,25 +134,32 @@ if __name__ == "__main__":
     else:
         Logger.warn("internet gateway already deleted!")
 
-    #
-    # Delete the subnets
-    #
 
-    for subnet_config in application_config.subnets:
-        subnet = Subnet(subnet_config.name)
+def delete_subnet(name: str) -> None:
+    subnet = Subnet(name)
 
-        if subnet.load() is True:
-            subnet.delete()
+    if subnet.load() is True:
+        subnet.delete()
 
-            Logger.info("Subnet deleted!")
-        else:
-            Logger.warn("subnet already deleted!")
+        Logger.info(f"Subnet {name} deleted!")
+    else:
+        Logger.warn(f"subnet {name} already deleted!")
+
+
+def disassociate_route_table(name: str) -> None:
+    """
+    Removes the subnet associations before the subnets are deleted, AWS
+    drops the associations of a deleted subnet and the ones loaded from
+    the inventory would not be found anymore.
+    """
+    route_table = RouteTable(name)
+
+    if route_table.load() is True:
+        route_table.disassociate_subnets()
 
-    #
-    # Delete the route table
-    #
 
-    route_table = RouteTable(application_config.route_table)
+def delete_route_table(name: str) -> None:
+    route_table = RouteTable(name)
 
     if route_table.load() is True:
         route_table.delete()
@@ -139,18 +168,170 @@ if __name__ == "__main__":
     else:
         Logger.warn("route table already deleted!")
 
-    #
-    # Delete the vpc
-    #
 
-    vpc = Vpc(application_config.vpc.name)
-    vpc_found = vpc.load()
-
-    if vpc_found is True:
+def delete_vpc(vpc: Vpc) -> None:
+    if vpc.load() is True:
         vpc.delete()
 
         Logger.info("Vpc delete!")
     else:
         Logger.warn("vpc already deleted!")
 
-    Logger.info("Datacenter deleted!")
+
+def build_shutdown_graph(application_config: ApplicationConfig) -> TaskGraph:
+    """
+    Builds the graph of the tasks that delete the datacenter, in the reverse
+    order of creation.
+    All the instances are terminated with one call and awaited together,
+    their DNS records are deleted meanwhile in one change batch, keypairs and
+    images are deleted concurrently once the instances are gone.
+    """
+    graph = TaskGraph()
+
+    graph.add_task("vpc", lambda results: load_vpc(application_config.vpc))
+    graph.add_task("hosted_zone", lambda results: load_hosted_zone())
+
+    instance_tasks = []
+
+    for instance_config in application_config.instances:
+        instance_task = f"instance:{instance_config.name}"
+        instance_tasks.append(instance_task)
+
+        graph.add_task(
+            instance_task,
+            lambda results, config=instance_config: load_instance(config),
+        )
+
+    graph.add_task(
+        "records",
+        lambda results: delete_records(
+            application_config.instances, results.get("hosted_zone")
+        ),
+        ["hosted_zone"],
+    )
+
+    graph.add_task(
+        "instances",
+        lambda results: delete_instances(
+            [results.get(task) for task in instance_tasks]
+        ),
+        instance_tasks,
+    )
+
+    for instance_config in application_config.instances:
+        keypair_task = f"keypair:{instance_config.keypair}"
+
+        if graph.has_task(keypair_task) is False:
+            graph.add_task(
+                keypair_task,
+                lambda results, name=instance_config.keypair: delete_keypair(
+                    name
+                ),
+                ["instances"],
+            )
+
+        image_task = f"image:{instance_config.target_img}"
+
+        if (
+            instance_config.target_img is not None
+            and graph.has_task(image_task) is False
+        ):
+            graph.add_task(
+                image_task,
+                lambda results, name=instance_config.target_img: (
+                    delete_image(name)
+                ),
+                ["instances"],
+            )
+
+    vpc_dependencies = []
+
+    for security_group_config in application_config.security_groups:
+        security_group_task = f"security_group:{security_group_config.name}"
+        vpc_dependencies.append(security_group_task)
+
+        graph.add_task(
+            security_group_task,
+            lambda results, name=security_group_config.name: (
+                delete_security_group(name)
+            ),
+            ["instances"],
+        )
+
+    graph.add_task(
+        "internet_gateway",
+        lambda results: delete_internet_gateway(
+            application_config.internet_gateway, results.get("vpc")
+        ),
+        ["vpc", "instances"],
+    )
+    vpc_dependencies.append("internet_gateway")
+
+    graph.add_task(
+        "route_table_associations",
+        lambda results: disassociate_route_table(
+            application_config.route_table
+        ),
+        ["instances"],
+    )
+
+    subnet_tasks = []
+
+    for subnet_config in application_config.subnets:
+        subnet_task = f"subnet:{subnet_config.name}"
+        subnet_tasks.append(subnet_task)
+
+        graph.add_task(
+            subnet_task,
+            lambda results, name=subnet_config.name: delete_subnet(name),
+            ["route_table_associations"],
+        )
+
+    graph.add_task(
+        "route_table",
+        lambda results: delete_route_table(application_config.route_table),
+        ["route_table_associations"] + subnet_tasks,
+    )
+    vpc_dependencies.append("route_table")
+
+    graph.add_task(
+        "delete_vpc",
+        lambda results: delete_vpc(results.get("vpc")),
+        ["vpc"] + vpc_dependencies,
+    )
+
+    return graph
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Deletes the datacenter.")
+    parser.add_argument(
+        "config_file", nargs="?", default=ProjectFiles.DEFAULT_CONFIG_FILE
+    )
+    parser.add_argument(
+        "--max-parallel",
+        type=int,
+        default=DEFAULT_MAX_PARALLEL,
+        help="maximum number of resources deleted at the same time",
+    )
+    parser.add_argument(
+        "--trace", help="file where the spans of the run are written"
+    )
+    arguments = parser.parse_args()
+
+    if arguments.trace is not None:
+        Tracer.start()
+        # the trace is written also if the run fails.
+        atexit.register(Tracer.export, arguments.trace)
+
+    application_config = ApplicationConfig(arguments.config_file)
+
+    with ClientRegistry.region_scope(application_config.vpc.region):
+        Logger.info("Deleting datacenter ...")
+
+        load_inventory(application_config)
+        build_shutdown_graph(application_config).run(arguments.max_parallel)
+
+        Logger.info("Datacenter deleted!")
+
+    log_run_report()
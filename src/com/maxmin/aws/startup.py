@@ -1,61 +1,115 @@
-import sys
+import argparse
+import atexit
 
-from com.maxmin.aws.configuration import ApplicationConfig, CidrRuleConfig
+from com.maxmin.aws.client import ClientRegistry
+from com.maxmin.aws.configuration import ApplicationConfig
 from com.maxmin.aws.constants import ProjectFiles, Route53Constants
-from com.maxmin.aws.ec2.dao import internet_gateway, instance
-from com.maxmin.aws.ec2.dao.instance import Instance
 from com.maxmin.aws.ec2.dao.internet_gateway import InternetGateway
+from com.maxmin.aws.ec2.dao.inventory import Inventory
 from com.maxmin.aws.ec2.dao.route_table import RouteTable
 from com.maxmin.aws.ec2.dao.security_group import (
     SecurityGroup,
-    CidrRule,
-    SgpRule,
+    RuleReconciler,
 )
 from com.maxmin.aws.ec2.dao.ssh import Keypair
 from com.maxmin.aws.ec2.dao.subnet import Subnet
 from com.maxmin.aws.ec2.dao.vpc import Vpc
 from com.maxmin.aws.ec2.service.instance import InstanceService
-from com.maxmin.aws.exception import AwsException
+from com.maxmin.aws.graph import TaskGraph
 from com.maxmin.aws.logs import Logger
+from com.maxmin.aws.metrics import log_run_report
+from com.maxmin.aws.plan import Planner
+from com.maxmin.aws.route53.dao.change_batch import ChangeBatch
 from com.maxmin.aws.route53.dao.hosted_zone import HostedZone
 from com.maxmin.aws.route53.dao.record import Record
+from com.maxmin.aws.route53.dao.zone_index import ZoneIndex
+from com.maxmin.aws.state import StateStore
+from com.maxmin.aws.tracing import Tracer
 
+DEFAULT_MAX_PARALLEL = 4
 
-if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        application_config = ApplicationConfig(
-            ProjectFiles.DEFAULT_CONFIG_FILE
-        )
-    else:
-        application_config = ApplicationConfig(sys.argv[1])
 
-    Logger.info("Creating datacenter ...")
+def load_inventory(application_config: ApplicationConfig) -> Inventory:
+    """
+    Fetches the datacenter resources in bulk and makes the DAO objects load
+    them from the snapshot.
+    """
+    inventory = Inventory()
+    inventory.refresh(application_config)
+    Inventory.activate(inventory)
+
+    return inventory
+
+
+def load_inventory_by_state(
+    application_config: ApplicationConfig,
+    state: StateStore,
+    fingerprint: str,
+) -> bool:
+    """
+    Fetches the datacenter resources by the ids recorded in the state and
+    makes the DAO objects load them from the snapshot.
+    Returns True if the configuration hasn't changed since the state was
+    saved and the datacenter still matches it, so there is nothing to do.
+    """
+    ids = {}
+
+    if state.load() is True and state.fingerprint == fingerprint:
+        ids = state.resources
+
+    inventory = Inventory()
+    verified = inventory.refresh_by_ids(application_config, ids)
+    Inventory.activate(inventory)
+
+    if len(ids) == 0 or verified is False:
+        return False
 
-    #
-    # Create the vpc
-    #
+    planner = Planner(application_config, inventory)
 
-    vpc = Vpc(application_config.vpc.name)
+    if len(planner.plan().actions) > 0:
+        return False
+
+    for instance_config in application_config.instances:
+        instance = inventory.find(Inventory.INSTANCES, instance_config.name)[0]
+        public_ip = instance.get("PublicIpAddress")
+        record = planner.zone_index.find(instance_config.dns_name)
+
+        if (
+            instance.get("State").get("Name") != "running"
+            or state.records.get(instance_config.name) != public_ip
+            or record.get("ResourceRecords")[0].get("Value") != public_ip
+        ):
+            return False
+
+    return True
+
+
+def create_vpc(vpc_config) -> Vpc:
+    vpc = Vpc(vpc_config.name)
 
     if vpc.load() is False:
-        vpc.create(application_config.vpc.cidr)
+        vpc.create(vpc_config.cidr)
 
-        Logger.info("Vpc created!")
+        Logger.info("Vpc created!", resource="vpc", id=vpc.id)
     else:
         Logger.warn("Vpc already created!")
 
     vpc.load()
 
-    #
-    # Create the Internet gateway
-    #
+    return vpc
 
-    internet_gateway = InternetGateway(application_config.internet_gateway)
+
+def create_internet_gateway(name: str, vpc: Vpc) -> InternetGateway:
+    internet_gateway = InternetGateway(name)
 
     if internet_gateway.load() is False:
         internet_gateway.create()
 
-        Logger.info("Internet gateway created!")
+        Logger.info(
+            "Internet gateway created!",
+            resource="internet_gateway",
+            id=internet_gateway.id,
+        )
     else:
         Logger.warn("Internet gateway already created!")
 
@@ -68,16 +122,20 @@ if __name__ == "__main__":
     else:
         Logger.warn("The internet gateway is already attached to the vpc!")
 
-    #
-    # Create the route table
-    #
+    return internet_gateway
 
-    route_table = RouteTable(application_config.route_table)
+
+def create_route_table(
+    name: str, vpc: Vpc, internet_gateway: InternetGateway
+) -> RouteTable:
+    route_table = RouteTable(name)
 
     if route_table.load() is False:
         route_table.create(vpc.id)
 
-        Logger.info("Route table created!")
+        Logger.info(
+            "Route table created!", resource="route_table", id=route_table.id
+        )
     else:
         Logger.warn("Route table already created!")
 
@@ -90,153 +148,300 @@ if __name__ == "__main__":
     else:
         Logger.warn("Route to the Internet gateway already created!")
 
-    #
-    # Create the subnet
-    #
+    return route_table
 
-    for subnet_config in application_config.subnets:
-        subnet = Subnet(subnet_config.name)
 
-        if subnet.load() is False:
-            subnet.create(subnet_config.az, subnet_config.cidr, vpc.id)
+def create_subnet(subnet_config, vpc: Vpc, route_table: RouteTable) -> Subnet:
+    subnet = Subnet(subnet_config.name)
 
-            Logger.info("Subnet created!")
-        else:
-            Logger.warn("Subnet already created!")
+    if subnet.load() is False:
+        subnet.create(subnet_config.az, subnet_config.cidr, vpc.id)
 
-        route_table.associate_subnet(subnet.id)
+        Logger.info(
+            f"Subnet {subnet_config.name} created!",
+            resource="subnet",
+            id=subnet.id,
+        )
+    else:
+        Logger.warn(f"Subnet {subnet_config.name} already created!")
 
-    #
-    # Create the security group
-    #
+    route_table.associate_subnet(subnet.id)
 
-    for security_group_config in application_config.security_groups:
-        security_group = SecurityGroup(security_group_config.name)
-
-        if security_group.load() is False:
-            security_group.create(security_group_config.description, vpc.id)
-            security_group.load()
-
-            Logger.info("Security group created!")
-
-            rules_config = security_group_config.rules
-
-            for rule_config in rules_config:
-                if isinstance(rule_config, CidrRuleConfig):
-                    cidr_rule = CidrRule(security_group.id)
-
-                    if (
-                        cidr_rule.load(
-                            rule_config.from_port,
-                            rule_config.to_port,
-                            rule_config.protocol,
-                            rule_config.cidr,
-                            rule_config.description,
-                        )
-                        is False
-                    ):
-                        cidr_rule.create(
-                            rule_config.from_port,
-                            rule_config.to_port,
-                            rule_config.protocol,
-                            rule_config.cidr,
-                            rule_config.description,
-                        )
-
-                        Logger.info("Cidr rule created!")
-                    else:
-                        Logger.warn("Cidr rule already created!")
-                else:
-                    sgp_rule = SgpRule(security_group.id)
-
-                    if (
-                        sgp_rule.load(
-                            rule_config.from_port,
-                            rule_config.to_port,
-                            rule_config.protocol,
-                            rule_config.sgp_id,
-                            rule_config.description,
-                        )
-                        is False
-                    ):
-                        sgp_rule.create(
-                            rule_config.from_port,
-                            rule_config.to_port,
-                            rule_config.protocol,
-                            rule_config.cidr,
-                            rule_config.description,
-                        )
-
-                        Logger.info("Sgp rule created!")
-                    else:
-                        Logger.warn("Sgp rule already created!")
-        else:
-            Logger.warn("Security group already created!")
+    return subnet
 
-    #
-    # Create the instances and AMIs.
-    #
 
-    for instance_config in application_config.instances:
-        keypair = Keypair(instance_config.keypair)
+def create_security_group(security_group_config, vpc: Vpc) -> SecurityGroup:
+    security_group = SecurityGroup(security_group_config.name)
 
-        if keypair.load() is False:
-            keypair.create()
+    if security_group.load() is False:
+        security_group.create(security_group_config.description, vpc.id)
+        security_group.load()
 
-            Logger.info("Keypair created!")
-
-            keypair.load()
-        else:
-            Logger.warn("Keypair already created!")
-
-        instance = Instance(instance_config.tags)
-        instance.load()
-
-        if instance.state == "terminated":
-            raise AwsException("The instance is terminated.")
-
-        instance_service = InstanceService()
-        instance_service.create_instance(
-            instance_config.parent_img,
-            instance_config.security_group,
-            instance_config.subnet,
-            instance_config.keypair,
-            instance_config.private_ip,
-            instance_config.hostname,
-            instance_config.username,
-            instance_config.password,
-            instance_config.tags,
+        Logger.info(
+            f"Security group {security_group_config.name} created!",
+            resource="security_group",
+            id=security_group.id,
+        )
+    else:
+        Logger.warn(
+            f"Security group {security_group_config.name} already created!"
         )
 
-        instance.load()
+    authorized_rules, revoked_rules, described_rules = RuleReconciler(
+        security_group.id
+    ).reconcile(security_group_config.rules)
+
+    Logger.info(
+        f"Security group {security_group_config.name} rules authorized: "
+        f"{len(authorized_rules)}, revoked: {len(revoked_rules)}, "
+        f"described: {len(described_rules)}"
+    )
+
+    return security_group
+
+
+def create_keypair(name: str) -> Keypair:
+    keypair = Keypair(name)
 
-        route53Constants = Route53Constants()
-        hosted_zone = HostedZone(route53Constants.registered_domain)
-        hosted_zone.load()
+    if keypair.load() is False:
+        keypair.create()
+
+        Logger.info(f"Keypair {name} created!", resource="keypair")
+
+        keypair.load()
+    else:
+        Logger.warn(f"Keypair {name} already created!")
+
+    return keypair
+
+
+def create_instances(instance_configs: list) -> dict:
+    """
+    Launches all the instances together and waits for them in a single
+    loop, returns the instances keyed by name.
+    """
+    instance_service = InstanceService()
+    instances = instance_service.create_instances(instance_configs)
+
+    # TODO TODO
+    # persist the instance into an AMI
+    # if instance_config.target_img is not None:
+    #    target_image = Image(instance_config.target_img)
+
+    #    if target_image.load() is False:
+    #        Logger.info("Creating target image ...")
+
+    #       instance.stop()
+    #        target_image.create(instance.id, target_image.name)
+
+    #        Logger.info("Target image created!")
+    #    else:
+    #        Logger.warn("Target image not found!")
+
+    return {
+        instance_config.name: instance
+        for instance_config, instance in zip(instance_configs, instances)
+    }
+
+
+def load_hosted_zone() -> HostedZone:
+    """
+    Loads the hosted zone and indexes all its records, the DNS records are
+    then looked up in the index.
+    """
+    route53Constants = Route53Constants()
+    hosted_zone = HostedZone(route53Constants.registered_domain)
+
+    if hosted_zone.load() is True:
+        zone_index = ZoneIndex(hosted_zone.id)
+        zone_index.refresh()
+        ZoneIndex.activate(zone_index)
+
+    return hosted_zone
+
+
+def create_records(
+    instance_configs: list, hosted_zone: HostedZone, instances: dict
+) -> None:
+    """
+    Creates the missing DNS records of the instances in as few change
+    batches as possible.
+    """
+    change_batch = ChangeBatch(hosted_zone.id)
+
+    Logger.info("Creating DNS records ...")
+
+    for instance_config in instance_configs:
         record = Record(instance_config.dns_name, hosted_zone.id)
-        
-        Logger.info("Creating DNS record ...")
 
         if record.load() is False:
-            record.create(instance.public_ip)
-
-            Logger.info("DNS record created!")
+            change_batch.create(
+                instance_config.dns_name,
+                instances.get(instance_config.name).public_ip,
+            )
         else:
-            Logger.warn("DNS record already created!")
+            Logger.warn(
+                f"DNS record {instance_config.dns_name} already created!"
+            )
+
+    records_count = len(change_batch.changes)
+
+    if records_count > 0:
+        change_batch.submit()
+
+        Logger.info(f"{records_count} DNS records created!")
+
+
+def build_startup_graph(application_config: ApplicationConfig) -> TaskGraph:
+    """
+    Builds the graph of the tasks that create the datacenter.
+    Subnets, security groups and keypairs only depend on the vpc, so they are
+    created concurrently, the instances are launched together once the
+    resources they use are ready and their DNS records are submitted
+    together.
+    """
+    graph = TaskGraph()
+
+    graph.add_task(
+        "vpc",
+        lambda results: create_vpc(application_config.vpc),
+    )
+
+    graph.add_task(
+        "internet_gateway",
+        lambda results: create_internet_gateway(
+            application_config.internet_gateway, results.get("vpc")
+        ),
+        ["vpc"],
+    )
+
+    graph.add_task(
+        "route_table",
+        lambda results: create_route_table(
+            application_config.route_table,
+            results.get("vpc"),
+            results.get("internet_gateway"),
+        ),
+        ["vpc", "internet_gateway"],
+    )
+
+    for subnet_config in application_config.subnets:
+        graph.add_task(
+            f"subnet:{subnet_config.name}",
+            lambda results, subnet_config=subnet_config: create_subnet(
+                subnet_config, results.get("vpc"), results.get("route_table")
+            ),
+            ["vpc", "route_table"],
+        )
+
+    for security_group_config in application_config.security_groups:
+        graph.add_task(
+            f"security_group:{security_group_config.name}",
+            lambda results, config=security_group_config: (
+                create_security_group(config, results.get("vpc"))
+            ),
+            ["vpc"],
+        )
 
-        # TODO TODO
-        # persist the instance into an AMI
-        # if instance_config.target_img is not None:
-        #    target_image = Image(instance_config.target_img)
+    graph.add_task("hosted_zone", lambda results: load_hosted_zone())
 
-        #    if target_image.load() is False:
-        #        Logger.info("Creating target image ...")
+    # the instances need the route to the Internet to run cloud-init.
+    instance_dependencies = ["route_table"]
+
+    for instance_config in application_config.instances:
+        keypair_task = f"keypair:{instance_config.keypair}"
+
+        if graph.has_task(keypair_task) is False:
+            graph.add_task(
+                keypair_task,
+                lambda results, name=instance_config.keypair: create_keypair(
+                    name
+                ),
+            )
+
+        for task in (
+            keypair_task,
+            f"subnet:{instance_config.subnet}",
+            f"security_group:{instance_config.security_group}",
+        ):
+            if graph.has_task(task) and task not in instance_dependencies:
+                instance_dependencies.append(task)
+
+    graph.add_task(
+        "instances",
+        lambda results: create_instances(application_config.instances),
+        instance_dependencies,
+    )
+
+    graph.add_task(
+        "records",
+        lambda results: create_records(
+            application_config.instances,
+            results.get("hosted_zone"),
+            results.get("instances"),
+        ),
+        ["hosted_zone", "instances"],
+    )
+
+    return graph
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Creates the datacenter.")
+    parser.add_argument(
+        "config_file", nargs="?", default=ProjectFiles.DEFAULT_CONFIG_FILE
+    )
+    parser.add_argument(
+        "--max-parallel",
+        type=int,
+        default=DEFAULT_MAX_PARALLEL,
+        help="maximum number of resources created at the same time",
+    )
+    parser.add_argument(
+        "--state",
+        action="store_true",
+        help="skip the run if nothing changed since the last one",
+    )
+    parser.add_argument(
+        "--trace", help="file where the spans of the run are written"
+    )
+    arguments = parser.parse_args()
+
+    if arguments.trace is not None:
+        Tracer.start()
+        # the trace is written also if the run fails.
+        atexit.register(Tracer.export, arguments.trace)
+
+    application_config = ApplicationConfig(arguments.config_file)
+
+    with ClientRegistry.region_scope(application_config.vpc.region):
+        Logger.info("Creating datacenter ...")
+
+        up_to_date = False
+
+        if arguments.state is True:
+            state = StateStore(StateStore.path_of(arguments.config_file))
+            fingerprint = StateStore.fingerprint_of(
+                arguments.config_file,
+                ClientRegistry.get_client("ec2").meta.region_name,
+            )
+            up_to_date = load_inventory_by_state(
+                application_config, state, fingerprint
+            )
+        else:
+            load_inventory(application_config)
+
+        if up_to_date is True:
+            Logger.info("Datacenter up to date!")
+        else:
+            results = build_startup_graph(application_config).run(
+                arguments.max_parallel
+            )
 
-        #       instance.stop()
-        #        target_image.create(instance.id, target_image.name)
+            if arguments.state is True:
+                state.update(fingerprint, results)
+                state.save()
 
-        #        Logger.info("Target image created!")
-        #    else:
-        #        Logger.warn("Target image not found!")
+            Logger.info("Datacenter created!")
 
-    Logger.info("Datacenter created!")
+    log_run_report()
@@ -0,0 +1,131 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+import hashlib
+import json
+import os
+
+from com.maxmin.aws.constants import ProjectDirectories
+from com.maxmin.aws.ec2.dao.inventory import Inventory
+from com.maxmin.aws.logs import Logger
+
+
+class StateStore(object):
+    """
+    Local JSON file with the ids of the resources created by the last run
+    and the fingerprint of the configuration that produced them.
+    """
+
+    VERSION = 1
+
+    def __init__(self, state_file: str):
+        self.state_file = state_file
+        self.fingerprint = None
+        self.resources = {}
+        self.records = {}
+
+    @staticmethod
+    def path_of(config_file: str) -> str:
+        """
+        Returns the state file of a configuration file.
+        """
+        name = os.path.splitext(os.path.basename(str(config_file)))[0]
+
+        return f"{ProjectDirectories.STATE_DIR}/{name}.state.json"
+
+    @staticmethod
+    def fingerprint_of(config_file: str, region: str) -> str:
+        """
+        Returns the hash of the configuration file content and the region.
+        """
+        digest = hashlib.sha256(region.encode("utf-8"))
+
+        with open(config_file, "rb") as file:
+            digest.update(file.read())
+
+        return digest.hexdigest()
+
+    def load(self) -> bool:
+        """
+        Loads the state file, returns False if it doesn't exist or it is
+        not readable.
+        """
+        try:
+            with open(self.state_file, "r") as file:
+                state = json.load(file)
+        except (OSError, ValueError) as e:
+            Logger.warn(f"State file not loaded: {e}")
+            return False
+
+        if state.get("version") != self.VERSION:
+            Logger.warn("State file version not supported!")
+            return False
+
+        self.fingerprint = state.get("fingerprint")
+        self.resources = state.get("resources", {})
+        self.records = state.get("records", {})
+
+        return True
+
+    def save(self) -> None:
+        """
+        Writes the state file, replacing the old one only when the new one is
+        complete.
+        """
+        os.makedirs(os.path.dirname(self.state_file), exist_ok=True)
+        temp_file = f"{self.state_file}.tmp"
+
+        with open(temp_file, "w") as file:
+            json.dump(
+                {
+                    "version": self.VERSION,
+                    "fingerprint": self.fingerprint,
+                    "resources": self.resources,
+                    "records": self.records,
+                },
+                file,
+                indent=2,
+                sort_keys=True,
+            )
+
+        os.replace(temp_file, self.state_file)
+
+    def update(self, fingerprint: str, results: dict) -> None:
+        """
+        Records the ids of the resources in the results of the startup
+        graph.
+        """
+        resources = {}
+
+        def add(resource_type: str, name: str, resource_id: str) -> None:
+            if resource_id is not None:
+                resources.setdefault(resource_type, {})[name] = resource_id
+
+        for task, result in results.items():
+            if task in ("vpc", "internet_gateway", "route_table"):
+                resource_type = {
+                    "vpc": Inventory.VPCS,
+                    "internet_gateway": Inventory.INTERNET_GATEWAYS,
+                    "route_table": Inventory.ROUTE_TABLES,
+                }.get(task)
+                add(resource_type, result.name, result.id)
+            elif task.startswith("subnet:"):
+                add(Inventory.SUBNETS, result.name, result.id)
+            elif task.startswith("security_group:"):
+                add(Inventory.SECURITY_GROUPS, result.name, result.id)
+            elif task.startswith("keypair:"):
+                add(Inventory.KEY_PAIRS, result.name, result.id)
+            elif task == "instances":
+                for name, instance in result.items():
+                    add(Inventory.INSTANCES, name, instance.id)
+
+        records = {}
+
+        for name, instance in results.get("instances", {}).items():
+            records[name] = instance.public_ip
+
+        self.fingerprint = fingerprint
+        self.resources = resources
+        self.records = records
@@ -0,0 +1,163 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+import json
+import re
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# characters that can follow a number, true, false or null.
+DELIMITER = re.compile(r"[ \t\n\r,\]}]")
+
+
+class JsonStream(object):
+    """
+    Reads a JSON document from a file a chunk at a time, the objects and the
+    arrays can be walked one member or item at a time, so only the value
+    being read is kept in memory.
+    The errors are thrown as json.JSONDecodeError.
+    """
+
+    def __init__(self, file, chunk_size: int = 65536):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.position = 0
+        self.eof = False
+
+    def peek(self) -> str:
+        """
+        Returns the next character that isn't a white space, without reading
+        it, an empty string at the end of the file.
+        """
+        while True:
+            self.position = WHITESPACE.match(self.buffer, self.position).end()
+
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+
+            if self._fill() is False:
+                return ""
+
+    def value(self):
+        """
+        Reads the next value.
+        """
+        char = self.peek()
+
+        if char not in ("{", "[", '"'):
+            # a number may go on in the next chunk.
+            while (
+                DELIMITER.search(self.buffer, self.position) is None
+                and self._fill() is True
+            ):
+                pass
+
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(
+                    self.buffer, self.position
+                )
+            except json.JSONDecodeError:
+                # the value may go on in the next chunk.
+                if self._fill() is True:
+                    continue
+
+                raise
+
+            self.position = end
+
+            return value
+
+    def members(self):
+        """
+        Yields the keys of the next object, the value of a key must be read
+        before the next key.
+        """
+        self._expect("{")
+
+        if self.peek() == "}":
+            self.position += 1
+            return
+
+        while True:
+            if self.peek() != '"':
+                self._error(
+                    "Expecting property name enclosed in double quotes"
+                )
+
+            key = self.value()
+            self._expect(":")
+
+            yield key
+
+            if self._delimiter("}") is True:
+                return
+
+    def items(self):
+        """
+        Yields the items of the next array.
+        """
+        self._expect("[")
+
+        if self.peek() == "]":
+            self.position += 1
+            return
+
+        while True:
+            yield self.value()
+
+            if self._delimiter("]") is True:
+                return
+
+    def end(self) -> None:
+        """
+        Throws an error if the document goes on.
+        """
+        if self.peek() != "":
+            self._error("Extra data")
+
+    def _delimiter(self, closing: str) -> bool:
+        """
+        Reads a comma or the closing character, returns True if it is the
+        closing one.
+        """
+        char = self.peek()
+
+        if char not in (",", closing):
+            self._error(f"Expecting ',' or '{closing}' delimiter")
+
+        self.position += 1
+
+        return char == closing
+
+    def _expect(self, char: str) -> None:
+        if self.peek() != char:
+            self._error(f"Expecting '{char}'")
+
+        self.position += 1
+
+    def _error(self, message: str) -> None:
+        raise json.JSONDecodeError(message, self.buffer, self.position)
+
+    def _fill(self) -> bool:
+        """
+        Reads the next chunk, dropping what has been read of the buffer,
+        returns False at the end of the file.
+        """
+        if self.eof is True:
+            return False
+
+        chunk = self.file.read(self.chunk_size)
+
+        if len(chunk) == 0:
+            self.eof = True
+            return False
+
+        self.buffer = self.buffer[self.position :] + chunk
+        self.position = 0
+
+        return True
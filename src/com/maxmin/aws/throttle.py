@@ -0,0 +1,145 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+import threading
+import time
+
+# error codes of the throttled requests.
+THROTTLING_CODES = (
+    "Throttling",
+    "ThrottlingException",
+    "ThrottledException",
+    "RequestLimitExceeded",
+    "RequestThrottled",
+    "RequestThrottledException",
+    "TooManyRequestsException",
+    "PriorRequestNotComplete",
+    "EC2ThrottledException",
+)
+
+
+class TokenBucket(object):
+    """
+    Lets through at most rate requests per second on average, with bursts of
+    up to capacity requests.
+    """
+
+    def __init__(self, rate: float, capacity: float = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1, rate)
+        self.tokens = self.capacity
+        self.last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Takes a token, waiting until one is available.
+        Returns the seconds waited.
+        """
+        waited = 0
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.last) * self.rate
+                )
+                self.last = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+
+                delay = (1 - self.tokens) / self.rate
+
+            time.sleep(delay)
+            waited += delay
+
+
+class RateLimiter(object):
+    """
+    Token buckets shared by all the clients of a service and region, and
+    the count of the requests sent, throttled and retried.
+    The buckets are filled through the botocore events of the clients, each
+    attempt of a call, retries included, takes a token.
+    """
+
+    _lock = threading.Lock()
+    _enabled = True
+    _buckets = {}
+    _stats = {}
+
+    @classmethod
+    def attach(cls, client, rate: float = None) -> None:
+        """
+        Registers the handlers of the client events, if rate is None the
+        requests are counted but not limited.
+        """
+        service_model = client.meta.service_model
+        service_id = service_model.service_id.hyphenize()
+        key = f"{service_model.service_name}/{client.meta.region_name}"
+
+        with cls._lock:
+            if rate is not None and key not in cls._buckets:
+                cls._buckets[key] = TokenBucket(rate)
+
+        def before_send(**kwargs):
+            bucket = cls._buckets.get(key) if cls._enabled else None
+            waited = bucket.acquire() if bucket is not None else 0
+
+            cls._add(key, requests=1, waited=waited)
+
+        def needs_retry(response=None, **kwargs):
+            if response is not None:
+                error = response[1].get("Error", {})
+
+                if error.get("Code") in THROTTLING_CODES:
+                    cls._add(key, throttles=1)
+
+        def after_call(parsed=None, **kwargs):
+            metadata = parsed.get("ResponseMetadata", {})
+
+            cls._add(key, retries=metadata.get("RetryAttempts", 0))
+
+        client.meta.events.register(f"before-send.{service_id}", before_send)
+        client.meta.events.register(f"needs-retry.{service_id}", needs_retry)
+        client.meta.events.register(f"after-call.{service_id}", after_call)
+
+    @classmethod
+    def enable(cls) -> None:
+        cls._enabled = True
+
+    @classmethod
+    def disable(cls) -> None:
+        """
+        Lets all the requests through, they are still counted.
+        """
+        cls._enabled = False
+
+    @classmethod
+    def stats(cls) -> dict:
+        """
+        Returns the requests sent, throttled and retried and the seconds
+        waited for a token, by service and region, e.g. 'ec2/eu-west-1'.
+        """
+        with cls._lock:
+            return {key: dict(stats) for key, stats in cls._stats.items()}
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._buckets = {}
+            cls._stats = {}
+
+    @classmethod
+    def _add(cls, key: str, **counts) -> None:
+        with cls._lock:
+            stats = cls._stats.setdefault(
+                key,
+                {"requests": 0, "throttles": 0, "retries": 0, "waited": 0},
+            )
+
+            for name, count in counts.items():
+                stats[name] += count
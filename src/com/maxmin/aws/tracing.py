@@ -0,0 +1,172 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+import contextlib
+import contextvars
+import functools
+import itertools
+import json
+import os
+import threading
+import time
+
+
+class Tracer(object):
+    """
+    Records the spans of a run, the tasks, the DAO calls and the waiters,
+    and exports them in the Chrome trace event format, which can be opened
+    with chrome://tracing or https://ui.perfetto.dev.
+    Nothing is recorded until start is called.
+    """
+
+    # id of the span open in the current context.
+    _parent = contextvars.ContextVar("parent", default=None)
+
+    _lock = threading.Lock()
+    _enabled = False
+    _origin = 0
+    _ids = itertools.count(1)
+    _spans = []
+    _threads = {}
+
+    @classmethod
+    def start(cls) -> None:
+        with cls._lock:
+            cls._enabled = True
+            cls._origin = time.perf_counter()
+            cls._ids = itertools.count(1)
+            cls._spans = []
+            cls._threads = {}
+
+    @classmethod
+    def stop(cls) -> None:
+        with cls._lock:
+            cls._enabled = False
+
+    @classmethod
+    def enabled(cls) -> bool:
+        return cls._enabled
+
+    @classmethod
+    @contextlib.contextmanager
+    def span(cls, span_name: str, category: str = "dao", **attributes):
+        """
+        Records a span around the block, the attributes yielded can be
+        updated in the block.
+        """
+        if cls._enabled is False:
+            yield attributes
+            return
+
+        span_id = next(cls._ids)
+        parent_id = cls._parent.get()
+        token = cls._parent.set(span_id)
+        thread = threading.current_thread()
+        start = time.perf_counter()
+
+        try:
+            yield attributes
+        except BaseException as e:
+            attributes["error"] = str(e)
+            raise
+        finally:
+            end = time.perf_counter()
+            cls._parent.reset(token)
+
+            with cls._lock:
+                cls._threads[thread.ident] = thread.name
+                cls._spans.append(
+                    {
+                        "id": span_id,
+                        "parent": parent_id,
+                        "name": span_name,
+                        "category": category,
+                        "thread": thread.ident,
+                        "start": start - cls._origin,
+                        "duration": end - start,
+                        "attributes": attributes,
+                    }
+                )
+
+    @classmethod
+    def spans(cls) -> list:
+        with cls._lock:
+            return list(cls._spans)
+
+    @classmethod
+    def events(cls) -> list:
+        """
+        Returns the spans as complete events, 'X', timed in microseconds,
+        preceded by the names of the threads.
+        """
+        pid = os.getpid()
+
+        with cls._lock:
+            events = [
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": thread_id,
+                    "args": {"name": thread_name},
+                }
+                for thread_id, thread_name in cls._threads.items()
+            ]
+
+            for span in sorted(cls._spans, key=lambda span: span["start"]):
+                events.append(
+                    {
+                        "name": span["name"],
+                        "cat": span["category"],
+                        "ph": "X",
+                        "ts": round(span["start"] * 1000000),
+                        "dur": round(span["duration"] * 1000000),
+                        "pid": pid,
+                        "tid": span["thread"],
+                        "args": {
+                            "id": span["id"],
+                            "parent": span["parent"],
+                            **span["attributes"],
+                        },
+                    }
+                )
+
+        return events
+
+    @classmethod
+    def export(cls, trace_file: str) -> None:
+        with open(trace_file, "w") as file:
+            json.dump(
+                {"traceEvents": cls.events(), "displayTimeUnit": "ms"},
+                file,
+                default=str,
+            )
+
+
+def traced(category: str = "dao"):
+    """
+    Decorates a DAO method with a span named after the class and the method,
+    with the name and the id of the resource.
+    """
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if Tracer.enabled() is False:
+                return method(self, *args, **kwargs)
+
+            with Tracer.span(
+                f"{type(self).__name__}.{method.__name__}",
+                category,
+                name=getattr(self, "name", None),
+            ) as attributes:
+                result = method(self, *args, **kwargs)
+                attributes["id"] = getattr(self, "id", None)
+
+                return result
+
+        return wrapper
+
+    return decorator
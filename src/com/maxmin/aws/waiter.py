@@ -0,0 +1,229 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+import bisect
+import random
+import threading
+import time
+
+from botocore import xform_name
+from botocore.exceptions import ClientError
+
+from com.maxmin.aws.constants import ProjectFiles, WaiterConstants
+from com.maxmin.aws.exception import AwsException
+from com.maxmin.aws.logs import Logger
+from com.maxmin.aws.metrics import ApiMetrics
+from com.maxmin.aws.tracing import Tracer
+
+
+class WaiterConfig(object):
+    """
+    Delays of a waiter: the delay grows from initial_delay by multiplier up
+    to max_delay, a random part of it, up to jitter, is cut off.
+    The waiter gives up after timeout seconds.
+    """
+
+    _constants = {}
+    _constants_lock = threading.Lock()
+
+    # ini file with the settings of the waiters of each service.
+    CONSTANTS_FILES = {
+        "ec2": ProjectFiles.EC2_CONSTANTS_FILE,
+        "route53": ProjectFiles.ROUTE53_CONSTANTS_FILE,
+    }
+
+    def __init__(
+        self,
+        initial_delay: float = 1,
+        max_delay: float = 15,
+        multiplier: float = 2,
+        jitter: float = 0.5,
+        timeout: float = 600,
+    ):
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.timeout = timeout
+
+    @classmethod
+    def of(cls, service_name: str, waiter_name: str):
+        """
+        Returns the configuration of a waiter, read from the ini file of the
+        service.
+        """
+        with cls._constants_lock:
+            constants = cls._constants.get(service_name)
+
+            if constants is None:
+                constants = WaiterConstants(
+                    cls.CONSTANTS_FILES.get(service_name)
+                )
+                cls._constants[service_name] = constants
+
+        settings = constants.settings(waiter_name)
+
+        return cls(**settings)
+
+    def delay(self, attempt: int) -> float:
+        """
+        Returns the delay before the next attempt, attempt starts from 0.
+        """
+        delay = min(
+            self.max_delay, self.initial_delay * self.multiplier**attempt
+        )
+
+        return delay - random.uniform(0, delay * self.jitter)
+
+
+class WaiterStats(object):
+    """
+    Time to ready of the waits, by waiter name.
+    """
+
+    # upper bounds in seconds of the histogram buckets.
+    BUCKETS = [1, 2, 5, 10, 20, 30, 60, 120, 300, 600, 1200]
+
+    _lock = threading.Lock()
+    _times = {}
+
+    @classmethod
+    def record(cls, waiter_name: str, seconds: float, count: int = 1) -> None:
+        with cls._lock:
+            cls._times.setdefault(waiter_name, []).extend([seconds] * count)
+
+    @classmethod
+    def histogram(cls, waiter_name: str) -> dict:
+        """
+        Returns the number of waits by bucket, keyed by the bucket upper
+        bound, the last one is 'inf'.
+        """
+        histogram = {str(bound): 0 for bound in cls.BUCKETS}
+        histogram["inf"] = 0
+
+        with cls._lock:
+            times = list(cls._times.get(waiter_name, []))
+
+        for seconds in times:
+            index = bisect.bisect_left(cls.BUCKETS, seconds)
+            bucket = (
+                str(cls.BUCKETS[index]) if index < len(cls.BUCKETS) else "inf"
+            )
+            histogram[bucket] += 1
+
+        return histogram
+
+    @classmethod
+    def report(cls) -> dict:
+        report = {}
+
+        with cls._lock:
+            waiter_names = sorted(cls._times.keys())
+
+        for waiter_name in waiter_names:
+            with cls._lock:
+                times = sorted(cls._times.get(waiter_name))
+
+            report[waiter_name] = {
+                "count": len(times),
+                "min": times[0],
+                "max": times[-1],
+                "mean": sum(times) / len(times),
+                "p50": times[int(0.5 * (len(times) - 1))],
+                "p90": times[int(0.9 * (len(times) - 1))],
+                "histogram": cls.histogram(waiter_name),
+            }
+
+        return report
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._times = {}
+
+
+class AdaptiveWaiter(object):
+    """
+    Waits for a resource, or many resources at once, evaluating the
+    acceptors of a botocore waiter, but polling with exponential backoff and
+    jitter in place of the fixed delay of the botocore waiter.
+    """
+
+    def __init__(self, client, waiter_name: str, config: WaiterConfig = None):
+        self.client = client
+        self.waiter_name = waiter_name
+        self.waiter_config = client.get_waiter(waiter_name).config
+        self.config = (
+            config
+            if config is not None
+            else WaiterConfig.of(
+                client.meta.service_model.service_name, waiter_name
+            )
+        )
+
+    def wait(self, **kwargs) -> None:
+        """
+        Polls the resources until the waiter succeeds, the arguments are the
+        ones of the botocore waiter, e.g. InstanceIds=[...].
+        """
+        with ApiMetrics.waiting(), Tracer.span(
+            f"wait {self.waiter_name}", "waiter"
+        ):
+            self._wait(**kwargs)
+
+    def _wait(self, **kwargs) -> None:
+        operation = getattr(
+            self.client, xform_name(self.waiter_config.operation)
+        )
+        start = time.monotonic()
+        attempt = 0
+
+        while True:
+            try:
+                response = operation(**kwargs)
+            except ClientError as e:
+                response = e.response
+
+            state = self._state(response)
+
+            if state == "success":
+                WaiterStats.record(
+                    self.waiter_name,
+                    time.monotonic() - start,
+                    self._count(kwargs),
+                )
+                return
+
+            if state == "failure":
+                raise AwsException(f"Waiter {self.waiter_name} failed!")
+
+            if state is None and "Error" in response:
+                Logger.error(str(response.get("Error")))
+                raise AwsException(f"Waiter {self.waiter_name} failed!")
+
+            delay = self.config.delay(attempt)
+
+            if time.monotonic() - start + delay > self.config.timeout:
+                raise AwsException(f"Waiter {self.waiter_name} timed out!")
+
+            time.sleep(delay)
+            attempt += 1
+
+    def _state(self, response: dict):
+        for acceptor in self.waiter_config.acceptors:
+            if acceptor.matcher_func(response):
+                return acceptor.state
+
+        return None
+
+    def _count(self, kwargs: dict) -> int:
+        """
+        Returns the number of resources waited.
+        """
+        for value in kwargs.values():
+            if isinstance(value, list):
+                return len(value)
+
+        return 1
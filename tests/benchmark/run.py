@@ -0,0 +1,253 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+
+Runs the startup and the shutdown of synthetic datacenters against moto and
+compares wall time, API calls and peak memory with a baseline.
+
+From the tests directory:
+
+    python -m benchmark.run
+    python -m benchmark.run --scenarios instances-500 zone-10000
+    python -m benchmark.run --update-baseline
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import boto3
+from moto import mock_ec2, mock_route53
+
+from benchmark.scenarios import (
+    DEFAULT_SCENARIOS,
+    SCENARIOS,
+    datacenter,
+    zone_records,
+)
+from com.maxmin.aws.client import ClientRegistry
+from com.maxmin.aws.configuration import ApplicationConfig
+from com.maxmin.aws.constants import (
+    ProjectDirectories,
+    ProjectFiles,
+    Route53Constants,
+)
+from com.maxmin.aws.ec2.dao.inventory import Inventory
+from com.maxmin.aws.logs import Logger
+from com.maxmin.aws.metrics import ApiMetrics
+from com.maxmin.aws.route53.dao.zone_index import ZoneIndex
+from com.maxmin.aws.shutdown import build_shutdown_graph
+from com.maxmin.aws.startup import (
+    DEFAULT_MAX_PARALLEL,
+    build_startup_graph,
+    load_inventory,
+)
+from com.maxmin.aws.throttle import RateLimiter
+
+BASELINE_FILE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+# relative increase over the baseline reported as a regression.
+DEFAULT_THRESHOLD = 0.25
+
+METRICS = ("seconds", "calls", "peak_memory")
+
+
+def measure(function) -> dict:
+    """
+    Runs the function and returns its wall time, its API calls by operation
+    and its peak memory.
+    """
+    ApiMetrics.clear()
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    try:
+        function()
+    finally:
+        seconds = time.perf_counter() - start
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    operations = {
+        name: operation.get("calls")
+        for name, operation in ApiMetrics.report().get("operations").items()
+    }
+
+    return {
+        "seconds": round(seconds, 3),
+        "calls": sum(operations.values()),
+        "peak_memory": peak_memory,
+        "operations": dict(sorted(operations.items())),
+    }
+
+
+def run_scenario(name: str, max_parallel: int) -> dict:
+    """
+    Creates and deletes the datacenter of the scenario in a fresh moto
+    backend, the hosted zone is filled before the measures start.
+    """
+    instances, security_groups, rules, records = SCENARIOS.get(name)
+
+    password_cache_file = ProjectFiles.PASSWORD_CACHE_FILE
+
+    with mock_ec2(), mock_route53(), tempfile.TemporaryDirectory() as tmp:
+        # the hashed passwords are not written to the access directory.
+        ProjectFiles.PASSWORD_CACHE_FILE = os.path.join(tmp, "passwords.json")
+        ClientRegistry.clear()
+        Inventory.deactivate()
+        ZoneIndex.deactivate()
+
+        route53 = boto3.client("route53")
+        hosted_zone_id = (
+            route53.create_hosted_zone(
+                Name=Route53Constants().registered_domain,
+                CallerReference=name,
+            )
+            .get("HostedZone")
+            .get("Id")
+        )
+        changes = zone_records(records)
+
+        for i in range(0, len(changes), 1000):
+            route53.change_resource_record_sets(
+                HostedZoneId=hosted_zone_id,
+                ChangeBatch={"Changes": changes[i : i + 1000]},
+            )
+
+        config_file = os.path.join(tmp, f"{name}.json")
+
+        with open(config_file, "w") as file:
+            json.dump(
+                datacenter(name, instances, security_groups, rules), file
+            )
+
+        application_config = ApplicationConfig(config_file)
+
+        def startup():
+            load_inventory(application_config)
+            build_startup_graph(application_config).run(max_parallel)
+
+        def shutdown():
+            load_inventory(application_config)
+            build_shutdown_graph(application_config).run(max_parallel)
+
+        try:
+            return {"startup": measure(startup), "shutdown": measure(shutdown)}
+        finally:
+            ProjectFiles.PASSWORD_CACHE_FILE = password_cache_file
+            Inventory.deactivate()
+            ZoneIndex.deactivate()
+
+            private_key = (
+                f"{ProjectDirectories.ACCESS_DIR}/bench-{name}-keypair"
+            )
+
+            if os.path.isfile(private_key) is True:
+                os.remove(private_key)
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """
+    Returns the measures that grew more than threshold over the baseline,
+    as (scenario, phase, metric, baseline value, value) tuples.
+    """
+    regressions = []
+
+    for scenario, phases in results.items():
+        for phase, measures in phases.items():
+            baseline_measures = baseline.get(scenario, {}).get(phase)
+
+            if baseline_measures is None:
+                continue
+
+            for metric in METRICS:
+                baseline_value = baseline_measures.get(metric)
+                value = measures.get(metric)
+
+                if value > baseline_value * (1 + threshold):
+                    regressions.append(
+                        (scenario, phase, metric, baseline_value, value)
+                    )
+
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmarks startup and shutdown against moto."
+    )
+    parser.add_argument(
+        "--scenarios",
+        nargs="+",
+        choices=sorted(SCENARIOS.keys()),
+        default=DEFAULT_SCENARIOS,
+    )
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="relative increase over the baseline reported as a regression",
+    )
+    parser.add_argument(
+        "--max-parallel", type=int, default=DEFAULT_MAX_PARALLEL
+    )
+    parser.add_argument("--output", help="file where the results are written")
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="write the results of the scenarios run into the baseline",
+    )
+    arguments = parser.parse_args()
+
+    # the benchmarks measure the code, not the configured request rate.
+    RateLimiter.disable()
+    Logger.configure("WARNING")
+
+    # loads the service models and the moto backends before the measures.
+    run_scenario("instances-1", arguments.max_parallel)
+
+    results = {}
+
+    for scenario in arguments.scenarios:
+        results[scenario] = run_scenario(scenario, arguments.max_parallel)
+
+        for phase, measures in results[scenario].items():
+            print(
+                f"{scenario} {phase}: {measures.get('seconds'):.2f}s, "
+                f"{measures.get('calls')} API calls, "
+                f"peak memory {measures.get('peak_memory') / 1024:.0f} KiB"
+            )
+
+    if arguments.output is not None:
+        with open(arguments.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+    baseline = {}
+
+    if os.path.isfile(arguments.baseline) is True:
+        with open(arguments.baseline) as file:
+            baseline = json.load(file)
+
+    if arguments.update_baseline is True:
+        baseline.update(results)
+
+        with open(arguments.baseline, "w") as file:
+            json.dump(baseline, file, indent=2, sort_keys=True)
+
+        print(f"Baseline {arguments.baseline} updated!")
+        sys.exit(0)
+
+    regressions = compare(results, baseline, arguments.threshold)
+
+    for scenario, phase, metric, baseline_value, value in regressions:
+        print(
+            f"REGRESSION {scenario} {phase} {metric}: {baseline_value} -> "
+            f"{value}"
+        )
+
+    sys.exit(1 if len(regressions) > 0 else 0)
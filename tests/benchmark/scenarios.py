@@ -0,0 +1,112 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+
+Synthetic datacenters of increasing size for the benchmarks.
+"""
+from comtest.maxmin.aws.constants import AMI_NAME
+
+# instances, security groups, rules per security group, records already in
+# the hosted zone.
+SCENARIOS = {
+    "instances-1": (1, 1, 1, 0),
+    "instances-10": (10, 1, 1, 0),
+    "instances-50": (50, 1, 1, 0),
+    "instances-500": (500, 1, 1, 0),
+    "security-groups-10": (1, 10, 20, 0),
+    "security-groups-100": (1, 100, 50, 0),
+    "zone-1000": (10, 1, 1, 1000),
+    "zone-10000": (10, 1, 1, 10000),
+}
+
+# scenarios run when none is given, fast enough for every change.
+DEFAULT_SCENARIOS = [
+    "instances-1",
+    "instances-10",
+    "security-groups-10",
+    "zone-1000",
+]
+
+
+def datacenter(
+    name: str, instances: int, security_groups: int, rules: int
+) -> dict:
+    """
+    Returns a datacenter configuration with one subnet large enough for the
+    instances, the instances are spread over the security groups.
+    """
+    return {
+        "Datacenter": {
+            "Description": f"Benchmark datacenter {name}",
+            "Name": f"bench-{name}",
+            "Cidr": "10.0.0.0/16",
+            "DnsName": "10.0.0.2",
+            "Region": "eu-west-1",
+            "InternetGateway": f"bench-{name}-gateway",
+            "RouteTable": f"bench-{name}-routetable",
+            "Subnets": [
+                {
+                    "Description": "Benchmark subnet",
+                    "Name": f"bench-{name}-subnet",
+                    "Az": "eu-west-1a",
+                    "Cidr": "10.0.16.0/20",
+                }
+            ],
+            "SecurityGroups": [
+                {
+                    "Description": "Benchmark security group",
+                    "Name": f"bench-{name}-secgroup{i}",
+                    "Rules": [
+                        {
+                            "FromPort": 1000 + j,
+                            "ToPort": 1000 + j,
+                            "Protocol": "tcp",
+                            "Cidr": "0.0.0.0/0",
+                            "Description": f"port {1000 + j}",
+                        }
+                        for j in range(rules)
+                    ],
+                }
+                for i in range(security_groups)
+            ],
+            "Instances": [
+                {
+                    "UserName": "benchuser",
+                    "UserPassword": "benchpassword",
+                    "PrivateIp": f"10.0.{16 + i // 250}.{4 + i % 250}",
+                    "DnsName": f"bench-{name}-box{i}.maxmin.it",
+                    "Hostname": f"bench-{name}-box{i}.maxmin.it",
+                    "SecurityGroup": (
+                        f"bench-{name}-secgroup{i % security_groups}"
+                    ),
+                    "Subnet": f"bench-{name}-subnet",
+                    "Keypair": f"bench-{name}-keypair",
+                    "ParentImage": AMI_NAME,
+                    "Tags": [{"Key": "Name", "Value": f"bench-{name}-box{i}"}],
+                }
+                for i in range(instances)
+            ],
+        }
+    }
+
+
+def zone_records(records: int) -> list:
+    """
+    Returns the changes that fill the hosted zone with records unrelated to
+    the datacenter.
+    """
+    return [
+        {
+            "Action": "CREATE",
+            "ResourceRecordSet": {
+                "Name": f"other{i}.maxmin.it",
+                "Type": "A",
+                "TTL": 300,
+                "ResourceRecords": [
+                    {"Value": f"192.168.{i // 250}.{1 + i % 250}"}
+                ],
+            },
+        }
+        for i in range(records)
+    ]
@@ -0,0 +1,49 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+
+benchmark run module tests.
+"""
+from benchmark.run import compare, run_scenario
+from benchmark.scenarios import datacenter
+
+
+def test_datacenter():
+    config = datacenter("test", 300, 3, 2).get("Datacenter")
+    private_ips = [
+        instance.get("PrivateIp") for instance in config.get("Instances")
+    ]
+
+    assert len(set(private_ips)) == 300
+    assert private_ips[299] == "10.0.17.53"
+    assert len(config.get("SecurityGroups")) == 3
+    assert len(config.get("SecurityGroups")[0].get("Rules")) == 2
+
+
+def test_compare():
+    baseline = {
+        "instances-1": {
+            "startup": {"seconds": 2.0, "calls": 40, "peak_memory": 1000},
+        }
+    }
+    results = {
+        "instances-1": {
+            "startup": {"seconds": 2.4, "calls": 51, "peak_memory": 900},
+            "shutdown": {"seconds": 1.0, "calls": 20, "peak_memory": 500},
+        }
+    }
+
+    assert compare(results, baseline, 0.25) == [
+        ("instances-1", "startup", "calls", 40, 51)
+    ]
+
+
+def test_run_scenario():
+    results = run_scenario("instances-1", 4)
+
+    assert (
+        results.get("startup").get("operations").get("ec2.RunInstances") == 1
+    )
+    assert results.get("shutdown").get("calls") > 0
+    assert results.get("startup").get("peak_memory") > 0
@@ -0,0 +1,53 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+
+aio module tests.
+"""
+import asyncio
+
+from moto import mock_ec2
+import pytest
+
+from com.maxmin.aws.aio.dao import AsyncSubnet, AsyncVpc
+from com.maxmin.aws.exception import AwsException
+from comtest.maxmin.utils import TestUtils
+
+
+@pytest.fixture
+def test_utils():
+    return TestUtils()
+
+
+@mock_ec2
+def test_async_vpc(test_utils):
+    async def create_vpcs():
+        vpcs = [AsyncVpc(f"myvpc{i}") for i in range(3)]
+
+        await asyncio.gather(*(vpc.create("10.0.0.0/16") for vpc in vpcs))
+        await asyncio.gather(*(vpc.load() for vpc in vpcs))
+
+        return vpcs
+
+    vpcs = asyncio.run(create_vpcs())
+
+    for i, vpc in enumerate(vpcs):
+        assert vpc.id == test_utils.describe_vpcs(f"myvpc{i}")[0].get("VpcId")
+
+
+@mock_ec2
+def test_async_subnet_error():
+    async def delete_subnet():
+        subnet = AsyncSubnet("mysubnet")
+
+        assert await subnet.load() is False
+
+        await subnet.delete()
+
+    try:
+        asyncio.run(delete_subnet())
+
+        pytest.fail("ERROR: an exception should have been raised!")
+    except AwsException as e:
+        assert str(e) == "Error deleting the subnet!"
@@ -0,0 +1,142 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+
+aio module tests.
+"""
+import asyncio
+import json
+import os
+
+import boto3
+from moto import mock_ec2, mock_route53
+import pytest
+
+from com.maxmin.aws.aio.datacenters import SHUTDOWN, STARTUP, run_datacenters
+from com.maxmin.aws.configuration import ApplicationConfig
+from com.maxmin.aws.constants import ProjectDirectories, ProjectFiles
+from com.maxmin.aws.ec2.dao.inventory import Inventory
+from comtest.maxmin.aws.datacenter import datacenter
+from comtest.maxmin.utils import TestUtils
+
+SUFFIXES = ["-a", "-b"]
+REGIONS = ["eu-west-1", "us-east-1"]
+
+
+@pytest.fixture
+def application_configs(tmp_path):
+    application_configs = []
+
+    for suffix in SUFFIXES:
+        config_file = tmp_path / f"datacenter{suffix}.json"
+        config_file.write_text(json.dumps(datacenter(2, suffix)))
+        application_configs.append(ApplicationConfig(config_file))
+
+    yield application_configs
+
+    Inventory.deactivate()
+
+
+@pytest.fixture
+def regional_configs(tmp_path):
+    """
+    One datacenter in eu-west-1 and one in us-east-1, with the same names,
+    apart from the keypairs, whose private keys are in the same directory.
+    """
+    application_configs = []
+
+    for region in REGIONS:
+        config = datacenter(1)
+        config["Datacenter"]["Region"] = region
+        config["Datacenter"]["Subnets"][0]["Az"] = f"{region}a"
+        config["Datacenter"]["Instances"][0]["Keypair"] = f"mykeypair-{region}"
+        config_file = tmp_path / f"datacenter-{region}.json"
+        config_file.write_text(json.dumps(config))
+        application_configs.append(ApplicationConfig(config_file))
+
+    yield application_configs
+
+    Inventory.deactivate()
+
+
+@pytest.fixture
+def test_utils():
+    return TestUtils()
+
+
+@pytest.fixture(autouse=True)
+def password_cache(tmp_path, monkeypatch):
+    """
+    keeps the hashed passwords out of the access directory.
+    """
+    monkeypatch.setattr(
+        ProjectFiles, "PASSWORD_CACHE_FILE", str(tmp_path / "passwords.json")
+    )
+
+
+def clear():
+    for suffix in SUFFIXES:
+        private_key = f"{ProjectDirectories.ACCESS_DIR}/mykeypair{suffix}"
+
+        if os.path.isfile(private_key) is True:
+            os.remove(private_key)
+
+
+@mock_ec2
+@mock_route53
+def test_run_datacenters(application_configs, test_utils):
+    try:
+        test_utils.create_hosted_zone("maxmin.it")
+
+        results = asyncio.run(run_datacenters(STARTUP, application_configs, 4))
+
+        for suffix, result in zip(SUFFIXES, results):
+            assert isinstance(result, dict)
+            assert len(test_utils.describe_vpcs(f"mydatacenter{suffix}")) == 1
+            assert len(test_utils.describe_instances(f"box1{suffix}")) == 1
+
+        results = asyncio.run(
+            run_datacenters(SHUTDOWN, application_configs, 4)
+        )
+
+        for suffix, result in zip(SUFFIXES, results):
+            assert isinstance(result, dict)
+            assert len(test_utils.describe_vpcs(f"mydatacenter{suffix}")) == 0
+    finally:
+        clear()
+
+
+def describe_vpcs(region: str, name: str) -> list:
+    return (
+        boto3.client("ec2", region_name=region)
+        .describe_vpcs(Filters=[{"Name": "tag:Name", "Values": [name]}])
+        .get("Vpcs")
+    )
+
+
+@mock_ec2
+@mock_route53
+def test_run_datacenters_by_region(regional_configs, test_utils):
+    try:
+        test_utils.create_hosted_zone("maxmin.it")
+
+        results = asyncio.run(
+            run_datacenters(STARTUP, regional_configs, 4, {"us-east-1": 1})
+        )
+
+        for region, result in zip(REGIONS, results):
+            assert isinstance(result, dict)
+            assert len(describe_vpcs(region, "mydatacenter")) == 1
+
+        results = asyncio.run(run_datacenters(SHUTDOWN, regional_configs, 4))
+
+        for region, result in zip(REGIONS, results):
+            assert isinstance(result, dict)
+            assert len(describe_vpcs(region, "mydatacenter")) == 0
+    finally:
+        for region in REGIONS:
+            private_key = f"{ProjectDirectories.ACCESS_DIR}/mykeypair-{region}"
+
+            if os.path.isfile(private_key) is True:
+                os.remove(private_key)
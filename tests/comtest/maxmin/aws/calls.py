@@ -0,0 +1,47 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+from com.maxmin.aws.metrics import ApiMetrics
+
+
+class ApiCalls(object):
+    """
+    Counts the operations called by the DAO objects through the shared
+    clients, by name, e.g. 'ec2.DescribeVpcs'.
+    The calls made by TestUtils are not counted.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        ApiMetrics.clear()
+
+    def operations(self) -> dict:
+        operations = ApiMetrics.report().get("operations")
+
+        return {
+            name: operation.get("calls")
+            for name, operation in operations.items()
+        }
+
+    def count(self, operation: str = None) -> int:
+        """
+        Returns the calls to the operation, or to all of them.
+        """
+        operations = self.operations()
+
+        if operation is None:
+            return sum(operations.values())
+
+        return operations.get(operation, 0)
+
+    def assert_at_most(self, limit: int, operation: str = None) -> None:
+        count = self.count(operation)
+
+        assert count <= limit, (
+            f"{count} calls to {operation or 'AWS'}, expected at most "
+            f"{limit}: {self.operations()}"
+        )
@@ -5,3 +5,4 @@ Created on Mar 28, 2023
 """
 
 AMI_ID = "ami-03cf127a"
+AMI_NAME = "Windows_Server-2016-English-Nano-Base-2017.10.13"
@@ -0,0 +1,62 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+"""
+from comtest.maxmin.aws.constants import AMI_NAME
+
+
+def datacenter(instances: int, suffix: str = "") -> dict:
+    """
+    Returns a datacenter configuration with the given number of instances,
+    the suffix is appended to the names of the resources.
+    """
+    return {
+        "Datacenter": {
+            "Description": "Test datacenter",
+            "Name": f"mydatacenter{suffix}",
+            "Cidr": "10.0.0.0/16",
+            "DnsName": "10.0.0.2",
+            "Region": "eu-west-1",
+            "InternetGateway": f"mygateway{suffix}",
+            "RouteTable": f"myroutetable{suffix}",
+            "Subnets": [
+                {
+                    "Description": "Test subnet",
+                    "Name": f"mysubnet{suffix}",
+                    "Az": "eu-west-1a",
+                    "Cidr": "10.0.20.0/24",
+                }
+            ],
+            "SecurityGroups": [
+                {
+                    "Description": "Test security group",
+                    "Name": f"mysecgroup{suffix}",
+                    "Rules": [
+                        {
+                            "FromPort": 22,
+                            "ToPort": 22,
+                            "Protocol": "tcp",
+                            "Cidr": "0.0.0.0/0",
+                            "Description": "ssh access",
+                        }
+                    ],
+                }
+            ],
+            "Instances": [
+                {
+                    "UserName": "myuser",
+                    "UserPassword": "mypassword",
+                    "PrivateIp": f"10.0.20.{10 + i}",
+                    "DnsName": f"box{i}{suffix}.maxmin.it",
+                    "Hostname": f"box{i}{suffix}.maxmin.it",
+                    "SecurityGroup": f"mysecgroup{suffix}",
+                    "Subnet": f"mysubnet{suffix}",
+                    "Keypair": f"mykeypair{suffix}",
+                    "ParentImage": AMI_NAME,
+                    "Tags": [{"Key": "Name", "Value": f"box{i}{suffix}"}],
+                }
+                for i in range(instances)
+            ],
+        }
+    }
@@ -5,15 +5,17 @@ Created on Mar 28, 2023
 """
 import os
 
+from botocore.exceptions import ClientError
 from moto import mock_ec2
 from pytest import fail
 import pytest
 
 from com.maxmin.aws.constants import ProjectDirectories
-from com.maxmin.aws.ec2.dao.instance import Instance
+from com.maxmin.aws.ec2.dao.instance import STATUS_PAGE_SIZE, Instance
 from com.maxmin.aws.ec2.dao.ssh import Keypair
 from com.maxmin.aws.exception import AwsException
 from com.maxmin.aws.logs import Logger
+from com.maxmin.aws.waiter import WaiterConfig
 from comtest.maxmin.aws.constants import AMI_ID
 from comtest.maxmin.utils import TestUtils
 
@@ -128,6 +130,123 @@ def test_delete_instance(instance, test_utils):
     assert response[0].get("State").get("Name") == "terminated"
 
 
+@mock_ec2
+def test_delete_all_instances(test_utils):
+    instances = []
+
+    for name in ("guest-box", "admin-box", "db-box"):
+        test_utils.create_instance(name, AMI_ID)
+        instance = Instance([{"Key": "Name", "Value": name}])
+        instance.load()
+        instances.append(instance)
+
+    Instance.delete_all(instances)
+
+    for name in ("guest-box", "admin-box", "db-box"):
+        response = test_utils.describe_instances(name)
+
+        assert response[0].get("State").get("Name") == "terminated"
+
+
+@mock_ec2
+def test_delete_all_not_existing_instances():
+    instance = Instance([{"Key": "Name", "Value": "guest-box"}])
+    instance.id = "1234"
+    try:
+        Instance.delete_all([instance])
+
+        fail("An exception should have been thrown!")
+
+    except AwsException as e:
+        assert str(e) == "Error deleting the instances!"
+    except BaseException:
+        fail("ERROR: an AwsException should have been raised!")
+
+
+@mock_ec2
+def test_wait_status_ok(test_utils):
+    instances = []
+
+    for name in ("guest-box", "admin-box"):
+        test_utils.create_instance(name, AMI_ID)
+        instance = Instance([{"Key": "Name", "Value": name}])
+        instance.load()
+        instances.append(instance)
+
+    # no timeout, the wait returns only if the instances are ok at the
+    # first poll.
+    Instance.wait_status_ok(
+        instances, WaiterConfig(initial_delay=0, timeout=0)
+    )
+
+    statuses = (
+        instances[0]
+        .ec2.describe_instance_status(
+            InstanceIds=[instance.id for instance in instances]
+        )
+        .get("InstanceStatuses")
+    )
+
+    assert sorted(status.get("InstanceId") for status in statuses) == sorted(
+        instance.id for instance in instances
+    )
+
+    for status in statuses:
+        assert status.get("InstanceStatus").get("Status") == "ok"
+        assert status.get("SystemStatus").get("Status") == "ok"
+
+
+@mock_ec2
+def test_wait_status_ok_many_pages(test_utils):
+    instances = []
+
+    for i in range(STATUS_PAGE_SIZE + 50):
+        instance = Instance([{"Key": "Name", "Value": f"box{i}"}])
+        instance.id = test_utils.create_instance(f"box{i}", AMI_ID)
+        instances.append(instance)
+
+    # all the instances are ok at the first poll, none is skipped.
+    Instance.wait_status_ok(
+        instances, WaiterConfig(initial_delay=0, timeout=0)
+    )
+
+
+@mock_ec2
+def test_wait_status_ok_not_ready(test_utils):
+    instance = Instance([{"Key": "Name", "Value": "guest-box"}])
+    instance.id = "i-1234567890abcdef0"
+    try:
+        Instance.wait_status_ok(
+            [instance], WaiterConfig(initial_delay=0, timeout=0)
+        )
+
+        fail("An exception should have been thrown!")
+
+    except AwsException as e:
+        assert str(e) == "Instances not ready: i-1234567890abcdef0!"
+    except BaseException:
+        fail("ERROR: an AwsException should have been raised!")
+
+
+@mock_ec2
+def test_wait_status_ok_error(instance, monkeypatch):
+    instance.id = "i-1234567890abcdef0"
+
+    def describe_instance_status(**kwargs):
+        raise ClientError(
+            {"Error": {"Code": "UnauthorizedOperation", "Message": "denied"}},
+            "DescribeInstanceStatus",
+        )
+
+    monkeypatch.setattr(
+        instance.ec2, "describe_instance_status", describe_instance_status
+    )
+
+    # only the instances not visible yet are polled again.
+    with pytest.raises(ClientError):
+        Instance.wait_status_ok([instance], WaiterConfig(initial_delay=0))
+
+
 @mock_ec2
 def test_delete_not_existing_instance(instance):
     instance.id = "1234"
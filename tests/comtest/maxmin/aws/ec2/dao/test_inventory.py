@@ -0,0 +1,188 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+
+ec2 module tests.
+"""
+import json
+
+from moto import mock_ec2
+import pytest
+
+from com.maxmin.aws.configuration import ApplicationConfig
+from com.maxmin.aws.ec2.dao.inventory import Inventory
+from com.maxmin.aws.ec2.dao.security_group import SecurityGroup
+from com.maxmin.aws.ec2.dao.subnet import Subnet
+from com.maxmin.aws.ec2.dao.vpc import Vpc
+from comtest.maxmin.aws.calls import ApiCalls
+from comtest.maxmin.aws.datacenter import datacenter
+from comtest.maxmin.utils import TestUtils
+
+
+@pytest.fixture
+def inventory():
+    """
+    returns an inventory object to test.
+    """
+    inventory = Inventory()
+
+    yield inventory
+
+    Inventory.deactivate()
+
+
+@pytest.fixture
+def application_config(tmp_path):
+    config_file = tmp_path / "datacenter.json"
+    config_file.write_text(json.dumps(datacenter(2)))
+
+    return ApplicationConfig(config_file)
+
+
+@pytest.fixture
+def test_utils():
+    return TestUtils()
+
+
+@pytest.fixture
+def api_calls():
+    """
+    returns the counter of the API calls made by the DAO objects.
+    """
+    return ApiCalls()
+
+
+@mock_ec2
+def test_refresh_inventory(inventory, application_config, test_utils):
+    vpc_id = test_utils.create_vpc("mydatacenter", "10.0.0.0/16")
+    subnet_id = test_utils.create_subnet(
+        "mysubnet", "eu-west-1a", "10.0.20.0/24", vpc_id
+    )
+    test_utils.create_vpc("othervpc", "10.0.0.0/16")
+
+    inventory.refresh(application_config)
+
+    vpcs = inventory.find(Inventory.VPCS, "mydatacenter")
+
+    assert len(vpcs) == 1
+    assert vpcs[0].get("VpcId") == vpc_id
+    assert inventory.find(Inventory.VPCS, "othervpc") is None
+    assert inventory.find(Inventory.SECURITY_GROUPS, "mysecgroup") == []
+    assert inventory.find(Inventory.INSTANCES, "box0") == []
+
+    subnet = inventory.find_by_id(Inventory.SUBNETS, subnet_id)
+
+    assert subnet.get("CidrBlock") == "10.0.20.0/24"
+
+
+@mock_ec2
+def test_invalidate_inventory(inventory, application_config, test_utils):
+    vpc_id = test_utils.create_vpc("mydatacenter", "10.0.0.0/16")
+
+    inventory.refresh(application_config)
+    inventory.invalidate(Inventory.VPCS, "mydatacenter")
+
+    assert inventory.find(Inventory.VPCS, "mydatacenter") is None
+    assert inventory.find_by_id(Inventory.VPCS, vpc_id) is None
+
+
+@mock_ec2
+def test_load_from_inventory(
+    inventory, application_config, api_calls, test_utils
+):
+    vpc_id = test_utils.create_vpc("mydatacenter", "10.0.0.0/16")
+    test_utils.create_subnet("mysubnet", "eu-west-1a", "10.0.20.0/24", vpc_id)
+
+    inventory.refresh(application_config)
+    Inventory.activate(inventory)
+    api_calls.reset()
+
+    vpc = Vpc("mydatacenter")
+    subnet = Subnet("mysubnet")
+    security_group = SecurityGroup("mysecgroup")
+
+    assert vpc.load() is True
+    assert vpc.id == vpc_id
+    assert subnet.load() is True
+    assert subnet.vpc_id == vpc_id
+    assert security_group.load() is False
+    assert api_calls.count() == 0
+
+
+@mock_ec2
+def test_create_invalidates_inventory(
+    inventory, application_config, test_utils
+):
+    vpc_id = test_utils.create_vpc("mydatacenter", "10.0.0.0/16")
+
+    inventory.refresh(application_config)
+    Inventory.activate(inventory)
+
+    security_group = SecurityGroup("mysecgroup")
+
+    assert security_group.load() is False
+
+    security_group.create("My test security group", vpc_id)
+
+    assert inventory.find(Inventory.SECURITY_GROUPS, "mysecgroup") is None
+    assert security_group.load() is True
+    assert security_group.vpc_id == vpc_id
+
+
+@mock_ec2
+def test_refresh_inventory_by_ids(
+    inventory, application_config, api_calls, test_utils
+):
+    vpc_id = test_utils.create_vpc("mydatacenter", "10.0.0.0/16")
+    subnet_id = test_utils.create_subnet(
+        "mysubnet", "eu-west-1a", "10.0.20.0/24", vpc_id
+    )
+
+    verified = inventory.refresh_by_ids(
+        application_config,
+        {
+            Inventory.VPCS: {"mydatacenter": vpc_id},
+            Inventory.SUBNETS: {"mysubnet": subnet_id},
+        },
+    )
+
+    vpc = inventory.find(Inventory.VPCS, "mydatacenter")[0]
+
+    assert verified is True
+    assert vpc.get("VpcId") == vpc_id
+    assert api_calls.count("ec2.DescribeVpcs") == 1
+    assert api_calls.count("ec2.DescribeSubnets") == 1
+
+    # a stale id is looked up by name.
+    api_calls.reset()
+    verified = inventory.refresh_by_ids(
+        application_config, {Inventory.VPCS: {"mydatacenter": "vpc-1234"}}
+    )
+
+    vpc = inventory.find(Inventory.VPCS, "mydatacenter")[0]
+
+    assert verified is False
+    assert api_calls.count("ec2.DescribeVpcs") == 2
+    assert vpc.get("VpcId") == vpc_id
+
+
+@mock_ec2
+def test_inventory_api_calls(
+    inventory, application_config, api_calls, test_utils
+):
+    vpc_id = test_utils.create_vpc("mydatacenter", "10.0.0.0/16")
+    test_utils.create_subnet("mysubnet", "eu-west-1a", "10.0.20.0/24", vpc_id)
+
+    inventory.refresh(application_config)
+
+    # one describe by resource type.
+    api_calls.assert_at_most(len(Inventory.RESOURCE_TYPES))
+    api_calls.reset()
+
+    Inventory.activate(inventory)
+
+    assert Vpc("mydatacenter").load() is True
+    assert Subnet("mysubnet").load() is True
+
+    api_calls.assert_at_most(0)
@@ -119,6 +119,26 @@ def test_load_route_table(route_table, test_utils):
     assert response.get("VpcId") == vpc_id
 
 
+@mock_ec2
+def test_disassociate_subnets(route_table, test_utils):
+    vpc_id = test_utils.create_vpc("myvpc", "10.0.10.0/16")
+    route_table_id = test_utils.create_route_table("myroutetable", vpc_id)
+    subnet_id = test_utils.create_subnet(
+        "mysubnet", "eu-west-1a", "10.0.20.0/24", vpc_id
+    )
+    test_utils.associate_subnet_to_route_table(route_table_id, subnet_id)
+
+    assert route_table.load() is True
+    assert len(route_table.association_ids) == 1
+
+    route_table.disassociate_subnets()
+
+    response = test_utils.describe_route_table(route_table_id)
+
+    assert len(response.get("Associations")) == 0
+    assert route_table.association_ids == []
+
+
 @mock_ec2
 def test_load_route_table_not_found(route_table):
     assert route_table.load() is False
@@ -9,12 +9,15 @@ from _pytest.outcomes import fail
 from moto import mock_ec2
 import pytest
 
+from com.maxmin.aws.configuration import CidrRuleConfig, SgpRuleConfig
 from com.maxmin.aws.ec2.dao.security_group import (
     SecurityGroup,
     CidrRule,
     SgpRule,
+    RuleReconciler,
 )
 from com.maxmin.aws.exception import AwsException
+from comtest.maxmin.aws.calls import ApiCalls
 from comtest.maxmin.utils import TestUtils
 
 
@@ -47,6 +50,14 @@ def test_utils():
     return TestUtils()
 
 
+@pytest.fixture
+def api_calls():
+    """
+    returns the counter of the API calls made by the DAO objects.
+    """
+    return ApiCalls()
+
+
 @mock_ec2
 def test_create_security_group(security_group, test_utils):
     vpc_id = test_utils.create_vpc("myvpc", "10.0.10.0/16")
@@ -391,3 +402,183 @@ def test_is_access_granted(sgp_rule, cidr_rule, test_utils):
     assert sgp_rule.protocol == "tcp"
     assert sgp_rule.source_security_group_id == source_security_group_id
     assert sgp_rule.description == "My test rule 1"
+
+
+@mock_ec2
+def test_reconcile_rules(api_calls, test_utils):
+    vpc_id = test_utils.create_vpc("myvpc", "10.0.10.0/16")
+    security_group_id = test_utils.create_security_group(
+        "mysecgroup", "My test security group", vpc_id
+    )
+    source_group_id = test_utils.create_security_group(
+        "mysource", "My source security group", vpc_id
+    )
+
+    # a stale rule.
+    test_utils.allow_access_from_cidr(
+        security_group_id, 8080, 8080, "tcp", "0.0.0.0/0", "My stale rule"
+    )
+
+    rule_configs = [
+        CidrRuleConfig(22, 22, "tcp", f"10.0.{i}.0/24", f"ssh {i}")
+        for i in range(20)
+    ]
+    rule_configs.append(SgpRuleConfig(80, 80, "tcp", source_group_id, "http"))
+
+    reconciler = RuleReconciler(security_group_id)
+    api_calls.reset()
+    authorized_rules, revoked_rules, described_rules = reconciler.reconcile(
+        rule_configs
+    )
+
+    assert api_calls.operations() == {
+        "ec2.DescribeSecurityGroups": 1,
+        "ec2.RevokeSecurityGroupIngress": 1,
+        "ec2.AuthorizeSecurityGroupIngress": 1,
+    }
+    assert len(authorized_rules) == 21
+    assert revoked_rules == {
+        ("tcp", 8080, 8080, "IpRanges", "0.0.0.0/0", "My stale rule")
+    }
+    assert described_rules == set()
+    assert reconciler.load() == set(
+        RuleReconciler.rule_of_config(rule_config)
+        for rule_config in rule_configs
+    )
+
+    # nothing to do the second time.
+    api_calls.reset()
+
+    assert reconciler.reconcile(rule_configs) == (set(), set(), set())
+    assert api_calls.operations() == {"ec2.DescribeSecurityGroups": 1}
+
+
+@mock_ec2
+def test_reconcile_rules_description(api_calls, test_utils):
+    vpc_id = test_utils.create_vpc("myvpc", "10.0.10.0/16")
+    security_group_id = test_utils.create_security_group(
+        "mysecgroup", "My test security group", vpc_id
+    )
+    test_utils.allow_access_from_cidr(
+        security_group_id, 22, 22, "tcp", "10.0.0.0/24", "My old rule"
+    )
+    rule_configs = [
+        CidrRuleConfig(22, 22, "tcp", "10.0.0.0/24", "My new rule")
+    ]
+    reconciler = RuleReconciler(security_group_id)
+    api_calls.reset()
+
+    # the rule is updated in place, not revoked and authorized again.
+    assert reconciler.reconcile(rule_configs) == (
+        set(),
+        set(),
+        {("tcp", 22, 22, "IpRanges", "10.0.0.0/24", "My new rule")},
+    )
+    assert api_calls.operations() == {
+        "ec2.DescribeSecurityGroups": 1,
+        "ec2.UpdateSecurityGroupRuleDescriptionsIngress": 1,
+    }
+    assert reconciler.load() == {
+        ("tcp", 22, 22, "IpRanges", "10.0.0.0/24", "My new rule")
+    }
+
+
+@mock_ec2
+def test_reconcile_rules_without_revoke(test_utils):
+    vpc_id = test_utils.create_vpc("myvpc", "10.0.10.0/16")
+    security_group_id = test_utils.create_security_group(
+        "mysecgroup", "My test security group", vpc_id
+    )
+    test_utils.allow_access_from_cidr(
+        security_group_id, 8080, 8080, "tcp", "0.0.0.0/0", "My other rule"
+    )
+
+    reconciler = RuleReconciler(security_group_id)
+    reconciler.reconcile(
+        [CidrRuleConfig(22, 22, "tcp", "0.0.0.0/0", "ssh")], revoke=False
+    )
+
+    assert len(reconciler.load()) == 2
+
+
+def test_rule_permissions():
+    permissions = RuleReconciler.permissions_of(
+        {
+            ("tcp", 22, 22, "IpRanges", "10.0.0.0/24", "ssh"),
+            ("tcp", 22, 22, "IpRanges", "10.0.1.0/24", None),
+            ("tcp", 80, 80, "UserIdGroupPairs", "sg-1", "http"),
+        }
+    )
+
+    assert permissions == [
+        {
+            "IpProtocol": "tcp",
+            "FromPort": 22,
+            "ToPort": 22,
+            "IpRanges": [
+                {"CidrIp": "10.0.0.0/24", "Description": "ssh"},
+                {"CidrIp": "10.0.1.0/24"},
+            ],
+        },
+        {
+            "IpProtocol": "tcp",
+            "FromPort": 80,
+            "ToPort": 80,
+            "UserIdGroupPairs": [{"GroupId": "sg-1", "Description": "http"}],
+        },
+    ]
+
+
+@mock_ec2
+def test_reconcile_rules_error():
+    try:
+        RuleReconciler("sg-1234").reconcile([])
+
+        fail("ERROR: an exception should have been raised!")
+    except AwsException as e:
+        assert str(e) == "Error loading the security rules!"
+
+
+@mock_ec2
+def test_security_group_api_calls(security_group, api_calls, test_utils):
+    vpc_id = test_utils.create_vpc("myvpc", "10.0.10.0/16")
+
+    security_group.create("My test security group", vpc_id)
+
+    api_calls.assert_at_most(3)
+    api_calls.reset()
+
+    assert security_group.load() is True
+
+    api_calls.assert_at_most(1)
+    api_calls.reset()
+
+    security_group.delete()
+
+    api_calls.assert_at_most(1)
+
+
+@mock_ec2
+def test_reconcile_rules_api_calls(api_calls, test_utils):
+    vpc_id = test_utils.create_vpc("myvpc", "10.0.10.0/16")
+    security_group_id = test_utils.create_security_group(
+        "mysecgroup", "My test security group", vpc_id
+    )
+    test_utils.allow_access_from_cidr(
+        security_group_id, 8080, 8080, "tcp", "0.0.0.0/0", "My stale rule"
+    )
+    rule_configs = [
+        CidrRuleConfig(22, 22, "tcp", f"10.0.{i}.0/24", f"ssh {i}")
+        for i in range(20)
+    ]
+    reconciler = RuleReconciler(security_group_id)
+
+    reconciler.reconcile(rule_configs)
+
+    # one describe, one revoke and one authorize, whatever the rules.
+    api_calls.assert_at_most(3)
+    api_calls.reset()
+
+    reconciler.reconcile(rule_configs)
+
+    api_calls.assert_at_most(1)
@@ -6,10 +6,12 @@ Created on Mar 28, 2023
 import os
 import stat
 
+from botocore.exceptions import ClientError
 from moto import mock_ec2
 from pytest import fail
 import pytest
 
+from com.maxmin.aws.cache import DaoCache, TtlLruCache
 from com.maxmin.aws.constants import ProjectDirectories
 from com.maxmin.aws.ec2.dao.ssh import Keypair
 from com.maxmin.aws.exception import AwsException
@@ -126,3 +128,32 @@ def test_load_keypair(keypair, test_utils):
         fail("load keypair test failed!")
     finally:
         clear()
+
+
+@mock_ec2
+def test_load_keypair_error_not_cached(keypair, test_utils, monkeypatch):
+    test_utils.create_keypair("mykeypair")
+    DaoCache.install(TtlLruCache({"keypair": 300}, 10))
+
+    def describe_key_pairs(**kwargs):
+        raise ClientError(
+            {"Error": {"Code": "UnauthorizedOperation", "Message": "denied"}},
+            "DescribeKeyPairs",
+        )
+
+    try:
+        with monkeypatch.context() as patch:
+            patch.setattr(
+                keypair.ec2, "describe_key_pairs", describe_key_pairs
+            )
+
+            with pytest.raises(AwsException) as e:
+                keypair.load()
+
+            assert str(e.value) == "Error loading the keypair!"
+
+        # the error isn't cached as a missing keypair.
+        assert Keypair("mykeypair").load() is True
+    finally:
+        DaoCache.uninstall()
+        clear()
@@ -11,6 +11,7 @@ import pytest
 
 from com.maxmin.aws.ec2.dao.subnet import Subnet
 from com.maxmin.aws.exception import AwsException
+from comtest.maxmin.aws.calls import ApiCalls
 from comtest.maxmin.utils import TestUtils
 
 
@@ -27,6 +28,14 @@ def test_utils():
     return TestUtils()
 
 
+@pytest.fixture
+def api_calls():
+    """
+    returns the counter of the API calls made by the DAO objects.
+    """
+    return ApiCalls()
+
+
 @mock_ec2
 def test_create_subnet(subnet, test_utils):
     vpc_id = test_utils.create_vpc("myvpc", "10.0.10.0/16")
@@ -137,3 +146,23 @@ def test_load_subnet_two_subnets_found(subnet, test_utils):
         assert str(e) == "Found more than 1 subnet!"
     except BaseException:
         fail("ERROR: an AwsException should have been raised!")
+
+
+@mock_ec2
+def test_subnet_api_calls(subnet, api_calls, test_utils):
+    vpc_id = test_utils.create_vpc("myvpc", "10.0.10.0/16")
+
+    subnet.create("eu-west-1a", "10.0.10.0/24", vpc_id)
+
+    api_calls.assert_at_most(3)
+    api_calls.assert_at_most(1, "ec2.CreateSubnet")
+    api_calls.reset()
+
+    assert subnet.load() is True
+
+    api_calls.assert_at_most(1)
+    api_calls.reset()
+
+    subnet.delete()
+
+    api_calls.assert_at_most(1)
@@ -9,8 +9,10 @@ from _pytest.outcomes import fail
 from moto import mock_ec2
 import pytest
 
+from com.maxmin.aws.cache import DaoCache, TtlLruCache
 from com.maxmin.aws.ec2.dao.vpc import Vpc
 from com.maxmin.aws.exception import AwsException
+from comtest.maxmin.aws.calls import ApiCalls
 from comtest.maxmin.utils import TestUtils
 
 
@@ -27,6 +29,14 @@ def test_utils():
     return TestUtils()
 
 
+@pytest.fixture
+def api_calls():
+    """
+    returns the counter of the API calls made by the DAO objects.
+    """
+    return ApiCalls()
+
+
 @mock_ec2
 def test_create_vpc(vpc, test_utils):
     vpc.create("10.0.10.0/16")
@@ -122,3 +132,39 @@ def test_load_vpc_two_vpcs_found(vpc, test_utils):
         assert str(e) == "Found more than 1 vpc!"
     except BaseException:
         fail("ERROR: an AwsException should have been raised!")
+
+
+@mock_ec2
+def test_vpc_api_calls(vpc, api_calls):
+    vpc.create("10.0.10.0/16")
+
+    api_calls.assert_at_most(3)
+    api_calls.assert_at_most(1, "ec2.CreateVpc")
+    api_calls.reset()
+
+    assert vpc.load() is True
+
+    api_calls.assert_at_most(1)
+    api_calls.reset()
+
+    vpc.delete()
+
+    api_calls.assert_at_most(1)
+
+
+@mock_ec2
+def test_reload_vpc_api_calls(vpc, api_calls, test_utils):
+    test_utils.create_vpc("myvpc", "10.0.10.0/16")
+    DaoCache.install(TtlLruCache({"vpc": 300}, 10))
+
+    try:
+        assert vpc.load() is True
+
+        api_calls.reset()
+
+        assert Vpc("myvpc").load() is True
+
+        # a loaded vpc is found in the cache.
+        api_calls.assert_at_most(0)
+    finally:
+        DaoCache.uninstall()
@@ -0,0 +1,104 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+
+cloudinit module tests.
+"""
+import email
+import gzip
+import os
+
+from pytest import fail
+import pytest
+
+from com.maxmin.aws.ec2.service.cloudinit import CloudInit
+from com.maxmin.aws.exception import AwsException
+
+
+@pytest.fixture
+def template_file(tmp_path):
+    template_file = tmp_path / "cloudinit.yml.j2"
+    template_file.write_text("#cloud-config\nhostname: {{ hostname }}\n")
+
+    yield str(template_file)
+
+    CloudInit.clear()
+
+
+def test_render_cloudinit_template():
+    cloud_config = CloudInit().render(
+        {
+            "username": "myuser",
+            "hostname": "box0.maxmin.it",
+            "hashed_password": "myhash",
+            "public_key": "mykey",
+        }
+    )
+
+    assert cloud_config.startswith("#cloud-config")
+    assert "hostname: box0.maxmin.it" in cloud_config
+    assert "passwd: myhash" in cloud_config
+
+
+def test_render_all(template_file):
+    cloud_configs = CloudInit(template_file).render_all(
+        [{"hostname": f"box{i}"} for i in range(200)]
+    )
+
+    assert len(cloud_configs) == 200
+    assert cloud_configs[199] == "#cloud-config\nhostname: box199"
+
+
+def test_template_compiled_once(template_file):
+    template = CloudInit(template_file).template()
+
+    # shared by the renderers.
+    assert CloudInit(template_file).template() is template
+
+    with open(template_file, "w") as file:
+        file.write("#cloud-config\nfqdn: {{ hostname }}\n")
+
+    stat = os.stat(template_file)
+    os.utime(template_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+
+    # compiled again when the file changes.
+    assert CloudInit(template_file).template() is not template
+    assert CloudInit(template_file).render({"hostname": "box0"}) == (
+        "#cloud-config\nfqdn: box0"
+    )
+
+
+def test_user_data():
+    assert CloudInit.user_data("#cloud-config\n") == b"#cloud-config\n"
+
+
+def test_user_data_over_limit():
+    cloud_config = "#cloud-config\nwrite_files:\n" + "".join(
+        f"  - path: /tmp/file{i}\n    content: file {i}\n" for i in range(1000)
+    )
+
+    assert len(cloud_config) > CloudInit.USER_DATA_LIMIT
+
+    user_data = CloudInit.user_data(cloud_config)
+
+    assert len(user_data) <= CloudInit.USER_DATA_LIMIT
+
+    message = email.message_from_bytes(gzip.decompress(user_data))
+    parts = [part for part in message.walk() if not part.is_multipart()]
+
+    assert len(parts) == 1
+    assert parts[0].get_content_type() == "text/cloud-config"
+    assert parts[0].get_payload(decode=True).decode() == cloud_config
+
+
+def test_user_data_too_large():
+    cloud_config = "#cloud-config\n" + os.urandom(20000).hex()
+
+    try:
+        CloudInit.user_data(cloud_config)
+
+        fail("An exception should have been thrown!")
+
+    except AwsException as e:
+        assert "the limit is 16384 bytes!" in str(e)
@@ -0,0 +1,116 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+
+instance service tests.
+"""
+import json
+import os
+
+from moto import mock_ec2
+from pytest import fail
+import pytest
+
+from com.maxmin.aws.configuration import ApplicationConfig
+from com.maxmin.aws.constants import ProjectDirectories, ProjectFiles
+from com.maxmin.aws.ec2.service.instance import InstanceService
+from com.maxmin.aws.exception import AwsException
+from comtest.maxmin.aws.datacenter import datacenter
+from comtest.maxmin.utils import TestUtils
+
+PRIVATE_KEY = f"{ProjectDirectories.ACCESS_DIR}/mykeypair"
+
+
+@pytest.fixture
+def instance_service():
+    return InstanceService()
+
+
+@pytest.fixture
+def instance_configs(tmp_path):
+    config_file = tmp_path / "datacenter.json"
+    config_file.write_text(json.dumps(datacenter(3)))
+
+    return ApplicationConfig(config_file).instances
+
+
+@pytest.fixture
+def test_utils():
+    return TestUtils()
+
+
+@pytest.fixture(autouse=True)
+def password_cache(tmp_path, monkeypatch):
+    """
+    keeps the hashed passwords out of the access directory.
+    """
+    monkeypatch.setattr(
+        ProjectFiles, "PASSWORD_CACHE_FILE", str(tmp_path / "passwords.json")
+    )
+
+
+def clear():
+    if os.path.isfile(PRIVATE_KEY) is True:
+        os.remove(PRIVATE_KEY)
+
+
+def create_network(test_utils):
+    vpc_id = test_utils.create_vpc("myvpc", "10.0.0.0/16")
+    test_utils.create_security_group(
+        "mysecgroup", "My test security group", vpc_id
+    )
+    test_utils.create_subnet("mysubnet", "eu-west-1a", "10.0.20.0/24", vpc_id)
+    test_utils.create_keypair("mykeypair")
+
+
+@mock_ec2
+def test_create_instances(instance_service, instance_configs, test_utils):
+    try:
+        create_network(test_utils)
+
+        instances = instance_service.create_instances(instance_configs)
+
+        assert len(instances) == 3
+
+        for i, instance in enumerate(instances):
+            response = test_utils.describe_instances(f"box{i}")
+
+            assert len(response) == 1
+            assert instance.id == response[0].get("InstanceId")
+            assert instance.private_ip == f"10.0.20.{10 + i}"
+
+            user_data = test_utils.describe_user_data(instance.id)
+
+            assert user_data.startswith(b"#cloud-config")
+            assert f"hostname: box{i}".encode() in user_data
+
+        # the instances already created are not launched again.
+        instances = instance_service.create_instances(instance_configs)
+
+        assert len(instances) == 3
+        assert len(test_utils.describe_instances("box0")) == 1
+    finally:
+        clear()
+
+
+@mock_ec2
+def test_create_instances_terminated(
+    instance_service, instance_configs, test_utils
+):
+    try:
+        create_network(test_utils)
+
+        instances = instance_service.create_instances(instance_configs[:1])
+        instances[0].delete()
+
+        instance_service.create_instances(instance_configs)
+
+        fail("An exception should have been thrown!")
+
+    except AwsException as e:
+        assert str(e) == "The instance is terminated."
+    except BaseException:
+        fail("ERROR: an AwsException should have been raised!")
+    finally:
+        clear()
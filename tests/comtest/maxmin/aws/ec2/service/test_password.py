@@ -0,0 +1,109 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+
+password module tests.
+"""
+import json
+import os
+import stat
+
+from passlib.hash import sha512_crypt
+import pytest
+
+from com.maxmin.aws.ec2.service.password import PasswordHasher
+
+
+@pytest.fixture
+def password_hasher(tmp_path):
+    """
+    returns a password hasher object to test.
+    """
+    return PasswordHasher(str(tmp_path / "passwords.json"))
+
+
+def test_hash_passwords(password_hasher):
+    hashed_pwds = password_hasher.hash_all(
+        [("myuser", "mypassword"), ("myuser", "mypassword"), ("other", "pwd")]
+    )
+
+    assert hashed_pwds[0] == hashed_pwds[1]
+    assert hashed_pwds[0] != hashed_pwds[2]
+    assert hashed_pwds[0].startswith("$6$rounds=4096$")
+    assert sha512_crypt.verify("mypassword", hashed_pwds[0]) is True
+    assert sha512_crypt.verify("pwd", hashed_pwds[2]) is True
+
+    # the hashes are stable across the runs.
+    other_hasher = PasswordHasher(password_hasher.cache_file)
+
+    assert other_hasher.hash("myuser", "mypassword") == hashed_pwds[0]
+    # the rounds are part of the key.
+    assert (
+        PasswordHasher(password_hasher.cache_file, rounds=5000).hash(
+            "myuser", "mypassword"
+        )
+        != hashed_pwds[0]
+    )
+
+
+def test_password_cache_file(password_hasher):
+    password_hasher.hash("myuser", "mypassword")
+
+    for path in (password_hasher.cache_file, password_hasher.secret_file):
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+    with open(password_hasher.cache_file) as file:
+        cache = json.load(file)
+
+    assert "mypassword" not in json.dumps(cache)
+    assert "myuser" not in json.dumps(cache)
+
+
+def test_password_changed(password_hasher):
+    hashed_pwd = password_hasher.hash("myuser", "mypassword")
+    other_pwd = PasswordHasher(password_hasher.cache_file).hash(
+        "myuser", "otherpassword"
+    )
+
+    assert other_pwd != hashed_pwd
+    assert sha512_crypt.verify("otherpassword", other_pwd) is True
+
+    # the hashes of both passwords are kept.
+    assert PasswordHasher(password_hasher.cache_file).hash_all(
+        [("myuser", "mypassword"), ("myuser", "otherpassword")]
+    ) == [hashed_pwd, other_pwd]
+
+
+def test_password_cache_secret_lost(password_hasher):
+    hashed_pwd = password_hasher.hash("myuser", "mypassword")
+
+    os.remove(password_hasher.secret_file)
+
+    # the old keys can't be matched anymore, the password is hashed again.
+    other_pwd = PasswordHasher(password_hasher.cache_file).hash(
+        "myuser", "mypassword"
+    )
+
+    assert other_pwd != hashed_pwd
+    assert sha512_crypt.verify("mypassword", other_pwd) is True
+
+
+def test_password_cache_file_not_valid(password_hasher):
+    with open(password_hasher.cache_file, "w") as file:
+        file.write("not json")
+
+    hashed_pwd = password_hasher.hash("myuser", "mypassword")
+
+    assert sha512_crypt.verify("mypassword", hashed_pwd) is True
+
+
+def test_hash_passwords_in_background(password_hasher):
+    users = [("myuser", f"mypassword{i}") for i in range(20)]
+
+    hashed_pwds = password_hasher.submit(users).result()
+
+    assert len(set(hashed_pwds)) == 20
+
+    for (_, password), hashed_pwd in zip(users, hashed_pwds):
+        assert sha512_crypt.verify(password, hashed_pwd) is True
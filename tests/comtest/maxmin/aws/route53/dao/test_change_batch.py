@@ -0,0 +1,170 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+
+route53 module tests.
+"""
+from moto.route53 import mock_route53
+import pytest
+
+from com.maxmin.aws.exception import AwsException
+from com.maxmin.aws.route53.dao.change_batch import ChangeBatch
+from com.maxmin.aws.route53.dao.record import Record
+from com.maxmin.aws.route53.dao.zone_index import ZoneIndex
+from comtest.maxmin.aws.calls import ApiCalls
+from comtest.maxmin.utils import TestUtils
+
+
+@pytest.fixture
+def test_utils():
+    return TestUtils()
+
+
+@pytest.fixture
+def api_calls():
+    """
+    returns the counter of the API calls made by the DAO objects.
+    """
+    return ApiCalls()
+
+
+@pytest.fixture(autouse=True)
+def deactivate():
+    yield
+
+    ZoneIndex.deactivate()
+
+
+@mock_route53
+def test_submit_change_batch(api_calls, test_utils):
+    hosted_zone_id = test_utils.create_hosted_zone("maxmin.it")
+    change_batch = ChangeBatch(hosted_zone_id)
+
+    for i in range(5):
+        change_batch.create(f"box{i}.maxmin.it", f"10.0.20.{i}")
+
+    assert change_batch.submit() == 1
+    assert api_calls.operations() == {
+        "route53.ChangeResourceRecordSets": 1,
+        "route53.GetChange": 1,
+    }
+    assert len(change_batch.changes) == 0
+
+    for i in range(5):
+        response = test_utils.describe_records(
+            f"box{i}.maxmin.it", hosted_zone_id
+        )
+
+        assert response[0].get("ResourceRecords")[0].get("Value") == (
+            f"10.0.20.{i}"
+        )
+
+    for i in range(5):
+        record = Record(f"box{i}.maxmin.it", hosted_zone_id)
+        record.load()
+        change_batch.delete(record.record_set)
+
+    change_batch.submit()
+
+    assert (
+        len(test_utils.describe_records("box0.maxmin.it", hosted_zone_id)) == 0
+    )
+
+
+@mock_route53
+def test_split_change_batch(test_utils):
+    hosted_zone_id = test_utils.create_hosted_zone("maxmin.it")
+    change_batch = ChangeBatch(hosted_zone_id, max_changes=3)
+
+    for i in range(4):
+        change_batch.create(f"box{i}.maxmin.it", f"10.0.20.{i}")
+
+    # an upsert counts as two changes.
+    change_batch.upsert("box0.maxmin.it", "10.0.20.10")
+    change_batch.upsert("box1.maxmin.it", "10.0.20.11")
+
+    assert [len(batch) for batch in change_batch._split()] == [3, 2, 1]
+    assert change_batch.submit() == 3
+
+
+@mock_route53
+def test_change_batch_updates_zone_index(test_utils):
+    hosted_zone_id = test_utils.create_hosted_zone("maxmin.it")
+    zone_index = ZoneIndex(hosted_zone_id)
+    zone_index.refresh()
+    ZoneIndex.activate(zone_index)
+
+    change_batch = ChangeBatch(hosted_zone_id)
+    change_batch.create("box0.maxmin.it", "10.0.20.10")
+    change_batch.submit()
+
+    assert zone_index.find("box0.maxmin.it") is not None
+
+    change_batch.delete(zone_index.find("box0.maxmin.it"))
+    change_batch.submit()
+
+    assert zone_index.find("box0.maxmin.it") is None
+
+
+@mock_route53
+def test_delete_record_as_loaded(test_utils):
+    hosted_zone_id = test_utils.create_hosted_zone("maxmin.it")
+    test_utils.create_record("box0.maxmin.it", "10.0.20.10", hosted_zone_id)
+    test_utils.create_record(
+        "box1.maxmin.it", "10.0.20.11", hosted_zone_id, ttl=60
+    )
+    change_batch = ChangeBatch(hosted_zone_id)
+
+    for name in ("box0.maxmin.it", "box1.maxmin.it"):
+        record = Record(name, hosted_zone_id)
+        record.load()
+        change_batch.delete(record.record_set)
+
+    # the deletions match the existing record sets, not the defaults.
+    assert [
+        change.get("ResourceRecordSet").get("TTL")
+        for change in change_batch.changes
+    ] == [300, 60]
+
+    change_batch.submit()
+
+    assert (
+        len(test_utils.describe_records("box1.maxmin.it", hosted_zone_id)) == 0
+    )
+
+
+@mock_route53
+def test_submit_change_batch_error(test_utils):
+    hosted_zone_id = test_utils.create_hosted_zone("maxmin.it")
+    change_batch = ChangeBatch(hosted_zone_id)
+    change_batch.delete(
+        {
+            "Name": "box0.maxmin.it",
+            "Type": "A",
+            "TTL": 300,
+            "ResourceRecords": [{"Value": "10.0.20.10"}],
+        }
+    )
+
+    try:
+        change_batch.submit()
+
+        pytest.fail("ERROR: an exception should have been raised!")
+    except AwsException as e:
+        assert str(e) == "Error submitting the DNS changes!"
+
+
+@mock_route53
+def test_change_batch_api_calls(api_calls, test_utils):
+    hosted_zone_id = test_utils.create_hosted_zone("maxmin.it")
+    change_batch = ChangeBatch(hosted_zone_id, max_changes=50)
+
+    for i in range(100):
+        change_batch.create(f"box{i}.maxmin.it", f"10.0.20.{i}")
+
+    assert change_batch.submit() == 2
+
+    # one change and one wait by batch, not by record.
+    api_calls.assert_at_most(2, "route53.ChangeResourceRecordSets")
+    api_calls.assert_at_most(4)
@@ -2,6 +2,8 @@ from moto.route53 import mock_route53
 import pytest
 
 from com.maxmin.aws.route53.dao.record import Record
+from com.maxmin.aws.route53.dao.zone_index import ZoneIndex
+from comtest.maxmin.aws.calls import ApiCalls
 from comtest.maxmin.utils import TestUtils
 
 
@@ -10,6 +12,14 @@ def test_utils():
     return TestUtils()
 
 
+@pytest.fixture
+def api_calls():
+    """
+    returns the counter of the API calls made by the DAO objects.
+    """
+    return ApiCalls()
+
+
 @mock_route53
 def test_load_record(test_utils):
     hosted_zone_id = test_utils.create_hosted_zone("maxmin.it")
@@ -59,3 +69,56 @@ def test_delete_record(test_utils):
     response = test_utils.describe_records("com.maxmin.it", hosted_zone_id)
 
     assert len(response) == 0
+
+
+@mock_route53
+def test_load_record_exact_name(test_utils):
+    hosted_zone_id = test_utils.create_hosted_zone("maxmin.it")
+    test_utils.create_record("admin2.maxmin.it", "10.0.10.10", hosted_zone_id)
+    record = Record("admin.maxmin.it", hosted_zone_id)
+
+    assert record.load() is False
+
+    test_utils.create_record("admin.maxmin.it", "10.0.10.11", hosted_zone_id)
+
+    assert record.load() is True
+    assert record.ip_address == "10.0.10.11"
+
+
+@mock_route53
+def test_record_api_calls(api_calls, test_utils):
+    hosted_zone_id = test_utils.create_hosted_zone("maxmin.it")
+    record = Record("com.maxmin.it", hosted_zone_id)
+
+    assert record.load() is False
+
+    api_calls.assert_at_most(1)
+    api_calls.reset()
+
+    record.create("10.0.10.10")
+
+    # the load, the change and the wait for it.
+    api_calls.assert_at_most(3)
+    api_calls.assert_at_most(1, "route53.ChangeResourceRecordSets")
+    api_calls.reset()
+
+    record.delete("10.0.10.10")
+
+    api_calls.assert_at_most(1)
+
+
+@mock_route53
+def test_load_record_from_zone_index_api_calls(api_calls, test_utils):
+    hosted_zone_id = test_utils.create_hosted_zone("maxmin.it")
+    test_utils.create_record("com.maxmin.it", "10.0.10.10", hosted_zone_id)
+    zone_index = ZoneIndex(hosted_zone_id)
+    zone_index.refresh()
+    ZoneIndex.activate(zone_index)
+    api_calls.reset()
+
+    try:
+        assert Record("com.maxmin.it", hosted_zone_id).load() is True
+
+        api_calls.assert_at_most(0)
+    finally:
+        ZoneIndex.deactivate()
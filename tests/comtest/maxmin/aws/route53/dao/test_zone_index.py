@@ -0,0 +1,106 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+
+route53 module tests.
+"""
+from moto.route53 import mock_route53
+import pytest
+
+from com.maxmin.aws.route53.dao.record import Record
+from com.maxmin.aws.route53.dao.zone_index import ZoneIndex, normalize_name
+from comtest.maxmin.aws.calls import ApiCalls
+from comtest.maxmin.utils import TestUtils
+
+
+@pytest.fixture
+def test_utils():
+    return TestUtils()
+
+
+@pytest.fixture(autouse=True)
+def deactivate():
+    yield
+
+    ZoneIndex.deactivate()
+
+
+@pytest.fixture
+def api_calls():
+    """
+    returns the counter of the API calls made by the DAO objects.
+    """
+    return ApiCalls()
+
+
+def test_normalize_name():
+    assert normalize_name("Box0.Maxmin.it.") == "box0.maxmin.it"
+    assert normalize_name("\\052.maxmin.it.") == "*.maxmin.it"
+
+
+@mock_route53
+def test_refresh_zone_index(api_calls, test_utils):
+    hosted_zone_id = test_utils.create_hosted_zone("maxmin.it")
+
+    for i in range(7):
+        test_utils.create_record(
+            f"box{i}.maxmin.it", f"10.0.20.{i}", hosted_zone_id
+        )
+
+    zone_index = ZoneIndex(hosted_zone_id, page_size=3)
+    api_calls.reset()
+    zone_index.refresh()
+
+    # 7 records plus the NS and SOA records of the zone.
+    assert len(zone_index) == 9
+    assert api_calls.count() == 3
+    assert (
+        zone_index.find("box6.maxmin.it")
+        .get("ResourceRecords")[0]
+        .get("Value")
+        == "10.0.20.6"
+    )
+    assert zone_index.find("BOX6.maxmin.it.", "A") is not None
+    assert zone_index.find("box6.maxmin.it", "CNAME") is None
+    assert zone_index.find("box7.maxmin.it") is None
+
+
+@mock_route53
+def test_load_record_from_zone_index(api_calls, test_utils):
+    hosted_zone_id = test_utils.create_hosted_zone("maxmin.it")
+    test_utils.create_record("box0.maxmin.it", "10.0.20.10", hosted_zone_id)
+
+    zone_index = ZoneIndex(hosted_zone_id)
+    zone_index.refresh()
+    ZoneIndex.activate(zone_index)
+
+    record = Record("box0.maxmin.it", hosted_zone_id)
+    api_calls.reset()
+
+    assert record.load() is True
+    assert record.ip_address == "10.0.20.10"
+    assert api_calls.count() == 0
+
+
+@mock_route53
+def test_zone_index_follows_records(test_utils):
+    hosted_zone_id = test_utils.create_hosted_zone("maxmin.it")
+
+    zone_index = ZoneIndex(hosted_zone_id)
+    zone_index.refresh()
+    ZoneIndex.activate(zone_index)
+
+    record = Record("box0.maxmin.it", hosted_zone_id)
+
+    assert record.load() is False
+
+    record.create("10.0.20.10")
+
+    assert record.load() is True
+    assert zone_index.find("box0.maxmin.it") is not None
+
+    record.delete("10.0.20.10")
+
+    assert record.load() is False
+    assert zone_index.find("box0.maxmin.it") is None
@@ -0,0 +1,120 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+
+cache module tests.
+"""
+import time
+
+from moto import mock_ec2
+import pytest
+
+from com.maxmin.aws.cache import DaoCache, NullCache, TtlLruCache
+from com.maxmin.aws.ec2.dao.security_group import SecurityGroup
+from com.maxmin.aws.ec2.dao.vpc import Vpc
+from comtest.maxmin.utils import TestUtils
+
+
+@pytest.fixture
+def cache():
+    """
+    returns a cache object to test, installed for the DAO objects.
+    """
+    cache = TtlLruCache({"vpc": 300, "subnet": 0}, 2)
+    DaoCache.install(cache)
+
+    yield cache
+
+    DaoCache.uninstall()
+
+
+@pytest.fixture
+def test_utils():
+    return TestUtils()
+
+
+def test_default_cache_disabled():
+    DaoCache.uninstall()
+
+    assert isinstance(DaoCache.get(), NullCache)
+
+
+def test_get_put(cache):
+    key = ("vpc", "eu-west-1", "myvpc")
+
+    assert cache.get(key) == (False, None)
+
+    cache.put(key, [{"VpcId": "vpc-1"}], cache.version(key))
+
+    assert cache.get(key) == (True, [{"VpcId": "vpc-1"}])
+    assert cache.stats() == {"size": 1, "hits": 1, "misses": 1}
+
+
+def test_ttl_expired(cache):
+    key = ("subnet", "eu-west-1", "mysubnet")
+
+    cache.put(key, [], cache.version(key))
+    time.sleep(0.01)
+
+    assert cache.get(key) == (False, None)
+
+
+def test_lru_eviction(cache):
+    first = ("vpc", "eu-west-1", "first")
+    second = ("vpc", "eu-west-1", "second")
+    third = ("vpc", "eu-west-1", "third")
+
+    cache.put(first, [], 0)
+    cache.put(second, [], 0)
+    cache.get(first)
+    cache.put(third, [], 0)
+
+    assert cache.get(first)[0] is True
+    assert cache.get(second)[0] is False
+    assert cache.get(third)[0] is True
+
+
+def test_put_after_invalidate(cache):
+    key = ("vpc", "eu-west-1", "myvpc")
+    version = cache.version(key)
+
+    cache.invalidate(key)
+    cache.put(key, [{"VpcId": "vpc-1"}], version)
+
+    assert cache.get(key) == (False, None)
+
+
+@mock_ec2
+def test_load_cached(cache, test_utils):
+    vpc = Vpc("myvpc")
+
+    assert vpc.load() is False
+
+    # the vpc created outside the DAO is not seen until the entry expires.
+    test_utils.create_vpc("myvpc", "10.0.10.0/16")
+
+    assert vpc.load() is False
+
+
+@mock_ec2
+def test_create_invalidates_cache(cache, test_utils):
+    vpc = Vpc("myvpc")
+
+    assert vpc.load() is False
+
+    vpc.create("10.0.10.0/16")
+
+    assert vpc.load() is True
+
+    security_group = SecurityGroup("mysecgroup")
+
+    assert security_group.load() is False
+
+    security_group.create("My test security group", vpc.id)
+
+    assert security_group.load() is True
+
+    security_group.delete()
+
+    assert security_group.load() is False
@@ -0,0 +1,96 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+
+client module tests.
+"""
+from moto import mock_ec2
+import pytest
+
+from com.maxmin.aws.client import ClientRegistry, Ec2, Route53
+from com.maxmin.aws.ec2.dao.subnet import Subnet
+from com.maxmin.aws.ec2.dao.vpc import Vpc
+from com.maxmin.aws.graph import TaskGraph
+
+
+@pytest.fixture(autouse=True)
+def registry():
+    ClientRegistry.clear()
+    yield ClientRegistry
+    ClientRegistry.clear()
+
+
+def test_get_client_is_shared(registry):
+    ec2 = registry.get_client("ec2")
+
+    assert registry.get_client("ec2") is ec2
+    assert registry.get_client("route53") is not ec2
+    assert registry.stats().get("clients_created") == 2
+    assert registry.stats().get("clients_reused") == 1
+
+
+def test_get_client_by_region(registry):
+    ec2 = registry.get_client("ec2", "eu-west-1")
+    ec2_us = registry.get_client("ec2", "us-east-1")
+
+    assert ec2 is not ec2_us
+    assert ec2.meta.region_name == "eu-west-1"
+    assert ec2_us.meta.region_name == "us-east-1"
+
+
+def test_client_config(registry):
+    ec2 = registry.get_client("ec2")
+
+    assert ec2.meta.config.max_pool_connections == 20
+    assert ec2.meta.config.tcp_keepalive is True
+    assert ec2.meta.config.retries.get("mode") == "adaptive"
+
+
+def test_daos_share_the_client(registry):
+    assert Vpc("myvpc").ec2 is Subnet("mysubnet").ec2
+    assert Ec2().ec2 is Vpc("myvpc").ec2
+    assert Route53().route53 is Route53().route53
+    assert registry.stats().get("clients_created") == 2
+
+
+@mock_ec2
+def test_shared_client_calls(registry):
+    vpc = Vpc("myvpc")
+    vpc.create("10.0.10.0/16")
+
+    assert Vpc("myvpc").load() is True
+    assert registry.stats().get("clients_created") == 1
+
+
+def test_region_scope(registry):
+    with registry.region_scope("us-east-1"):
+        assert registry.current_region() == "us-east-1"
+        assert Vpc("myvpc").ec2.meta.region_name == "us-east-1"
+
+        with registry.region_scope("eu-central-1"):
+            assert Vpc("myvpc").ec2.meta.region_name == "eu-central-1"
+
+        assert registry.current_region() == "us-east-1"
+
+    assert registry.current_region() is None
+    assert Vpc("myvpc").ec2.meta.region_name == "eu-west-1"
+
+
+def test_region_scope_seen_by_tasks(registry):
+    graph = TaskGraph()
+    graph.add_task("region", lambda results: Vpc("myvpc").ec2.meta.region_name)
+
+    with registry.region_scope("us-east-1"):
+        assert graph.run(2).get("region") == "us-east-1"
+
+
+@mock_ec2
+def test_region_scope_calls(registry):
+    with registry.region_scope("us-east-1"):
+        Vpc("myvpc").create("10.0.10.0/16")
+
+    assert Vpc("myvpc").load() is False
+
+    with registry.region_scope("us-east-1"):
+        assert Vpc("myvpc").load() is True
@@ -0,0 +1,183 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+
+configuration module tests.
+"""
+import dataclasses
+import json
+
+from pytest import fail
+import pytest
+
+from com.maxmin.aws.configuration import (
+    ApplicationConfig,
+    CidrRuleConfig,
+    InstanceConfig,
+    SecurityGroupConfig,
+)
+from com.maxmin.aws.exception import AwsException
+from comtest.maxmin.aws.datacenter import datacenter
+
+
+@pytest.fixture
+def application_config(tmp_path):
+    config_file = tmp_path / "datacenter.json"
+    config_file.write_text(json.dumps(datacenter(3)))
+
+    return ApplicationConfig(config_file)
+
+
+def test_load_config(application_config):
+    assert application_config.vpc.cidr == "10.0.0.0/16"
+    assert application_config.subnets[0].name == "mysubnet"
+    assert application_config.security_groups[0].rules == (
+        CidrRuleConfig(22, 22, "tcp", "0.0.0.0/0", "ssh access"),
+    )
+    assert len(application_config.instances) == 3
+
+    instance_config = application_config.instances[1]
+
+    assert instance_config.name == "box1"
+    assert instance_config.tags == (("Name", "box1"),)
+    assert instance_config.aws_tags() == [{"Key": "Name", "Value": "box1"}]
+
+
+def test_config_immutable(application_config):
+    instance_config = application_config.instances[0]
+
+    assert not hasattr(instance_config, "__dict__")
+
+    try:
+        instance_config.subnet = "othersubnet"
+
+        fail("An exception should have been thrown!")
+
+    except dataclasses.FrozenInstanceError:
+        pass
+
+
+def test_config_hashable(application_config, tmp_path):
+    config_file = tmp_path / "other.json"
+    config_file.write_text(json.dumps(datacenter(3)))
+    other_config = ApplicationConfig(config_file)
+
+    assert other_config.instances == application_config.instances
+    assert len(set(application_config.instances + other_config.instances)) == 3
+    assert {application_config.security_groups[0]: 1}.get(
+        other_config.security_groups[0]
+    ) == 1
+
+
+def test_config_repr_without_password(application_config):
+    instance_config = application_config.instances[0]
+
+    assert "password" not in repr(instance_config)
+    assert instance_config.password not in repr(application_config.instances)
+    assert "username=" in repr(instance_config)
+
+
+def test_config_strings_interned(application_config):
+    first, second = application_config.instances[:2]
+
+    assert first.subnet is second.subnet
+    assert first.keypair is second.keypair
+    assert first.tags[0][0] is second.tags[0][0]
+
+
+def test_generated_config():
+    security_group_config = SecurityGroupConfig(
+        "mysecgroup",
+        "My security group",
+        [CidrRuleConfig(22, 22, "tcp", "0.0.0.0/0", "ssh")],
+    )
+    instance_config = InstanceConfig(
+        "myuser",
+        "mypassword",
+        "10.0.20.10",
+        "box0.maxmin.it",
+        "box0.maxmin.it",
+        "mysecgroup",
+        "mysubnet",
+        "mykeypair",
+        "myimage",
+        None,
+        [{"Key": "Class", "Value": "webserver"}, ("Name", "box0")],
+    )
+
+    assert isinstance(security_group_config.rules, tuple)
+    assert instance_config.tags == (("Class", "webserver"), ("Name", "box0"))
+    assert instance_config.name == "box0"
+    assert hash(instance_config) == hash(dataclasses.replace(instance_config))
+
+
+def test_config_name_tag_missing():
+    instance_config = InstanceConfig(
+        "myuser",
+        "mypassword",
+        "10.0.20.10",
+        None,
+        None,
+        None,
+        None,
+        None,
+        None,
+        None,
+        [],
+    )
+
+    try:
+        instance_config.name
+
+        fail("An exception should have been thrown!")
+
+    except AwsException as e:
+        assert str(e) == "Wrong tag Name!"
+
+
+def test_load_streamed_config(tmp_path):
+    config = datacenter(3)
+    # the sections can come in any order.
+    datacenter_config = config.get("Datacenter")
+    config["Datacenter"] = {
+        "Instances": datacenter_config.pop("Instances"),
+        **datacenter_config,
+    }
+    config_file = tmp_path / "datacenter.json"
+    config_file.write_text(json.dumps(config, indent=2))
+
+    application_config = ApplicationConfig(config_file, chunk_size=16)
+
+    assert application_config.vpc.region == "eu-west-1"
+    assert application_config.subnets[0].cidr == "10.0.20.0/24"
+    assert [
+        instance_config.name
+        for instance_config in application_config.instances
+    ] == ["box0", "box1", "box2"]
+
+
+@pytest.mark.parametrize(
+    "content", ['{"Datacenter": {"Name": "a",}}', '{"Datacenter": {}} {}']
+)
+def test_load_invalid_json(tmp_path, content):
+    config_file = tmp_path / "datacenter.json"
+    config_file.write_text(content)
+
+    try:
+        ApplicationConfig(config_file)
+
+        fail("An exception should have been thrown!")
+
+    except AwsException as e:
+        assert str(e) == "Invalid Json file!"
+
+
+def test_load_config_not_found(tmp_path):
+    try:
+        ApplicationConfig(tmp_path / "datacenter.json")
+
+        fail("An exception should have been thrown!")
+
+    except AwsException as e:
+        assert str(e) == "Error reading configuration file!"
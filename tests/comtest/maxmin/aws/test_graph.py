@@ -0,0 +1,183 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+
+graph module tests.
+"""
+import asyncio
+import threading
+
+from _pytest.outcomes import fail
+import pytest
+
+from com.maxmin.aws.exception import AwsException
+from com.maxmin.aws.graph import TaskGraph
+
+
+@pytest.fixture
+def graph():
+    return TaskGraph()
+
+
+def test_run_passes_dependency_results(graph):
+    graph.add_task("vpc", lambda results: "vpc-1")
+    graph.add_task(
+        "subnet",
+        lambda results: f"{results.get('vpc')}/subnet-1",
+        ["vpc"],
+    )
+
+    results = graph.run(2)
+
+    assert results == {"vpc": "vpc-1", "subnet": "vpc-1/subnet-1"}
+
+
+def test_run_independent_tasks_concurrently(graph):
+    barrier = threading.Barrier(3, timeout=5)
+
+    graph.add_task("vpc", lambda results: None)
+
+    for name in ("subnet-1", "subnet-2", "subnet-3"):
+        graph.add_task(name, lambda results: barrier.wait(), ["vpc"])
+
+    results = graph.run(3)
+
+    assert len(results) == 4
+
+
+def test_run_respects_order(graph):
+    executed = []
+
+    graph.add_task("c", lambda results: executed.append("c"), ["b"])
+    graph.add_task("b", lambda results: executed.append("b"), ["a"])
+    graph.add_task("a", lambda results: executed.append("a"))
+
+    graph.run(4)
+
+    assert executed == ["a", "b", "c"]
+
+
+def test_run_stops_on_failure(graph):
+    executed = []
+
+    def failing_task(results):
+        raise AwsException("Error creating the vpc!")
+
+    graph.add_task("vpc", failing_task)
+    graph.add_task("subnet", lambda results: executed.append("s"), ["vpc"])
+
+    try:
+        graph.run(2)
+
+        fail("ERROR: an exception should have been thrown!")
+
+    except AwsException as e:
+        assert str(e) == "Error running tasks: vpc!"
+    except BaseException:
+        fail("ERROR: an AwsException should have been raised!")
+
+    assert executed == []
+
+
+def test_add_task_twice(graph):
+    graph.add_task("vpc", lambda results: None)
+
+    try:
+        graph.add_task("vpc", lambda results: None)
+
+        fail("ERROR: an exception should have been thrown!")
+
+    except AwsException as e:
+        assert str(e) == "Task vpc already added!"
+    except BaseException:
+        fail("ERROR: an AwsException should have been raised!")
+
+
+def test_validate_unknown_dependency(graph):
+    graph.add_task("subnet", lambda results: None, ["vpc"])
+
+    try:
+        graph.run()
+
+        fail("ERROR: an exception should have been thrown!")
+
+    except AwsException as e:
+        assert str(e) == "Task subnet depends on unknown task vpc!"
+    except BaseException:
+        fail("ERROR: an AwsException should have been raised!")
+
+
+def test_validate_cycle(graph):
+    graph.add_task("a", lambda results: None, ["b"])
+    graph.add_task("b", lambda results: None, ["a"])
+
+    try:
+        graph.validate()
+
+        fail("ERROR: an exception should have been thrown!")
+
+    except AwsException as e:
+        assert str(e) == "The task graph has a cycle!"
+    except BaseException:
+        fail("ERROR: an AwsException should have been raised!")
+
+
+def test_run_async_passes_dependency_results(graph):
+    async def subnet(results):
+        return f"{results.get('vpc')}/subnet-1"
+
+    graph.add_task("vpc", lambda results: "vpc-1")
+    graph.add_task("subnet", subnet, ["vpc"])
+
+    results = asyncio.run(graph.run_async(2))
+
+    assert results == {"vpc": "vpc-1", "subnet": "vpc-1/subnet-1"}
+
+
+def test_run_async_shares_semaphore():
+    running = []
+    max_running = []
+
+    async def task(results):
+        running.append(1)
+        max_running.append(len(running))
+        await asyncio.sleep(0.01)
+        running.pop()
+
+    graphs = []
+
+    for _ in range(3):
+        graph = TaskGraph()
+
+        for name in ("subnet-1", "subnet-2", "subnet-3"):
+            graph.add_task(name, task)
+
+        graphs.append(graph)
+
+    async def run_graphs():
+        semaphore = asyncio.Semaphore(2)
+
+        await asyncio.gather(
+            *(graph.run_async(semaphore=semaphore) for graph in graphs)
+        )
+
+    asyncio.run(run_graphs())
+
+    assert len(max_running) == 9
+    assert max(max_running) == 2
+
+
+def test_run_async_stops_on_failure(graph):
+    def fail_task(results):
+        raise AwsException("Error creating the vpc!")
+
+    graph.add_task("vpc", fail_task)
+    graph.add_task("subnet", lambda results: "subnet-1", ["vpc"])
+
+    try:
+        asyncio.run(graph.run_async(2))
+
+        fail("ERROR: an exception should have been raised!")
+    except AwsException as e:
+        assert str(e) == "Error running tasks: vpc!"
@@ -0,0 +1,108 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+
+logs module tests.
+"""
+import json
+
+import pytest
+
+from com.maxmin.aws.graph import TaskGraph
+from com.maxmin.aws.logs import Logger
+
+
+class Message(object):
+    """
+    Counts how many times it is formatted.
+    """
+
+    def __init__(self):
+        self.formatted = 0
+
+    def __str__(self):
+        self.formatted += 1
+        return "message"
+
+
+@pytest.fixture
+def json_logger():
+    Logger.configure("INFO", "json")
+    yield Logger
+    Logger.flush()
+
+
+def records(capsys) -> list:
+    Logger.flush()
+
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+
+def test_json_record(json_logger, capsys):
+    json_logger.info("Vpc %s created!", "myvpc", resource="vpc", id="vpc-1")
+
+    entries = records(capsys)
+
+    assert len(entries) == 1
+    assert entries[0].get("level") == "INFO"
+    assert entries[0].get("message") == "Vpc myvpc created!"
+    assert entries[0].get("resource") == "vpc"
+    assert entries[0].get("id") == "vpc-1"
+    assert "time" in entries[0]
+
+
+def test_level_filter(json_logger, capsys):
+    message = Message()
+
+    json_logger.debug("%s", message)
+    json_logger.warn("%s", message)
+
+    entries = records(capsys)
+
+    # the debug message is not formatted.
+    assert message.formatted == 1
+    assert [entry.get("level") for entry in entries] == ["WARNING"]
+
+
+def test_context(json_logger, capsys):
+    with json_logger.context(datacenter="mydatacenter"):
+        with json_logger.context(task="vpc"):
+            json_logger.info("inner")
+
+        json_logger.info("outer", task="subnet")
+
+    json_logger.info("none")
+
+    entries = records(capsys)
+
+    assert entries[0].get("datacenter") == "mydatacenter"
+    assert entries[0].get("task") == "vpc"
+    assert entries[1].get("task") == "subnet"
+    assert "datacenter" not in entries[2]
+
+
+def test_task_context(json_logger, capsys):
+    graph = TaskGraph()
+    graph.add_task("vpc", lambda results: Logger.info("in task"))
+
+    with json_logger.context(datacenter="mydatacenter"):
+        graph.run(2)
+
+    entries = records(capsys)
+
+    assert entries[0].get("task") == "vpc"
+    assert entries[0].get("datacenter") == "mydatacenter"
+
+
+def test_text_record(capsys):
+    Logger.configure("DEBUG", "text")
+
+    try:
+        Logger.debug("Vpc created!", id="vpc-1")
+    finally:
+        Logger.flush()
+
+    output = capsys.readouterr().out
+
+    assert output.rstrip().endswith("DEBUG Vpc created! id=vpc-1")
@@ -0,0 +1,133 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+
+metrics module tests.
+"""
+from moto import mock_ec2
+import pytest
+
+from com.maxmin.aws.client import ClientRegistry
+from com.maxmin.aws.ec2.dao.vpc import Vpc
+from com.maxmin.aws.graph import TaskGraph
+from com.maxmin.aws.logs import Logger
+from com.maxmin.aws.metrics import ApiMetrics, log_report, log_run_report
+
+
+@pytest.fixture(autouse=True)
+def metrics():
+    ClientRegistry.clear()
+    ApiMetrics.clear()
+    yield ApiMetrics
+    ApiMetrics.clear()
+
+
+@mock_ec2
+def test_api_calls_by_operation(metrics):
+    ec2 = ClientRegistry.get_client("ec2")
+    ec2.describe_vpcs()
+    ec2.describe_vpcs()
+
+    try:
+        ec2.describe_vpcs(VpcIds=["vpc-00000000"])
+        pytest.fail("Expected an exception!")
+    except Exception:
+        pass
+
+    operation = metrics.report().get("operations").get("ec2.DescribeVpcs")
+
+    assert operation.get("calls") == 3
+    assert operation.get("errors") == 1
+    assert operation.get("retries") == 0
+    assert operation.get("sent") > 0
+    assert operation.get("received") > 0
+    assert operation.get("max_seconds") <= operation.get("seconds")
+
+
+@mock_ec2
+def test_task_time(metrics):
+    def create_vpc(results):
+        vpc = Vpc("myvpc")
+        vpc.create("10.0.10.0/16")
+        return vpc.id
+
+    graph = TaskGraph()
+    graph.add_task("vpc", create_vpc)
+    graph.add_task("subnets", lambda results: None, ["vpc"])
+    graph.run(2)
+
+    report = metrics.report()
+    tasks = {timing.get("name"): timing for timing in report.get("tasks")}
+
+    assert sorted(tasks.keys()) == ["subnets", "vpc"]
+    # the vpc is created and then waited until available.
+    assert tasks.get("vpc").get("api") > 0
+    assert tasks.get("vpc").get("waiter") > 0
+    assert tasks.get("subnets").get("api") == 0
+    assert report.get("waiter_seconds") == tasks.get("vpc").get("waiter")
+    assert "ec2.CreateVpc" in report.get("operations")
+
+
+@mock_ec2
+def test_waiter_calls_are_waiter_time(metrics):
+    ec2 = ClientRegistry.get_client("ec2")
+
+    with metrics.waiting():
+        ec2.describe_vpcs()
+
+    report = metrics.report()
+
+    assert report.get("api_seconds") == 0
+    assert report.get("waiter_seconds") > 0
+    assert report.get("operations").get("ec2.DescribeVpcs").get("calls") == 1
+
+
+@mock_ec2
+def test_log_report(metrics):
+    ClientRegistry.get_client("ec2").describe_vpcs()
+
+    log_report()
+
+
+@mock_ec2
+def test_log_report_all_operations(metrics, capsys):
+    ec2 = ClientRegistry.get_client("ec2")
+    ec2.describe_vpcs()
+    ec2.describe_subnets()
+    ec2.describe_security_groups()
+    ec2.describe_internet_gateways()
+    ec2.describe_route_tables()
+    ec2.describe_key_pairs()
+    ec2.describe_instances()
+    Logger.configure("INFO", "text")
+
+    log_report()
+    Logger.flush()
+
+    lines = capsys.readouterr().out.splitlines()
+
+    # all the operations are reported, not only the slowest ones.
+    assert len([line for line in lines if " Operation ec2." in line]) == 7
+
+    log_report(top=2)
+    Logger.flush()
+
+    lines = capsys.readouterr().out.splitlines()
+
+    assert len([line for line in lines if " Operation ec2." in line]) == 2
+
+
+@mock_ec2
+def test_log_run_report(metrics, capsys):
+    ClientRegistry.get_client("ec2").describe_vpcs()
+    Logger.configure("INFO", "text")
+
+    log_run_report()
+    Logger.flush()
+
+    output = capsys.readouterr().out
+
+    assert "AWS clients created: " in output
+    assert "API ec2/eu-west-1: " in output
+    assert "API calls: 1, " in output
@@ -0,0 +1,162 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+
+plan module tests.
+"""
+import json
+import os
+
+from moto import mock_ec2, mock_route53
+import pytest
+
+from com.maxmin.aws.configuration import ApplicationConfig
+from com.maxmin.aws.constants import ProjectDirectories, ProjectFiles
+from com.maxmin.aws.plan import Planner, main
+from com.maxmin.aws.startup import build_startup_graph
+from comtest.maxmin.aws.calls import ApiCalls
+from comtest.maxmin.aws.datacenter import datacenter
+from comtest.maxmin.utils import TestUtils
+
+PRIVATE_KEY = f"{ProjectDirectories.ACCESS_DIR}/mykeypair"
+
+
+@pytest.fixture
+def application_config(tmp_path):
+    config_file = tmp_path / "datacenter.json"
+    config_file.write_text(json.dumps(datacenter(2)))
+
+    return ApplicationConfig(config_file)
+
+
+@pytest.fixture
+def test_utils():
+    return TestUtils()
+
+
+@pytest.fixture(autouse=True)
+def password_cache(tmp_path, monkeypatch):
+    """
+    keeps the hashed passwords out of the access directory.
+    """
+    monkeypatch.setattr(
+        ProjectFiles, "PASSWORD_CACHE_FILE", str(tmp_path / "passwords.json")
+    )
+
+
+@pytest.fixture
+def api_calls():
+    """
+    returns the counter of the API calls made by the DAO objects.
+    """
+    return ApiCalls()
+
+
+def clear():
+    if os.path.isfile(PRIVATE_KEY) is True:
+        os.remove(PRIVATE_KEY)
+
+
+def summary(plan) -> list:
+    return [
+        (action.get("action"), action.get("resource"), action.get("name"))
+        for action in plan.actions
+    ]
+
+
+@mock_ec2
+@mock_route53
+def test_plan_empty_datacenter(application_config, api_calls, test_utils):
+    test_utils.create_hosted_zone("maxmin.it")
+
+    planner = Planner(application_config)
+    api_calls.reset()
+    plan = planner.plan()
+
+    assert summary(plan) == [
+        ("create", "vpc", "mydatacenter"),
+        ("create", "internet_gateway", "mygateway"),
+        ("update", "internet_gateway", "mygateway"),
+        ("create", "route_table", "myroutetable"),
+        ("update", "route_table", "myroutetable"),
+        ("create", "subnet", "mysubnet"),
+        ("update", "subnet", "mysubnet"),
+        ("create", "security_group", "mysecgroup"),
+        ("update", "security_group", "mysecgroup"),
+        ("create", "keypair", "mykeypair"),
+        ("create", "instance", "box0"),
+        ("create", "instance", "box1"),
+        ("create", "record", "box0.maxmin.it"),
+        ("create", "record", "box1.maxmin.it"),
+    ]
+    assert plan.errors == 0
+    # one describe call for each EC2 resource type.
+    assert (
+        sum(
+            count
+            for operation, count in api_calls.operations().items()
+            if operation.startswith("ec2.")
+        )
+        == 8
+    )
+
+    json.dumps(plan.to_dict())
+
+
+@mock_ec2
+@mock_route53
+def test_plan_created_datacenter(application_config, test_utils):
+    try:
+        test_utils.create_hosted_zone("maxmin.it")
+
+        build_startup_graph(application_config).run(4)
+
+        plan = Planner(application_config).plan()
+
+        assert plan.actions == []
+
+        security_group_id = test_utils.describe_security_groups("mysecgroup")[
+            0
+        ].get("GroupId")
+        test_utils.allow_access_from_cidr(
+            security_group_id, 80, 80, "tcp", "0.0.0.0/0", "http"
+        )
+
+        plan = Planner(application_config).plan()
+
+        assert summary(plan) == [("update", "security_group", "mysecgroup")]
+        assert plan.actions[0].get("details").get("revoke") == [
+            {
+                "IpProtocol": "tcp",
+                "FromPort": 80,
+                "ToPort": 80,
+                "IpRanges": [{"CidrIp": "0.0.0.0/0", "Description": "http"}],
+            }
+        ]
+    finally:
+        clear()
+
+
+@mock_ec2
+@mock_route53
+def test_plan_without_hosted_zone(application_config):
+    plan = Planner(application_config).plan()
+
+    assert plan.errors == 2
+
+
+@mock_ec2
+@mock_route53
+def test_plan_main_writes_json_to_stdout(tmp_path, capsys, test_utils):
+    test_utils.create_hosted_zone("maxmin.it")
+    config_file = tmp_path / "datacenter.json"
+    config_file.write_text(json.dumps(datacenter(2)))
+
+    assert main([str(config_file), "--exit-code"]) == 2
+
+    output = capsys.readouterr()
+
+    # only the plan is written to stdout, the log to stderr.
+    assert json.loads(output.out).get("changes") > 0
+    assert "Plan: " in output.err
@@ -0,0 +1,168 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+
+schema module tests.
+"""
+import json
+
+from pytest import fail
+import pytest
+
+from com.maxmin.aws.configuration import ApplicationConfig
+from com.maxmin.aws.exception import AwsException
+from com.maxmin.aws.schema import (
+    ConfigValidator,
+    Field,
+    ListOf,
+    Object,
+    compile_schema,
+)
+from comtest.maxmin.aws.datacenter import datacenter
+
+
+@pytest.fixture
+def config():
+    """
+    returns a valid datacenter configuration with two instances.
+    """
+    return datacenter(2)
+
+
+def test_compile_schema():
+    check = compile_schema(
+        Object(
+            {
+                "Name": Field(str),
+                "Port": Field(int, required=False),
+                "Items": ListOf(Object({"Value": Field(str)})),
+            }
+        )
+    )
+    errors = []
+
+    check({"Port": True, "Items": [{"Value": "a"}, {}]}, "$", errors)
+
+    assert errors == [
+        "$.Name: missing",
+        "$.Port: int expected",
+        "$.Items[1].Value: missing",
+    ]
+
+
+def test_validate(config):
+    assert ConfigValidator.validate(config) == []
+
+
+def test_validate_types(config):
+    config["Datacenter"]["Cidr"] = "10.0.0.1/16"
+    config["Datacenter"]["Subnets"][0]["Cidr"] = 10
+    config["Datacenter"]["SecurityGroups"][0]["Rules"][0]["FromPort"] = "22"
+    del config["Datacenter"]["Instances"][1]["Keypair"]
+
+    assert ConfigValidator.validate(config) == [
+        "$.Datacenter.Cidr: 10.0.0.1/16 has host bits set",
+        "$.Datacenter.Subnets[0].Cidr: str expected",
+        "$.Datacenter.SecurityGroups[0].Rules[0].FromPort: int expected",
+        "$.Datacenter.Instances[1].Keypair: missing",
+    ]
+
+
+def test_validate_references(config):
+    config["Datacenter"]["Instances"][0]["Subnet"] = "othersubnet"
+    config["Datacenter"]["Instances"][1]["SecurityGroup"] = "othersecgroup"
+
+    assert ConfigValidator.validate(config) == [
+        "$.Datacenter.Instances[0].Subnet: subnet othersubnet not found",
+        "$.Datacenter.Instances[1].SecurityGroup: security group "
+        "othersecgroup not found",
+    ]
+
+
+def test_validate_addresses(config):
+    config["Datacenter"]["Subnets"].append(
+        {"Name": "othersubnet", "Az": "eu-west-1a", "Cidr": "10.1.20.0/24"}
+    )
+    config["Datacenter"]["Instances"][0]["PrivateIp"] = "10.0.20.3"
+    config["Datacenter"]["Instances"][1]["PrivateIp"] = "10.0.21.10"
+
+    assert ConfigValidator.validate(config) == [
+        "$.Datacenter.Subnets[1].Cidr: 10.1.20.0/24 not in the vpc "
+        "10.0.0.0/16",
+        "$.Datacenter.Instances[0].PrivateIp: 10.0.20.3 not assignable in "
+        "the subnet 10.0.20.0/24",
+        "$.Datacenter.Instances[1].PrivateIp: 10.0.21.10 not assignable in "
+        "the subnet 10.0.20.0/24",
+    ]
+
+
+def test_validate_duplicates(config):
+    config["Datacenter"]["Subnets"].append(
+        {"Name": "othersubnet", "Az": "eu-west-1a", "Cidr": "10.0.20.128/25"}
+    )
+    config["Datacenter"]["Instances"][1]["PrivateIp"] = "10.0.20.10"
+    config["Datacenter"]["Instances"][1]["Tags"] = [
+        {"Key": "Name", "Value": "box0"}
+    ]
+
+    assert ConfigValidator.validate(config) == [
+        "$.Datacenter.Subnets[1].Cidr: 10.0.20.128/25 overlaps the subnet "
+        "mysubnet",
+        "$.Datacenter.Instances[1].Tags: duplicate instance box0",
+        "$.Datacenter.Instances[1].PrivateIp: duplicate IP 10.0.20.10",
+    ]
+
+
+def test_validate_rules(config):
+    config["Datacenter"]["SecurityGroups"][0]["Rules"] = [
+        {"FromPort": 22, "ToPort": 22, "Protocol": "tcp"},
+        {"FromPort": 90, "ToPort": 80, "Protocol": "tcp", "Cidr": "0.0.0.0/0"},
+        {"FromPort": 8, "ToPort": 0, "Protocol": "icmp", "Cidr": "0.0.0.0/0"},
+        {"FromPort": 80, "ToPort": 80, "Protocol": "tcp", "SgpId": "sg-1"},
+    ]
+
+    assert ConfigValidator.validate(config) == [
+        "$.Datacenter.SecurityGroups[0].Rules[0]: one of Cidr, SgpId "
+        "expected",
+        "$.Datacenter.SecurityGroups[0].Rules[1]: FromPort greater than "
+        "ToPort",
+    ]
+
+
+def test_load_invalid_config(config, tmp_path):
+    del config["Datacenter"]["Region"]
+    config_file = tmp_path / "datacenter.json"
+    config_file.write_text(json.dumps(config))
+
+    try:
+        ApplicationConfig(config_file)
+
+        fail("An exception should have been thrown!")
+
+    except AwsException as e:
+        assert str(e) == (
+            "Invalid configuration file: $.Datacenter.Region: missing"
+        )
+
+
+def test_load_config_many_errors(config, tmp_path):
+    for instance in config["Datacenter"]["Instances"]:
+        del instance["Hostname"]
+        del instance["DnsName"]
+        del instance["Subnet"]
+        del instance["Keypair"]
+        del instance["ParentImage"]
+        del instance["UserName"]
+
+    config_file = tmp_path / "datacenter.json"
+    config_file.write_text(json.dumps(config))
+
+    try:
+        ApplicationConfig(config_file)
+
+        fail("An exception should have been thrown!")
+
+    except AwsException as e:
+        assert str(e).count("missing") == 10
+        assert str(e).endswith(" and 2 more")
@@ -0,0 +1,132 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+
+shutdown module tests.
+"""
+import json
+import os
+
+from moto import mock_ec2, mock_route53
+import pytest
+
+from com.maxmin.aws.configuration import ApplicationConfig
+from com.maxmin.aws.constants import ProjectDirectories, ProjectFiles
+from com.maxmin.aws.ec2.dao.inventory import Inventory
+from com.maxmin.aws.shutdown import build_shutdown_graph
+from com.maxmin.aws.startup import build_startup_graph, load_inventory
+from comtest.maxmin.aws.datacenter import datacenter
+from comtest.maxmin.utils import TestUtils
+
+PRIVATE_KEY = f"{ProjectDirectories.ACCESS_DIR}/mykeypair"
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    config_file = tmp_path / "datacenter.json"
+    config_file.write_text(json.dumps(datacenter(3)))
+
+    return config_file
+
+
+@pytest.fixture
+def test_utils():
+    return TestUtils()
+
+
+@pytest.fixture(autouse=True)
+def password_cache(tmp_path, monkeypatch):
+    """
+    keeps the hashed passwords out of the access directory.
+    """
+    monkeypatch.setattr(
+        ProjectFiles, "PASSWORD_CACHE_FILE", str(tmp_path / "passwords.json")
+    )
+
+
+def clear():
+    if os.path.isfile(PRIVATE_KEY) is True:
+        os.remove(PRIVATE_KEY)
+
+
+@mock_ec2
+@mock_route53
+def test_build_shutdown_graph(config_file):
+    graph = build_shutdown_graph(ApplicationConfig(config_file))
+
+    graph.validate()
+
+    assert graph.tasks.get("instances").dependencies == [
+        "instance:box0",
+        "instance:box1",
+        "instance:box2",
+    ]
+    assert graph.tasks.get("records").dependencies == ["hosted_zone"]
+    assert graph.tasks.get("keypair:mykeypair").dependencies == ["instances"]
+    # the subnets are disassociated before they are deleted.
+    assert graph.tasks.get("subnet:mysubnet").dependencies == [
+        "route_table_associations"
+    ]
+    assert graph.tasks.get("route_table").dependencies == [
+        "route_table_associations",
+        "subnet:mysubnet",
+    ]
+    assert graph.order()[-1] == "delete_vpc"
+
+
+@mock_ec2
+@mock_route53
+def test_run_shutdown_graph(config_file, test_utils):
+    try:
+        hosted_zone_id = test_utils.create_hosted_zone("maxmin.it")
+        application_config = ApplicationConfig(config_file)
+
+        build_startup_graph(application_config).run(4)
+        build_shutdown_graph(application_config).run(4)
+
+        assert len(test_utils.describe_vpcs("mydatacenter")) == 0
+        assert len(test_utils.describe_subnets("mysubnet")) == 0
+        assert len(test_utils.describe_security_groups("mysecgroup")) == 0
+        assert len(test_utils.decribe_keypairs("mykeypair")) == 0
+
+        for i in range(3):
+            response = test_utils.describe_instances(f"box{i}")
+
+            assert response[0].get("State").get("Name") == "terminated"
+            assert (
+                len(
+                    test_utils.describe_records(
+                        f"box{i}.maxmin.it", hosted_zone_id
+                    )
+                )
+                == 0
+            )
+
+        # a second run finds everything already deleted.
+        build_shutdown_graph(application_config).run(4)
+    finally:
+        clear()
+
+
+@mock_ec2
+@mock_route53
+def test_run_shutdown_graph_with_inventory(config_file, test_utils):
+    try:
+        test_utils.create_hosted_zone("maxmin.it")
+        application_config = ApplicationConfig(config_file)
+
+        build_startup_graph(application_config).run(4)
+
+        assert len(test_utils.describe_route_tables("myroutetable")) == 1
+
+        # the resources are loaded from a snapshot taken before the run.
+        load_inventory(application_config)
+        build_shutdown_graph(application_config).run(4)
+
+        assert len(test_utils.describe_route_tables("myroutetable")) == 0
+        assert len(test_utils.describe_subnets("mysubnet")) == 0
+        assert len(test_utils.describe_vpcs("mydatacenter")) == 0
+    finally:
+        Inventory.deactivate()
+        clear()
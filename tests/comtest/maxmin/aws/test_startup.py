@@ -0,0 +1,103 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+
+startup module tests.
+"""
+import json
+import os
+
+from moto import mock_ec2, mock_route53
+import pytest
+
+from com.maxmin.aws.configuration import ApplicationConfig
+from com.maxmin.aws.constants import ProjectDirectories, ProjectFiles
+from com.maxmin.aws.startup import build_startup_graph
+from comtest.maxmin.aws.datacenter import datacenter
+from comtest.maxmin.utils import TestUtils
+
+PRIVATE_KEY = f"{ProjectDirectories.ACCESS_DIR}/mykeypair"
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    config_file = tmp_path / "datacenter.json"
+    config_file.write_text(json.dumps(datacenter(3)))
+
+    return config_file
+
+
+@pytest.fixture
+def test_utils():
+    return TestUtils()
+
+
+@pytest.fixture(autouse=True)
+def password_cache(tmp_path, monkeypatch):
+    """
+    keeps the hashed passwords out of the access directory.
+    """
+    monkeypatch.setattr(
+        ProjectFiles, "PASSWORD_CACHE_FILE", str(tmp_path / "passwords.json")
+    )
+
+
+def clear():
+    if os.path.isfile(PRIVATE_KEY) is True:
+        os.remove(PRIVATE_KEY)
+
+
+@mock_ec2
+@mock_route53
+def test_build_startup_graph(config_file):
+    graph = build_startup_graph(ApplicationConfig(config_file))
+
+    graph.validate()
+
+    assert graph.tasks.get("subnet:mysubnet").dependencies == [
+        "vpc",
+        "route_table",
+    ]
+    assert graph.tasks.get("instances").dependencies == [
+        "route_table",
+        "keypair:mykeypair",
+        "subnet:mysubnet",
+        "security_group:mysecgroup",
+    ]
+    assert graph.tasks.get("records").dependencies == [
+        "hosted_zone",
+        "instances",
+    ]
+    assert len(graph.tasks) == 9
+
+
+@mock_ec2
+@mock_route53
+def test_run_startup_graph(config_file, test_utils):
+    try:
+        hosted_zone_id = test_utils.create_hosted_zone("maxmin.it")
+
+        build_startup_graph(ApplicationConfig(config_file)).run(4)
+
+        assert len(test_utils.describe_vpcs("mydatacenter")) == 1
+        assert len(test_utils.describe_subnets("mysubnet")) == 1
+
+        for i in range(3):
+            assert len(test_utils.describe_instances(f"box{i}")) == 1
+            assert (
+                len(
+                    test_utils.describe_records(
+                        f"box{i}.maxmin.it", hosted_zone_id
+                    )
+                )
+                > 0
+            )
+
+        # a second run finds everything already created.
+        build_startup_graph(ApplicationConfig(config_file)).run(4)
+
+        assert len(test_utils.describe_vpcs("mydatacenter")) == 1
+        assert len(test_utils.describe_instances("box0")) == 1
+    finally:
+        clear()
@@ -0,0 +1,139 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+
+state module tests.
+"""
+import json
+import os
+
+from moto import mock_ec2, mock_route53
+import pytest
+
+from com.maxmin.aws.configuration import ApplicationConfig
+from com.maxmin.aws.constants import ProjectDirectories, ProjectFiles
+from com.maxmin.aws.ec2.dao.inventory import Inventory
+from com.maxmin.aws.startup import build_startup_graph, load_inventory_by_state
+from com.maxmin.aws.state import StateStore
+from comtest.maxmin.aws.datacenter import datacenter
+from comtest.maxmin.utils import TestUtils
+
+PRIVATE_KEY = f"{ProjectDirectories.ACCESS_DIR}/mykeypair"
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    config_file = tmp_path / "datacenter.json"
+    config_file.write_text(json.dumps(datacenter(2)))
+
+    return config_file
+
+
+@pytest.fixture
+def state(tmp_path):
+    yield StateStore(str(tmp_path / "state" / "datacenter.state.json"))
+
+    Inventory.deactivate()
+
+
+@pytest.fixture
+def test_utils():
+    return TestUtils()
+
+
+@pytest.fixture(autouse=True)
+def password_cache(tmp_path, monkeypatch):
+    """
+    keeps the hashed passwords out of the access directory.
+    """
+    monkeypatch.setattr(
+        ProjectFiles, "PASSWORD_CACHE_FILE", str(tmp_path / "passwords.json")
+    )
+
+
+def clear():
+    if os.path.isfile(PRIVATE_KEY) is True:
+        os.remove(PRIVATE_KEY)
+
+
+def test_state_path():
+    assert StateStore.path_of("/tmp/cms_datacenter.json") == (
+        f"{ProjectDirectories.STATE_DIR}/cms_datacenter.state.json"
+    )
+
+
+def test_save_and_load_state(state):
+    assert state.load() is False
+
+    state.fingerprint = "abc"
+    state.resources = {Inventory.VPCS: {"mydatacenter": "vpc-1"}}
+    state.records = {"box0": "1.2.3.4"}
+    state.save()
+
+    loaded_state = StateStore(state.state_file)
+
+    assert loaded_state.load() is True
+    assert loaded_state.fingerprint == "abc"
+    assert loaded_state.resources == state.resources
+    assert loaded_state.records == state.records
+
+
+def test_fingerprint(config_file):
+    fingerprint = StateStore.fingerprint_of(config_file, "eu-west-1")
+
+    assert fingerprint == StateStore.fingerprint_of(config_file, "eu-west-1")
+    assert fingerprint != StateStore.fingerprint_of(config_file, "us-east-1")
+
+    config_file.write_text(json.dumps(datacenter(3)))
+
+    assert fingerprint != StateStore.fingerprint_of(config_file, "eu-west-1")
+
+
+@mock_ec2
+@mock_route53
+def test_skip_unchanged_datacenter(config_file, state, test_utils):
+    try:
+        test_utils.create_hosted_zone("maxmin.it")
+        application_config = ApplicationConfig(config_file)
+        fingerprint = StateStore.fingerprint_of(config_file, "eu-west-1")
+
+        assert (
+            load_inventory_by_state(application_config, state, fingerprint)
+            is False
+        )
+
+        results = build_startup_graph(application_config).run(4)
+        state.update(fingerprint, results)
+        state.save()
+
+        assert set(state.resources.get(Inventory.INSTANCES).keys()) == {
+            "box0",
+            "box1",
+        }
+        assert state.resources.get(Inventory.VPCS).get("mydatacenter") == (
+            test_utils.describe_vpcs("mydatacenter")[0].get("VpcId")
+        )
+
+        assert (
+            load_inventory_by_state(application_config, state, fingerprint)
+            is True
+        )
+
+        # a changed configuration is not skipped.
+        assert (
+            load_inventory_by_state(application_config, state, "changed")
+            is False
+        )
+
+        # neither is a terminated instance.
+        test_utils.terminate_instance(
+            state.resources.get(Inventory.INSTANCES).get("box0")
+        )
+
+        assert (
+            load_inventory_by_state(application_config, state, fingerprint)
+            is False
+        )
+    finally:
+        clear()
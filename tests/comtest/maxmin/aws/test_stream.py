@@ -0,0 +1,104 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+
+stream module tests.
+"""
+import io
+import json
+
+from pytest import fail
+import pytest
+
+from com.maxmin.aws.stream import JsonStream
+from comtest.maxmin.aws.datacenter import datacenter
+
+
+def read(stream: JsonStream):
+    """
+    Reads the next value walking the objects and the arrays.
+    """
+    char = stream.peek()
+
+    if char == "{":
+        return {key: read(stream) for key in stream.members()}
+
+    if char == "[":
+        return [read(stream) for _ in _items(stream)]
+
+    return stream.value()
+
+
+def _items(stream: JsonStream):
+    # the items are read by the caller, one at a time.
+    stream._expect("[")
+
+    if stream.peek() == "]":
+        stream.position += 1
+        return
+
+    while True:
+        yield
+
+        if stream._delimiter("]") is True:
+            return
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 65536])
+def test_read_document(chunk_size):
+    document = datacenter(3)
+    document["Numbers"] = [0, -1, 12345678901234567890, 1.5e-3, True, None]
+    document["Empty"] = [{}, [], ""]
+    text = json.dumps(document, indent=2)
+
+    stream = JsonStream(io.StringIO(text), chunk_size)
+
+    assert read(stream) == document
+
+    stream.end()
+
+
+def test_stream_items():
+    stream = JsonStream(io.StringIO('{"Items": [1, {"a": 2}, [3]]}'), 4)
+    items = []
+
+    for key in stream.members():
+        assert key == "Items"
+
+        for item in stream.items():
+            items.append(item)
+            # nothing after the item is read.
+            assert len(stream.buffer) - stream.position < 8
+
+    assert items == [1, {"a": 2}, [3]]
+
+
+@pytest.mark.parametrize(
+    "text",
+    ['{"a": 1,}', '{"a" 1}', '{"a": [1 2]}', '{"a": tru}', "{1: 2}", '{"a"'],
+)
+def test_invalid_document(text):
+    stream = JsonStream(io.StringIO(text), 2)
+
+    try:
+        read(stream)
+        stream.end()
+
+        fail("An exception should have been thrown!")
+
+    except json.JSONDecodeError:
+        pass
+
+
+def test_extra_data():
+    stream = JsonStream(io.StringIO("{} {}"))
+    stream.value()
+
+    try:
+        stream.end()
+
+        fail("An exception should have been thrown!")
+
+    except json.JSONDecodeError as e:
+        assert e.msg == "Extra data"
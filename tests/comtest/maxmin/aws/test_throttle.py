@@ -0,0 +1,131 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+
+throttle module tests.
+"""
+from botocore.awsrequest import AWSResponse
+from moto import mock_ec2
+import pytest
+
+from com.maxmin.aws.client import ClientRegistry
+from com.maxmin.aws.ec2.dao.vpc import Vpc
+from com.maxmin.aws.throttle import RateLimiter, TokenBucket
+
+THROTTLED_RESPONSE = (
+    b"<Response><Errors><Error><Code>RequestLimitExceeded</Code>"
+    b"<Message>Request limit exceeded.</Message></Error></Errors>"
+    b"<RequestID>1</RequestID></Response>"
+)
+
+
+class RawResponse(object):
+    def __init__(self, content: bytes):
+        self.content = content
+
+    def stream(self, **kwargs):
+        yield self.content
+
+
+class FakeTime(object):
+    """
+    Clock that moves forward only when sleeping.
+    """
+
+    def __init__(self):
+        self.now = 0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+@pytest.fixture
+def fake_time(monkeypatch):
+    fake_time = FakeTime()
+    monkeypatch.setattr("com.maxmin.aws.throttle.time", fake_time)
+
+    return fake_time
+
+
+@pytest.fixture(autouse=True)
+def registry():
+    ClientRegistry.clear()
+    yield ClientRegistry
+    ClientRegistry.clear()
+
+
+def test_token_bucket(fake_time):
+    bucket = TokenBucket(2)
+
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == pytest.approx(0.5)
+    assert fake_time.sleeps == [pytest.approx(0.5)]
+
+    fake_time.now += 10
+
+    # the bucket doesn't fill beyond its capacity.
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == pytest.approx(0.5)
+
+
+def test_token_bucket_burst(fake_time):
+    bucket = TokenBucket(1, capacity=3)
+
+    waited = [bucket.acquire() for i in range(4)]
+
+    assert waited == [0, 0, 0, pytest.approx(1)]
+
+
+@mock_ec2
+def test_rate_limiter_counts_requests(registry):
+    ec2 = registry.get_client("ec2")
+    ec2.describe_vpcs()
+    ec2.describe_subnets()
+
+    stats = RateLimiter.stats().get("ec2/eu-west-1")
+
+    assert stats.get("requests") == 2
+    assert stats.get("throttles") == 0
+    assert stats.get("retries") == 0
+
+
+@mock_ec2
+def test_rate_limiter_counts_throttles(registry):
+    ec2 = registry.get_client("ec2")
+    throttled = []
+
+    def throttle(request, **kwargs):
+        # the first attempt is throttled, the retry goes to moto.
+        if len(throttled) == 0:
+            throttled.append(request)
+            return AWSResponse(
+                request.url, 503, {}, RawResponse(THROTTLED_RESPONSE)
+            )
+
+    ec2.meta.events.register_first("before-send.ec2.DescribeVpcs", throttle)
+
+    assert Vpc("myvpc").load() is False
+
+    stats = RateLimiter.stats().get("ec2/eu-west-1")
+
+    assert stats.get("requests") == 2
+    assert stats.get("throttles") == 1
+    assert stats.get("retries") == 1
+
+
+def test_rate_limiter_shared_by_region(registry):
+    ec2 = registry.get_client("ec2")
+    registry.get_client("ec2", profile=None, region="us-east-1")
+
+    assert ec2.meta.region_name == "eu-west-1"
+    assert RateLimiter._buckets.get("ec2/eu-west-1").rate == 20
+    assert RateLimiter._buckets.get("ec2/us-east-1").rate == 20
+    assert RateLimiter._buckets.get("route53/aws-global") is None
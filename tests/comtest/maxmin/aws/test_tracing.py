@@ -0,0 +1,90 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+
+tracing module tests.
+"""
+import json
+
+from moto import mock_ec2
+import pytest
+
+from com.maxmin.aws.ec2.dao.vpc import Vpc
+from com.maxmin.aws.exception import AwsException
+from com.maxmin.aws.graph import TaskGraph
+from com.maxmin.aws.tracing import Tracer
+
+
+@pytest.fixture
+def tracer():
+    Tracer.start()
+    yield Tracer
+    Tracer.stop()
+
+
+def test_not_started():
+    with Tracer.span("vpc"):
+        pass
+
+    assert all(span.get("name") != "vpc" for span in Tracer.spans())
+
+
+def test_span_error(tracer):
+    try:
+        with tracer.span("vpc", "task"):
+            raise AwsException("Error creating the vpc!")
+    except AwsException:
+        pass
+
+    spans = tracer.spans()
+
+    assert len(spans) == 1
+    assert spans[0].get("attributes").get("error") == (
+        "Error creating the vpc!"
+    )
+
+
+@mock_ec2
+def test_task_spans(tracer):
+    def create_vpc(results):
+        vpc = Vpc("myvpc")
+        vpc.create("10.0.10.0/16")
+        return vpc.id
+
+    graph = TaskGraph()
+    graph.add_task("vpc", create_vpc)
+    results = graph.run(2)
+
+    spans = {span.get("name"): span for span in tracer.spans()}
+
+    assert spans.get("vpc").get("category") == "task"
+    assert spans.get("vpc").get("parent") is None
+    assert spans.get("Vpc.create").get("parent") == spans.get("vpc").get("id")
+    assert spans.get("Vpc.create").get("attributes") == {
+        "name": "myvpc",
+        "id": results.get("vpc"),
+    }
+    assert spans.get("wait vpc_available").get("parent") == spans.get(
+        "Vpc.create"
+    ).get("id")
+    assert spans.get("wait vpc_available").get("category") == "waiter"
+
+
+@mock_ec2
+def test_export(tracer, tmp_path):
+    Vpc("myvpc").load()
+
+    trace_file = tmp_path / "trace.json"
+    tracer.export(trace_file)
+
+    with open(trace_file) as file:
+        events = json.load(file).get("traceEvents")
+
+    complete_events = [event for event in events if event.get("ph") == "X"]
+
+    assert len(complete_events) == 1
+    assert complete_events[0].get("name") == "Vpc.load"
+    assert complete_events[0].get("dur") >= 0
+    assert complete_events[0].get("args").get("name") == "myvpc"
+    assert any(event.get("ph") == "M" for event in events)
@@ -0,0 +1,146 @@
+"""
+Created on Oct 18, 2026
+
+@author: vagrant
+
+waiter module tests.
+"""
+from moto import mock_ec2
+import pytest
+
+from com.maxmin.aws.client import ClientRegistry
+from com.maxmin.aws.exception import AwsException
+from com.maxmin.aws.waiter import AdaptiveWaiter, WaiterConfig, WaiterStats
+from comtest.maxmin.aws.constants import AMI_ID
+from comtest.maxmin.utils import TestUtils
+
+
+@pytest.fixture
+def test_utils():
+    return TestUtils()
+
+
+@pytest.fixture(autouse=True)
+def clear_stats():
+    yield
+
+    WaiterStats.clear()
+
+
+class FakeTime(object):
+    """
+    Clock that moves forward only when sleeping.
+    """
+
+    def __init__(self):
+        self.now = 0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    fake_time = FakeTime()
+    monkeypatch.setattr("com.maxmin.aws.waiter.time", fake_time)
+
+    return fake_time.sleeps
+
+
+def test_waiter_delays():
+    config = WaiterConfig(
+        initial_delay=1, max_delay=8, multiplier=2, jitter=0.5
+    )
+
+    for attempt, delay in enumerate([1, 2, 4, 8, 8]):
+        for _ in range(20):
+            assert delay / 2 <= config.delay(attempt) <= delay
+
+
+def test_waiter_config_of_ini_file():
+    config = WaiterConfig.of("ec2", "instance_status_ok")
+
+    assert config.initial_delay == 10
+    # the other settings come from the WAITER section.
+    assert config.max_delay == 15
+
+    config = WaiterConfig.of("ec2", "vpc_available")
+
+    assert config.initial_delay == 1
+
+
+@mock_ec2
+def test_wait(test_utils, sleeps):
+    vpc_id = test_utils.create_vpc("myvpc", "10.0.0.0/16")
+    ec2 = ClientRegistry.get_client("ec2")
+
+    AdaptiveWaiter(ec2, "vpc_available").wait(VpcIds=[vpc_id])
+
+    assert sleeps == []
+    assert WaiterStats.report().get("vpc_available").get("count") == 1
+
+
+@mock_ec2
+def test_wait_many(test_utils, sleeps):
+    instance_ids = [
+        test_utils.create_instance(f"box{i}", AMI_ID) for i in range(3)
+    ]
+    ec2 = ClientRegistry.get_client("ec2")
+
+    AdaptiveWaiter(ec2, "instance_running").wait(InstanceIds=instance_ids)
+
+    assert WaiterStats.histogram("instance_running").get("1") == 3
+
+
+@mock_ec2
+def test_wait_timeout(sleeps):
+    ec2 = ClientRegistry.get_client("ec2")
+    waiter = AdaptiveWaiter(
+        ec2,
+        "instance_status_ok",
+        WaiterConfig(initial_delay=1, max_delay=4, jitter=0, timeout=10),
+    )
+
+    try:
+        # not found instances are retried.
+        waiter.wait(InstanceIds=["i-1234567890abcdef0"])
+
+        pytest.fail("ERROR: an exception should have been raised!")
+    except AwsException as e:
+        assert str(e) == "Waiter instance_status_ok timed out!"
+
+    assert sleeps == [1, 2, 4]
+
+
+@mock_ec2
+def test_wait_failure(test_utils, sleeps):
+    instance_id = test_utils.create_instance("box0", AMI_ID)
+    test_utils.terminate_instance(instance_id)
+    ec2 = ClientRegistry.get_client("ec2")
+
+    try:
+        AdaptiveWaiter(ec2, "instance_running").wait(InstanceIds=[instance_id])
+
+        pytest.fail("ERROR: an exception should have been raised!")
+    except AwsException as e:
+        assert str(e) == "Waiter instance_running failed!"
+
+
+def test_waiter_stats():
+    WaiterStats.record("vpc_available", 0.5)
+    WaiterStats.record("vpc_available", 3, 2)
+    WaiterStats.record("vpc_available", 2000)
+
+    report = WaiterStats.report().get("vpc_available")
+
+    assert report.get("count") == 4
+    assert report.get("min") == 0.5
+    assert report.get("max") == 2000
+    assert report.get("histogram").get("1") == 1
+    assert report.get("histogram").get("5") == 2
+    assert report.get("histogram").get("inf") == 1
@@ -4,6 +4,7 @@ Created on Mar 23, 2023
 @author: vagrant
 """
 
+import base64
 import os
 import stat
 
@@ -358,6 +359,9 @@ class TestUtils(object):
             .get("InstanceId")
         )
 
+    def terminate_instance(self, instance_id: str):
+        self.ec2.terminate_instances(InstanceIds=[instance_id])
+
     def describe_instances(self, name: str):
         response = self.ec2.describe_instances(
             Filters=[
@@ -401,6 +405,13 @@ class TestUtils(object):
         elif len(instances) == 0:
             return None
 
+    def describe_user_data(self, instance_id: str) -> bytes:
+        response = self.ec2.describe_instance_attribute(
+            Attribute="userData", InstanceId=instance_id
+        ).get("UserData")
+
+        return base64.b64decode(response.get("Value"))
+
     def create_image(self, name: str, description: str, instance_id: str):
         return self.ec2.create_image(
             InstanceId=instance_id,
@@ -502,7 +513,11 @@ class TestUtils(object):
         )
 
     def create_record(
-        self, dns_name: str, ip_address: str, hosted_zone_id: str
+        self,
+        dns_name: str,
+        ip_address: str,
+        hosted_zone_id: str,
+        ttl: int = 300,
     ):
         self.route53.change_resource_record_sets(
             HostedZoneId=hosted_zone_id,
@@ -513,7 +528,7 @@ class TestUtils(object):
                         "ResourceRecordSet": {
                             "Name": dns_name,
                             "Type": "A",
-                            "TTL": 300,
+                            "TTL": ttl,
                             "ResourceRecords": [{"Value": ip_address}],
                         },
                     }